@@ -3,10 +3,8 @@ from typing import Optional
 
 import typer
 import typer_di
-import yaml
 
-from core.adapters import load_adapters
-from core.adapters.base import BaseTagAdapter
+from core.adapters.manifest import ADAPTER_MANIFEST
 
 from .console import BOLD, CYAN, GREEN, GREY, RESET
 from ..params import output_params
@@ -18,15 +16,22 @@ def _print_adapters(adapters_list: list[dict[str, Optional[str]]], output: str)
         return
 
     if output == "yaml":
+        import yaml
+
         typer.echo(yaml.safe_dump(adapters_list, sort_keys=False, allow_unicode=True))
         return
 
+    if output == "ndjson":
+        for adapter in adapters_list:
+            typer.echo(json.dumps(adapter, ensure_ascii=False, separators=(",", ":")))
+        return
+
     print()
     print(GREY + "─────────────────────────────────────────────" + RESET)
     print(f"{CYAN}{BOLD}Registered Adapters:{RESET}")
     print(GREY + "─────────────────────────────────────────────" + RESET)
     print()
-    if not BaseTagAdapter.registry:
+    if not adapters_list:
         print("  (none registered)")
         print()
         return
@@ -57,18 +62,16 @@ def adapters(output: str = typer_di.Depends(output_params)) -> None:
     """
     Lista todos os adapters registrados no Tago.
 
-    Garante o carregamento dos módulos e imprime a tabela no stdout.
+    Lê o manifest estático, sem importar os módulos dos adapters (nem boto3),
+    e imprime a tabela no stdout.
     """
-    # Garante que todos os módulos de adapters foram importados
-    load_adapters()
-
     adapters_list = []
-    for adapter in sorted(BaseTagAdapter.registry, key=lambda c: c.__name__.lower()):
+    for entry in sorted(ADAPTER_MANIFEST, key=lambda e: e.name.lower()):
         adapters_list.append(
             {
-                "name": adapter.__name__,
-                "service": getattr(adapter, "service", None),
-                "resource_type": getattr(adapter, "resource_type", None),
+                "name": entry.name,
+                "service": entry.service or None,
+                "resource_type": entry.resource_type,
             }
         )
 
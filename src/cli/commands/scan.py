@@ -1,19 +1,102 @@
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import typer
 
-from core.engine.identity_engine import requires_aws_identity
-from core.engine.scan_engine import scan_resources
+from core.engine.identity_engine import get_validated_session, requires_aws_identity
 
 from .console import BOLD, CYAN, GREEN, GREY, RESET
+from ..params import parse_duration
+
+if TYPE_CHECKING:
+    from core.inventory import Inventory
+    from core.models import ScanReport
+    from core.report_writer import ScanReportWriter
+
+
+def scan_resources(**kwargs: Any) -> "ScanReport":
+    # Import tardio: o engine puxa boto3/jinja2 só quando o comando roda.
+    from core.engine.scan_engine import scan_resources as _scan_resources
+
+    return _scan_resources(**kwargs)
+
+
+def scan_all_resources(**kwargs: Any) -> "ScanReport":
+    from core.engine.scan_engine import scan_all_resources as _scan_all_resources
+
+    return _scan_all_resources(**kwargs)
+
+
+def _open_inventory(path: Optional[Path], required: bool) -> Optional["Inventory"]:
+    """
+    Abre o inventário informado; sem --inventory, usa o default só quando a
+    política de refresh precisa dele.
+    """
+    if path is None and not required:
+        return None
+
+    from core.inventory import Inventory
+
+    return Inventory(path)
+
+
+def _run_scan(
+    *,
+    service: Optional[str],
+    service_type: Optional[str],
+    template: Path,
+    profile: Optional[str],
+    region: Optional[str],
+    tagging_api: bool,
+    scan_all: bool,
+    concurrency: int,
+    inventory: Optional["Inventory"],
+    refresh_older_than: Optional[float],
+    writer: "ScanReportWriter",
+) -> "ScanReport":
+    """
+    Despacha para o scan de um serviço ou de todos os adapters (--all).
+    """
+    if scan_all:
+        if service or service_type:
+            raise typer.BadParameter("Use --all sem informar serviço/tipo de serviço.")
+
+        return scan_all_resources(
+            template_path=str(template),
+            profile=profile,
+            region=region,
+            use_tagging_api=tagging_api,
+            concurrency=concurrency,
+            session=get_validated_session(profile, region),
+            inventory=inventory,
+            refresh_older_than=refresh_older_than,
+            writer=writer,
+        )
+    else:
+        if not service:
+            raise typer.BadParameter("Informe o serviço (ex.: tago scan s3) ou use --all.")
+
+        return scan_resources(
+            service=service,
+            service_type=service_type,
+            template_path=str(template),
+            profile=profile,
+            region=region,
+            use_tagging_api=tagging_api,
+            concurrency=concurrency,
+            session=get_validated_session(profile, region),
+            inventory=inventory,
+            refresh_older_than=refresh_older_than,
+            writer=writer,
+        )
 
 
 @requires_aws_identity
 def scan(
-    service: str = typer.Argument(
-        ...,
-        help="Serviço AWS (ex.: s3, lambda, states).",
+    service: Optional[str] = typer.Argument(
+        None,
+        help="Serviço AWS (ex.: s3, lambda, states). Omitido com --all.",
     ),
     service_type: Optional[str] = typer.Argument(
         None,
@@ -29,7 +112,16 @@ def scan(
         None,
         "--output",
         "-o",
-        help="Output da operação (YAML).",
+        help="Output da operação (YAML). Terminado em .gz, grava comprimido.",
+    ),
+    chunk_size: Optional[int] = typer.Option(
+        None,
+        "--chunk-size",
+        min=1,
+        help=(
+            "Com --output, divide o relatório em arquivos de até N recursos "
+            "(relatorio.00001.yaml, relatorio.00002.yaml, ...)."
+        ),
     ),
     profile: Optional[str] = typer.Option(
         None,
@@ -41,6 +133,36 @@ def scan(
         "--region",
         help="AWS region, e.g. sa-east-1.",
     ),
+    tagging_api: bool = typer.Option(
+        False,
+        "--tagging-api",
+        help=(
+            "Lê as tags em lote pela Resource Groups Tagging API (GetResources), "
+            "ao invés de uma chamada por recurso."
+        ),
+    ),
+    scan_all: bool = typer.Option(
+        False,
+        "--all",
+        help="Varre em paralelo todos os adapters que suportam listagem, num único relatório.",
+    ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        min=1,
+        help="Número de leituras de tags em paralelo (a listagem roda em paralelo a elas).",
+    ),
+    inventory: Optional[Path] = typer.Option(
+        None,
+        "--inventory",
+        dir_okay=False,
+        help="Inventário local (SQLite) populado pelo scan. Default: ~/.cache/tago/inventory.sqlite3 com --refresh-older-than.",
+    ),
+    refresh_older_than: Optional[str] = typer.Option(
+        None,
+        "--refresh-older-than",
+        help="Relê da AWS só as tags do inventário mais velhas que isso (ex.: 15m, 2h, 1d).",
+    ),
 ) -> None:
     """
     Varre recursos de um serviço (e opcionalmente subserviço) usando os adapters
@@ -50,29 +172,50 @@ def scan(
     tago scan s3 --template template.yaml
     tago scan lambda functions --template template.yaml
     tago scan lambda layers --template template.yaml
+    tago scan --all --template template.yaml
 
+    O relatório é escrito em streaming, conforme os recursos são lidos.
     Quando --output é informado, grava o relatório em arquivo e confirma no CLI.
     """
-    report = scan_resources(
-        service=service,
-        service_type=service_type,
-        template_path=str(template),
-        profile=profile,
-        region=region,
-    )
-
-    report_yaml = report.to_yaml()
-
-    if not output:
-        typer.echo(report_yaml)
+    from core.report_writer import ScanReportWriter
+
+    if chunk_size is not None and output is None:
+        raise typer.BadParameter("--chunk-size exige --output.")
+
+    max_age = parse_duration(refresh_older_than)
+    inventory_store = _open_inventory(inventory, required=max_age is not None)
+
+    if output:
+        writer = ScanReportWriter(output, chunk_size=chunk_size)
     else:
-        output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(report_yaml, encoding="utf-8")
+        writer = ScanReportWriter(stream=sys.stdout)
+
+    try:
+        _run_scan(
+            service=service,
+            service_type=service_type,
+            template=template,
+            profile=profile,
+            region=region,
+            tagging_api=tagging_api,
+            scan_all=scan_all,
+            concurrency=concurrency,
+            inventory=inventory_store,
+            refresh_older_than=max_age,
+            writer=writer,
+        )
+    finally:
+        writer.close()
+        if inventory_store is not None:
+            inventory_store.close()
+
+    if output:
+        saved = "\n".join(f"{CYAN}{path}{RESET}" for path in writer.paths)
 
         typer.echo(
             f"\n"
             f"{GREY}─────────────────────────────────────────────{RESET}\n"
             f"{GREEN}{BOLD}Relatório salvo com sucesso.{RESET}\n"
-            f"{CYAN}{output}{RESET}\n"
+            f"{saved}\n"
             f"{GREY}─────────────────────────────────────────────{RESET}\n"
         )
@@ -1,19 +1,45 @@
 import json
+import sys
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, List
 
 import typer
 import typer_di
-import yaml
 
-from core.engine.identity_engine import requires_aws_identity
-from core.engine.tag_engine import tag_resources
+from core.engine import VERIFY_MODES
+from core.engine.identity_engine import get_validated_session, requires_aws_identity
 from core.models import TagRunResult
 
 from ..params import output_params
 
+if TYPE_CHECKING:
+    from core.inventory import Inventory
+
 from .console import BOLD, CYAN, GREEN, GREY, MAGENTA, RED, RESET, YELLOW, BLUE
 
+def iter_tag_resources(**kwargs: Any) -> Iterator[TagRunResult]:
+    # Import tardio: o engine puxa boto3/jinja2, que só são necessários
+    # quando o comando roda (não em --help/--version).
+    from core.engine.tag_engine import iter_tag_resources as _iter_tag_resources
+
+    return _iter_tag_resources(**kwargs)
+
+
+def _open_inventory(path: Optional[Path]) -> Optional["Inventory"]:
+    """
+    Inventário a invalidar após as escritas: o informado em --inventory ou,
+    sem ele, o inventário padrão quando já existe (criado por um scan).
+    """
+    from core.inventory import Inventory, default_inventory_path
+
+    if path is None:
+        path = default_inventory_path()
+        if not path.exists():
+            return None
+
+    return Inventory(path)
+
+
 def _load_json_str(json_str: Optional[str]) -> dict:
     """
     Carrega overrides a partir de JSON inline e/ou arquivo JSON, mesclando em um dict.
@@ -25,6 +51,33 @@ def _load_json_str(json_str: Optional[str]) -> dict:
     return data
 
 
+def _iter_arn_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Extrai ARNs de linhas de texto (arquivo ou stdin), uma por linha,
+    ignorando linhas vazias e comentários (#).
+    """
+    for line in lines:
+        arn = line.strip()
+        if arn and not arn.startswith("#"):
+            yield arn
+
+
+def _iter_arns(arns: List[str], arn_file: Optional[Path]) -> Iterator[str]:
+    """
+    Junta os ARNs de --arn (onde '-' significa stdin) e de --arn-file,
+    lendo arquivo e stdin linha a linha, sem carregar tudo em memória.
+    """
+    for arn in arns:
+        if arn == "-":
+            yield from _iter_arn_lines(sys.stdin)
+        else:
+            yield arn
+
+    if arn_file is not None:
+        with arn_file.open(encoding="utf-8") as fh:
+            yield from _iter_arn_lines(fh)
+
+
 @requires_aws_identity
 # TODO: Tirar a lógica de impressão do resultado quando é dry-run da base e trazer para
 # cá.
@@ -32,7 +85,14 @@ def tag(
     arns: List[str] = typer.Option(
         None,
         "--arn",
-        help="ARN(s) of the resources to tag. Can be passed multiple times.",
+        help="ARN(s) of the resources to tag. Can be passed multiple times. Use '-' to read from stdin.",
+    ),
+    arn_file: Optional[Path] = typer.Option(
+        None,
+        "--arn-file",
+        exists=True,
+        dir_okay=False,
+        help="File with one ARN per line (read lazily; blank lines and # comments are skipped).",
     ),
     template: Path = typer.Option(
         ...,
@@ -70,6 +130,37 @@ def tag(
         "--force",
         help="Ignora as tags atuais e aplica só as do template + JSON.",
     ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        min=1,
+        help="Number of resources processed in parallel.",
+    ),
+    bulk: bool = typer.Option(
+        False,
+        "--bulk",
+        help=(
+            "Write tags through the Resource Groups Tagging API (up to 20 ARNs per call). "
+            "Resources the API does not cover fall back to their adapters."
+        ),
+    ),
+    verify: str = typer.Option(
+        "full",
+        "--verify",
+        help=(
+            f"Post-write verification: {', '.join(VERIFY_MODES)}. "
+            "full re-reads every updated resource, sample a random sample of them."
+        ),
+    ),
+    inventory: Optional[Path] = typer.Option(
+        None,
+        "--inventory",
+        dir_okay=False,
+        help=(
+            "Inventário local do scan a manter em sincronia: recursos alterados são "
+            "relidos da AWS no próximo scan. Default: o inventário padrão, se existir."
+        ),
+    ),
     output: str = typer_di.Depends(output_params),
     dev: bool = typer.Option(False, "--dev", help="Alias para --env dev"),
     hml: bool = typer.Option(False, "--hml", help="Alias para --env hml"),
@@ -83,11 +174,14 @@ def tag(
     """
     arns = arns or []
 
-    if not arns:
+    if not arns and arn_file is None:
         raise typer.BadParameter(
             "Você precisa passar pelo menos um --arn ou um --arn-file."
         )
 
+    if verify not in VERIFY_MODES:
+        raise typer.BadParameter(f"Use --verify {', '.join(VERIFY_MODES)}.")
+
     overrides = _load_json_str(json_str)
 
     # A parte de configuração de ambiente pelas opções de CLI é a parte com
@@ -108,37 +202,117 @@ def tag(
     if env:
         overrides.setdefault("environment", env)
 
-    tags = tag_resources(
-        arns=arns,
+    inventory_store = None if dry_run else _open_inventory(inventory)
+
+    # Resultados chegam em streaming (por lote), conforme os ARNs são processados
+    tags = iter_tag_resources(
+        arns=_iter_arns(arns, arn_file),
         template_path=str(template),
         overrides=overrides,
         profile=profile,
         region=region,
+        session=get_validated_session(profile, region),
         dry_run=dry_run,
         override=force,
+        concurrency=concurrency,
+        bulk=bulk,
+        verify=verify,
+        inventory=inventory_store,
     )
 
-    if not dry_run:
-        _print_tag_run(tags, force, output)
+    failed: List[str] = []
+
+    def _track_failures(results: Iterable[TagRunResult]) -> Iterator[TagRunResult]:
+        for r in results:
+            if r.error is not None:
+                failed.append(r.arn)
+            yield r
+
+    try:
+        if not dry_run:
+            _print_tag_run(_track_failures(tags), force, output)
+        else:
+            _print_dry_run(tags, force, output)
+    finally:
+        if inventory_store is not None:
+            inventory_store.close()
+
+    # Falhas de escrita não interrompem o streaming, mas a execução não pode
+    # terminar com sucesso.
+    if failed:
+        typer.echo(f"Falha ao aplicar tags em {len(failed)} recurso(s).", err=True)
+        raise typer.Exit(1)
+
+
+def _echo_ndjson(payload: Any) -> None:
+    # Uma linha compacta por objeto; typer.echo faz flush a cada chamada,
+    # então jq/log shippers veem o progresso em tempo real.
+    typer.echo(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+
+
+def _echo_document(payloads: Iterable[Any], output: str) -> None:
+    """
+    Emite os payloads como um único documento (lista) json/yaml, elemento a
+    elemento: nada é acumulado, e a saída é a mesma de serializar a lista
+    inteira de uma vez.
+    """
+    if output == "json":
+        first = True
+        for payload in payloads:
+            item = json.dumps(payload, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+            typer.echo(("[\n  " if first else ",\n  ") + item, nl=False)
+            first = False
+        typer.echo("[]" if first else "\n]")
     else:
-        _print_dry_run(tags, force, output)
+        import yaml
+
+        empty = True
+        for payload in payloads:
+            typer.echo(yaml.dump([payload], allow_unicode=True), nl=False)
+            empty = False
+        if empty:
+            typer.echo(yaml.dump([], allow_unicode=True), nl=False)
+        typer.echo()
+
+
+def _tag_run_payload(r: TagRunResult) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"arn": r.arn, "status": r.status, "applied": r.applied_tags}
+    if r.error:
+        payload["error"] = r.error
+    return payload
+
+
+def _dry_run_payload(r: TagRunResult) -> Dict[str, Any]:
+    return {
+        "arn": r.arn,
+        "status": r.status,
+        "desired": r.desired_tags,
+        "existing": r.existing_tags,
+        "final": r.final_tags,
+    }
+
 
 def _print_tag_run(
-    run_result: List[TagRunResult],
+    run_result: Iterable[TagRunResult],
     override: bool,
     output: str
 ) -> None:
-    for r in run_result:
-        """
-        Exibe o resultado da execução.
-        """
-        if output == "json":
-            typer.echo(json.dumps(r.applied_tags, indent=2, ensure_ascii=False))
-            return
-        elif output == "yaml":
-            typer.echo(yaml.dump(r.applied_tags, allow_unicode=True))
-            return
+    """
+    Exibe o resultado da execução.
 
+    Todos os formatos imprimem cada recurso assim que chega; json/yaml
+    formam um único documento (lista) emitido em streaming.
+    """
+    if output == "ndjson":
+        for r in run_result:
+            _echo_ndjson(_tag_run_payload(r))
+        return
+
+    if output in ("json", "yaml"):
+        _echo_document((_tag_run_payload(r) for r in run_result), output)
+        return
+
+    for r in run_result:
         applied_tags = r.applied_tags or {}
         final_sorted = sorted(applied_tags.items(), key=lambda item: item[0].lower())
         max_key_len = max((len(key) for key, _ in final_sorted), default=0)
@@ -150,12 +324,18 @@ def _print_tag_run(
         print(f"{CYAN}{BOLD}TYPE:   {RESET} {r.pretty_name}")
         mode_label = "OVERRIDE (desired overwrites existing)" if override else "SAFE (preserve existing on conflicts)"
         print(f"{YELLOW}{BOLD}MODE:   TAG RUN — {mode_label}{RESET}")
+        print(f"{CYAN}{BOLD}STATUS: {RESET} {r.status}")
+        if r.error:
+            print(f"{RED}{BOLD}ERROR:  {RESET} {r.error}")
         print(GREY + "─────────────────────────────────────────────" + RESET)
         print()
 
         # Desired
         print(f"{CYAN}{BOLD}Applied Tags (from template/context):{RESET}")
-        if final_sorted:
+        if r.applied_tags is None:
+            # fora da amostra de --verify (ou escrita com erro)
+            print(GREY + "  (not verified)" + RESET)
+        elif final_sorted:
             for key, value in final_sorted:
                 print(f"  {key:<{max_key_len}} = {value}")
         else:
@@ -164,7 +344,7 @@ def _print_tag_run(
     
 
 def _print_dry_run(
-    run_result: List[TagRunResult],
+    run_result: Iterable[TagRunResult],
     override: bool,
     output: str
 ) -> None:
@@ -177,6 +357,14 @@ def _print_dry_run(
     override = False  -> modo seguro: valor EXISTENTE ganha em conflitos
     override = True   -> modo agressivo: valor DESEJADO ganha em conflitos
     """
+    if output == "ndjson":
+        for r in run_result:
+            _echo_ndjson(_dry_run_payload(r))
+        return
+
+    if output in ("json", "yaml"):
+        _echo_document((_dry_run_payload(r) for r in run_result), output)
+        return
 
     for r in run_result:
         desired_tags = r.desired_tags
@@ -188,24 +376,6 @@ def _print_dry_run(
         existing_sorted = sorted(existing_tags.items(), key=lambda item: item[0].lower())
         final_sorted = sorted(final_tags.items(), key=lambda item: item[0].lower())
 
-        if output == "json":
-            typer.echo(
-                json.dumps(
-                    {"desired": desired_tags, "existing": existing_tags, "final": final_tags},
-                    indent=2,
-                    ensure_ascii=False,
-                )
-            )
-            return
-        elif output == "yaml":
-            typer.echo(
-                yaml.dump(
-                    {"desired": desired_tags, "existing": existing_tags, "final": final_tags},
-                    allow_unicode=True,
-                )
-            )
-            return
-
         desired_map = desired_tags
         existing_map = existing_tags
         final_map = final_tags
@@ -239,6 +409,7 @@ def _print_dry_run(
         print(f"{CYAN}{BOLD}TYPE:   {RESET} {r.pretty_name}")
         mode_label = "OVERRIDE (desired overwrites existing)" if override else "SAFE (preserve existing on conflicts)"
         print(f"{YELLOW}{BOLD}MODE:   DRY RUN — {mode_label}{RESET}")
+        print(f"{CYAN}{BOLD}STATUS: {RESET} {r.status}")
         print(GREY + "─────────────────────────────────────────────" + RESET)
         print()
 
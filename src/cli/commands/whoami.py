@@ -4,7 +4,6 @@ from typing import Optional
 
 import typer
 import typer_di
-import yaml
 
 from core.engine.identity_engine import get_current_aws_identity
 from core.models import AwsIdentity
@@ -23,7 +22,13 @@ def _print_identity(
             typer.echo(json.dumps({"error": str(error)}, indent=2, ensure_ascii=False))
             raise typer.Exit(code=1)
 
+        if output == "ndjson":
+            typer.echo(json.dumps({"error": str(error)}, ensure_ascii=False, separators=(",", ":")))
+            raise typer.Exit(code=1)
+
         if output == "yaml":
+            import yaml
+
             typer.echo(yaml.safe_dump({"error": str(error)}, sort_keys=False, allow_unicode=True))
             raise typer.Exit(code=1)
 
@@ -56,7 +61,13 @@ def _print_identity(
         typer.echo(json.dumps(identity_dict, indent=2, ensure_ascii=False))
         return
 
+    if output == "ndjson":
+        typer.echo(json.dumps(identity_dict, ensure_ascii=False, separators=(",", ":")))
+        return
+
     if output == "yaml":
+        import yaml
+
         typer.echo(yaml.safe_dump(identity_dict, sort_keys=False, allow_unicode=True))
         return
 
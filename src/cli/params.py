@@ -1,27 +1,34 @@
+from typing import Optional
+
 import typer
 
 
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
 def output_params(
     output: str = typer.Option(
         None,
         "--output",
         "-o",
-        help="Output format: json (default) ou yaml.",
+        help="Output format: json (default), yaml, ndjson ou text.",
     ),
     out_json: bool = typer.Option(False, "--json", help="Alias para --output json"),
     out_yaml: bool = typer.Option(False, "--yaml", help="Alias para --output yaml"),
     out_text: bool = typer.Option(False, "--text", help="Alias para --output text"),
+    out_ndjson: bool = typer.Option(False, "--ndjson", help="Alias para --output ndjson"),
 ) -> str:
     output_options = [
         out_json,
         out_yaml,
         out_text,
+        out_ndjson,
         output is not None,  # só conta se o usuário forneceu --output
     ]
 
     if sum(output_options) > 1:
         raise typer.BadParameter(
-            "Use apenas uma opção de output: --json, --yaml, --text ou --output."
+            "Use apenas uma opção de output: --json, --yaml, --ndjson, --text ou --output."
         )
 
     if out_json:
@@ -30,8 +37,31 @@ def output_params(
         output = "yaml"
     elif out_text:
         output = "text"
+    elif out_ndjson:
+        output = "ndjson"
 
-    if output not in {"json", "yaml", "text"}:
+    if output not in {"json", "yaml", "ndjson", "text"}:
         output = "json"
 
     return output
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Converte durações como "90", "90s", "15m", "2h" ou "1d" em segundos.
+    """
+    if value is None:
+        return None
+
+    raw = value.strip().lower()
+    unit = _DURATION_UNITS.get(raw[-1:]) if raw else None
+    number = raw[:-1] if unit else raw
+
+    try:
+        seconds = float(number) * (unit or 1)
+    except ValueError:
+        raise typer.BadParameter(f"Duração inválida: {value!r} (use ex.: 90s, 15m, 2h, 1d).")
+
+    if seconds < 0:
+        raise typer.BadParameter("A duração não pode ser negativa.")
+    return seconds
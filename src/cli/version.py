@@ -1,5 +1,3 @@
-from importlib.metadata import PackageNotFoundError, version
-
 import typer
 
 
@@ -7,6 +5,9 @@ def get_version() -> str:
     """
     Retorna a versão instalada do pacote, com fallback seguro se não houver metadados.
     """
+    # importlib.metadata é caro no startup; só é necessário para --version.
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version("tago")
     except PackageNotFoundError:
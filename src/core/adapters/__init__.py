@@ -3,9 +3,29 @@ from .base import BaseTagAdapter
 
 import pkgutil
 import importlib
-from typing import Optional
-from boto3.session import Session
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
 from ..arn import Arn
+from .manifest import ADAPTER_MANIFEST, AdapterManifestEntry
+
+
+# Delimitadores do primeiro token de `arn.resource` ("function:", "table/"...).
+_RESOURCE_DELIMITERS = (":", "/")
+
+_adapters_loaded = False
+_imported_modules: set[str] = set()
+
+# Índice de dispatch, reconstruído sempre que o registry muda de tamanho:
+# - _arn_index: serviço -> {prefixo do resource (None = qualquer): [adapters]}
+# - _service_index: (serviço, resource_type ou None) -> adapter
+# - _arn_memo: (serviço, prefixo do ARN) -> adapter já resolvido. O serviço
+#   entra como veio no ARN (supports() diferencia maiúsculas) e só prefixos
+#   do índice (ou "") são memoizados, então o memo não cresce com a entrada.
+_index_lock = threading.Lock()
+_indexed_size = -1
+_arn_index: Dict[str, Dict[Optional[str], List[type[BaseTagAdapter]]]] = {}
+_service_index: Dict[Tuple[str, Optional[str]], type[BaseTagAdapter]] = {}
+_arn_memo: Dict[Tuple[str, str], type[BaseTagAdapter]] = {}
 
 
 def load_adapters() -> None:
@@ -14,26 +34,123 @@ def load_adapters() -> None:
     para que o __init_subclass__ do BaseTagAdapter tenha rodado
     e populado o registry.
     """
-    # Se já tem coisa registrada, não precisa procurar de novo
-    if BaseTagAdapter.registry:
+    global _adapters_loaded
+
+    # Já varreu o pacote uma vez, não precisa procurar de novo
+    if _adapters_loaded:
         return
 
     package_name = __name__  # "core.adapters"
 
     for finder, name, ispkg in pkgutil.iter_modules(__path__, package_name + "."):
         # evita importar de novo o base ou subpackages estranhos
-        if name.endswith(".base"):
+        if name.endswith((".base", ".manifest")):
             continue
         importlib.import_module(name)
 
+    _adapters_loaded = True
+
+
+def _load_from_manifest(match: Callable[[AdapterManifestEntry], bool]) -> bool:
+    """
+    Importa só os módulos de adapters do manifest que satisfazem `match`.
+    Retorna False quando nenhuma entrada bate (quem chama cai no discovery
+    completo, para adapters que ainda não estão no manifest).
+    """
+    modules = [entry.module for entry in ADAPTER_MANIFEST if match(entry)]
+
+    for module in modules:
+        if module not in _imported_modules:
+            importlib.import_module(f"{__name__}.{module}")
+            _imported_modules.add(module)
+
+    return bool(modules)
+
+
+def _resource_prefix(resource: str) -> str:
+    """
+    Primeiro token de `arn.resource`, incluindo o delimitador:
+    "function:minha-fn" -> "function:", "table/T" -> "table/".
+    Recursos sem delimitador (ex.: nome de bucket S3) não têm prefixo ("").
+    """
+    cut = min(
+        (i for i in (resource.find(d) for d in _RESOURCE_DELIMITERS) if i != -1),
+        default=-1,
+    )
+    return resource[:cut + 1] if cut != -1 else ""
+
+
+def _ensure_index() -> None:
+    """
+    (Re)constrói o índice de dispatch a partir do registry sempre que novos
+    adapters forem registrados (import via manifest ou discovery completo).
+    """
+    global _indexed_size
+
+    if _indexed_size == len(BaseTagAdapter.registry):
+        return
+
+    with _index_lock:
+        registry = list(BaseTagAdapter.registry)
+        if _indexed_size == len(registry):
+            return
+
+        arn_index: Dict[str, Dict[Optional[str], List[type[BaseTagAdapter]]]] = {}
+        service_index: Dict[Tuple[str, Optional[str]], type[BaseTagAdapter]] = {}
+
+        for adapter_cls in registry:
+            service = (adapter_cls.service or "").lower()
+            prefixes = arn_index.setdefault(service, {})
+            prefixes.setdefault(adapter_cls.arn_resource_prefix, []).append(adapter_cls)
+
+            # a ordem do registry decide empates, como na varredura linear
+            service_index.setdefault((service, None), adapter_cls)
+            if adapter_cls.resource_type:
+                service_index.setdefault((service, adapter_cls.resource_type.lower()), adapter_cls)
+
+        _arn_index.clear()
+        _arn_index.update(arn_index)
+        _service_index.clear()
+        _service_index.update(service_index)
+        _arn_memo.clear()
+        _indexed_size = len(registry)
+
 
 def get_adapter_for_arn(arn: Arn) -> type[BaseTagAdapter]:
     """
-    Resolve o adapter correto para um ARN, disparando o auto-discovery
-    se o registry ainda estiver vazio.
+    Resolve o adapter correto para um ARN, importando via manifest só o
+    módulo do serviço/prefixo do ARN.
+
+    Usa o índice (serviço -> prefixo do resource) e memoiza o adapter por
+    (serviço, prefixo): depois da primeira resolução, cada ARN custa um
+    lookup em dict. Prefixos fora do índice (ex.: "bucket/" de um objeto S3)
+    não são memoizados. Adapters fora do índice caem no discovery completo e
+    na varredura via `supports()`.
     """
-    load_adapters()
+    prefix = _resource_prefix(arn.resource)
+    key = (arn.service, prefix)
+
+    adapter_cls = _arn_memo.get(key)
+    if adapter_cls is not None:
+        return adapter_cls
+
+    service = arn.service.lower()
+    if not _load_from_manifest(
+        lambda e: e.service == service and e.arn_resource_prefix in (prefix, None)
+    ):
+        load_adapters()
+    _ensure_index()
+
+    by_prefix = _arn_index.get(service, {})
+    candidates = by_prefix.get(prefix, []) + by_prefix.get(None, [])
+
+    for adapter_cls in candidates:
+        if adapter_cls.supports(arn):
+            if prefix == "" or prefix in by_prefix:
+                _arn_memo[key] = adapter_cls
+            return adapter_cls
 
+    load_adapters()
     for adapter_cls in BaseTagAdapter.registry:
         if adapter_cls.supports(arn):
             return adapter_cls
@@ -43,20 +160,18 @@ def get_adapter_for_arn(arn: Arn) -> type[BaseTagAdapter]:
 def get_adapters_for_service(service: str, resource_type: str | None)  -> type[BaseTagAdapter]:
     """
     Resolve o adapter correto para um serviço (e opcionalmente tipo de recurso),
-    disparando o auto-discovery se o registry ainda estiver vazio.
+    importando via manifest só os módulos desse serviço.
     """
-    load_adapters()
-
     service = service.lower()
     if resource_type:
         resource_type = resource_type.lower()
 
-    result = []
-    for adapter_cls in BaseTagAdapter.registry:
-        if adapter_cls.service.lower() != service:
-            continue
-        if resource_type and (adapter_cls.resource_type or "").lower() != resource_type:
-            continue
+    if not _load_from_manifest(lambda e: e.service.lower() == service):
+        load_adapters()
+    _ensure_index()
+
+    adapter_cls = _service_index.get((service, resource_type or None))
+    if adapter_cls is not None:
         return adapter_cls
 
     raise ValueError(
@@ -65,3 +180,18 @@ def get_adapters_for_service(service: str, resource_type: str | None)  -> type[B
     )
 
 
+def get_listing_adapters() -> List[type[BaseTagAdapter]]:
+    """
+    Todos os adapters que implementam list_resources (usados pelo scan --all),
+    importando via manifest só os módulos desses adapters.
+    """
+    _load_from_manifest(lambda e: e.supports_listing)
+
+    return sorted(
+        (
+            adapter_cls
+            for adapter_cls in BaseTagAdapter.registry
+            if adapter_cls.__module__.startswith(__name__ + ".") and adapter_cls.supports_listing()
+        ),
+        key=lambda c: c.__name__.lower(),
+    )
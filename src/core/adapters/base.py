@@ -1,9 +1,25 @@
 from abc import ABC, abstractmethod
-from typing import ClassVar, Dict, Iterable, List, Type
-from boto3.session import Session
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar, Dict, Iterable, List, Type, Union
 from ..arn import Arn
 from ..models import TagSet, TagRunResult
 
+if TYPE_CHECKING:
+    # Só para anotações: o pacote de adapters (e o manifest) não importa boto3.
+    from boto3.session import Session
+
+
+@dataclass(frozen=True, slots=True)
+class ListedResource:
+    """
+    Recurso listado junto com as tags que a própria listagem já devolveu
+    (ex.: describe_instances, list_secrets). O scan usa essas tags e pula a
+    leitura individual do recurso.
+    """
+
+    arn: Arn
+    tags: Dict[str, str]
+
 
 class BaseTagAdapter(ABC):
     """
@@ -24,6 +40,26 @@ class BaseTagAdapter(ABC):
     # Nome amigavel para exibição em CLI
     pretty_name: str = ""
 
+    # Tipo do recurso na Resource Groups Tagging API (ex.: "lambda:function").
+    # None quando a API não cobre o recurso; nesse caso só o adapter escreve.
+    tagging_api_type: str | None = None
+
+    # Prefixo de `arn.resource` atendido pelo adapter (ex.: "function:",
+    # "table/"), usado pelo índice de dispatch. Deve ser coerente com
+    # `supports()`. None = qualquer recurso do serviço.
+    arn_resource_prefix: str | None = None
+
+    # True quando list_resources já devolve as tags (ListedResource): o scan
+    # não precisa do snapshot da Tagging API para esse adapter.
+    lists_with_tags: ClassVar[bool] = False
+
+    # Recursos por chamada nas APIs em lote do adapter (read_tags_batch /
+    # write_tags_batch). None = o adapter só lê e escreve recurso a recurso.
+    batch_api_size: ClassVar[int | None] = None
+
+    # Snapshot de tags já lido em lote (prefetch_tags), consumido pelo merge
+    _prefetched_tags: Dict[str, str] | None = None
+
     def __init_subclass__(cls, **kwargs):
         """
         Sempre que uma subclass é criada, se não for abstrata, entra no registry.
@@ -36,8 +72,10 @@ class BaseTagAdapter(ABC):
 
         BaseTagAdapter.registry.append(cls)
 
-    def __init__(self, arn: Arn, session: Session) -> None:
+    def __init__(self, arn: Arn, session: "Session") -> None:
         self.arn = arn
+        # Nos engines, `session` é um core.clients.ClientPool: mesma interface
+        # `client(name)`, mas com clients compartilhados entre os adapters.
         self.session = session
 
     @classmethod
@@ -50,9 +88,58 @@ class BaseTagAdapter(ABC):
         ...
     
     @classmethod
-    def list_resources(cls, session: Session) -> Iterable[Arn]:
+    def tagging_api_arn(cls, arn: Arn) -> str:
+        """
+        ARN no formato aceito pela Resource Groups Tagging API.
+        """
+        return arn.raw
+
+    def tagging_api_region(self) -> str | None:
+        """
+        Região em que a Resource Groups Tagging API enxerga o recurso.
+        None = região default da execução (ARNs sem região).
+        """
+        return self.arn.region
+
+    @classmethod
+    def list_resources(cls, session: "Session") -> Iterable[Union[Arn, ListedResource]]:
+        """
+        Lista os recursos do adapter. Cada item é um Arn ou, quando a API de
+        listagem já traz as tags, um ListedResource com o snapshot delas.
+        """
         raise NotImplementedError("Adapter does not implement resource listing.")
 
+    @classmethod
+    def supports_listing(cls) -> bool:
+        """
+        True se o adapter sobrescreve list_resources (pode ser usado no scan).
+        """
+        return cls.list_resources.__func__ is not BaseTagAdapter.list_resources.__func__
+
+    @classmethod
+    def read_tags_batch(cls, adapters: List["BaseTagAdapter"]) -> Dict[str, Dict[str, str]]:
+        """
+        Lê as tags de até batch_api_size recursos da mesma região numa única
+        chamada (paginada). Devolve {arn.raw: {Key: Value}}; recursos sem tags
+        podem ficar de fora.
+        """
+        raise NotImplementedError("Adapter does not implement batch reads.")
+
+    @classmethod
+    def write_tags_batch(cls, adapters: List["BaseTagAdapter"], tags: Dict[str, str]) -> None:
+        """
+        Escreve o mesmo delta de tags em até batch_api_size recursos da mesma
+        região numa única chamada.
+        """
+        raise NotImplementedError("Adapter does not implement batch writes.")
+
+    def prefetch_tags(self, tags: Dict[str, str]) -> None:
+        """
+        Registra as tags atuais já lidas em lote: o próximo merge
+        (_get_aws_tags) usa esse snapshot ao invés de chamar get_current_tags.
+        """
+        self._prefetched_tags = dict(tags)
+
     @abstractmethod
     def get_current_tags(self) -> Dict[str, str]:
         """
@@ -78,18 +165,36 @@ class BaseTagAdapter(ABC):
     def _aws_tags_to_dict(self, tags: List[Dict[str, str]]) -> Dict[str, str]:
         return {t["Key"]: t["Value"] for t in tags}
     
-    def _get_aws_tags(self, tagset: TagSet, override: bool) -> tuple[List[Dict[str, str]], List[Dict[str, str]], List[Dict[str, str]]]:
+    def _get_aws_tags(
+        self, tagset: TagSet, override: bool
+    ) -> tuple[List[Dict[str, str]], List[Dict[str, str]], List[Dict[str, str]], List[Dict[str, str]]]:
         """
         Returns:
-            (desired_tags, existing_tags, final_tags), all in AWS [{Key, Value}] format.
+            (desired_tags, existing_tags, final_tags, changed_tags), all in AWS [{Key, Value}] format.
+
+        changed_tags é o delta entre existing e final (chaves novas ou com valor
+        diferente). Como o merge nunca remove chaves, é exatamente o que APIs
+        aditivas (TagResource, CreateTags...) precisam receber; vazio quando o
+        recurso já está em conformidade.
         """
 
         desired_dict: Dict[str, str] = {t.key: t.value for t in tagset.tags}
-        existing = self.get_current_tags()
+        if self._prefetched_tags is not None:
+            # snapshot vale para um único merge; leituras seguintes vão à AWS
+            existing, self._prefetched_tags = self._prefetched_tags, None
+        else:
+            existing = self.get_current_tags()
 
         if not override:
             final_dict = {**desired_dict, **existing}
         else:
             final_dict = {**existing, **desired_dict}
 
-        return (self._build_aws_tags(desired_dict), self._build_aws_tags(existing), self._build_aws_tags(final_dict))
+        changed_dict = {k: v for k, v in final_dict.items() if existing.get(k) != v}
+
+        return (
+            self._build_aws_tags(desired_dict),
+            self._build_aws_tags(existing),
+            self._build_aws_tags(final_dict),
+            self._build_aws_tags(changed_dict),
+        )
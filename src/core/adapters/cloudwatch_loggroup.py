@@ -11,6 +11,8 @@ class CloudWatchLogGroupTagAdapter(BaseTagAdapter):
     service = "logs"
     resource_type = "log-group"
     pretty_name = "CloudWatch Log Group"
+    tagging_api_type = "logs:log-group"
+    arn_resource_prefix = "log-group:"
 
     def __init__(self, arn: Arn, session: Session) -> None:
         super().__init__(arn, session)
@@ -42,6 +44,14 @@ class CloudWatchLogGroupTagAdapter(BaseTagAdapter):
                 if arn_str:
                     yield Arn.parse(arn_str)
 
+    @classmethod
+    def tagging_api_arn(cls, arn: Arn) -> str:
+        """
+        describe_log_groups devolve o ARN com sufixo ':*', que a
+        Resource Groups Tagging API não aceita.
+        """
+        return arn.raw[:-2] if arn.raw.endswith(":*") else arn.raw
+
     def _parse_log_group_name(self) -> str:
         """
         arn.resource => "log-group:/eks/mdb-k8s-hml-ia/open-webui:*"
@@ -95,22 +105,22 @@ class CloudWatchLogGroupTagAdapter(BaseTagAdapter):
         # Mantém o mesmo contrato do S3:
         # desired_tags / existing_tags / final_tags em formato AWS:
         #   List[{"Key": str, "Value": str}]
-        desired_tags, existing_tags, final_tags = self._get_aws_tags(tagset, override)
+        desired_tags, existing_tags, final_tags, changed_tags = self._get_aws_tags(tagset, override)
         desired_map = self._aws_tags_to_dict(desired_tags)
         existing_map = self._aws_tags_to_dict(existing_tags)
         final_map = self._aws_tags_to_dict(final_tags)
 
-        if not dry_run:
+        if not dry_run and changed_tags:
             # Para CloudWatch Logs, tag_log_group espera:
             #   tags = { "Key": "Value", ... }
-            # então convertemos a lista AWS para dict
-            tags_dict = {t["Key"]: t["Value"] for t in (final_tags or [])}
-
-            if tags_dict:
-                self.client.tag_log_group(
-                    logGroupName=log_group_name,
-                    tags=tags_dict,
-                )
+            # então convertemos a lista AWS para dict.
+            # tag_log_group é aditivo: basta enviar o delta.
+            tags_dict = {t["Key"]: t["Value"] for t in changed_tags}
+
+            self.client.tag_log_group(
+                logGroupName=log_group_name,
+                tags=tags_dict,
+            )
 
         return TagRunResult(
             arn=self.arn.raw,
@@ -9,6 +9,8 @@ from ..arn import Arn
 class DynamoDBTableTagAdapter(BaseTagAdapter):
     service = "dynamodb"
     pretty_name = "DynamoDB Table"
+    tagging_api_type = "dynamodb:table"
+    arn_resource_prefix = "table/"
 
     @classmethod
     def supports(cls, arn: Arn) -> bool:
@@ -59,15 +61,16 @@ class DynamoDBTableTagAdapter(BaseTagAdapter):
         """
         resource_arn = self.arn.raw
 
-        desired_tags, existing_tags, final_tags = self._get_aws_tags(tagset, override)
+        desired_tags, existing_tags, final_tags, changed_tags = self._get_aws_tags(tagset, override)
         desired_map = self._aws_tags_to_dict(desired_tags)
         existing_map = self._aws_tags_to_dict(existing_tags)
         final_map = self._aws_tags_to_dict(final_tags)
 
-        if not dry_run:
+        # TagResource é aditivo: só enviamos o delta, e nada quando já está conforme
+        if not dry_run and changed_tags:
             self.client.tag_resource(
                 ResourceArn=resource_arn,
-                Tags=final_tags,
+                Tags=changed_tags,
             )
 
         return TagRunResult(
@@ -1,7 +1,7 @@
-from typing import List, Dict
+from typing import Dict, Iterable, List
 from boto3.session import Session
 
-from .base import BaseTagAdapter
+from .base import BaseTagAdapter, ListedResource
 from ..models import TagSet, TagRunResult
 from ..arn import Arn
 
@@ -9,16 +9,79 @@ from ..arn import Arn
 class EC2InstanceTagAdapter(BaseTagAdapter):
     service = "ec2"
     pretty_name = "EC2 Instance"
+    tagging_api_type = "ec2:instance"
+    arn_resource_prefix = "instance/"
+    lists_with_tags = True
+    # Máximo de valores por filtro no describe_tags
+    batch_api_size = 200
 
     @classmethod
     def supports(cls, arn: Arn) -> bool:
         # arn:aws:ec2:region:account:instance/i-abc123
         return arn.service == "ec2" and arn.resource.startswith("instance/")
+
+    @classmethod
+    def list_resources(cls, session: Session) -> Iterable[ListedResource]:
+        """
+        Lista as instâncias da região via describe_instances, que já devolve
+        as tags de cada uma (sem describe_tags por instância).
+        """
+        client = session.client("ec2")
+        region = client.meta.region_name
+        partition = getattr(client.meta, "partition", None) or "aws"
+
+        paginator = client.get_paginator("describe_instances")
+        for page in paginator.paginate():
+            for reservation in page.get("Reservations", []):
+                account_id = reservation.get("OwnerId", "")
+                for instance in reservation.get("Instances", []):
+                    # instâncias terminadas ainda aparecem por um tempo, mas não aceitam tags
+                    if instance.get("State", {}).get("Name") == "terminated":
+                        continue
+
+                    arn = Arn.parse(
+                        f"arn:{partition}:ec2:{region}:{account_id}:instance/{instance['InstanceId']}"
+                    )
+                    tags = {t["Key"]: t["Value"] for t in instance.get("Tags", [])}
+                    yield ListedResource(arn=arn, tags=tags)
     
     def __init__(self, arn: Arn, session: Session) -> None:
         super().__init__(arn, session)
         self.client = self.session.client("ec2")
 
+    @classmethod
+    def read_tags_batch(cls, adapters: List["EC2InstanceTagAdapter"]) -> Dict[str, Dict[str, str]]:
+        """
+        Um describe_tags paginado, filtrando por todos os instance ids do lote.
+        """
+        by_id = {adapter._resource_id(): adapter.arn.raw for adapter in adapters}
+        client = adapters[0].client
+
+        tags: Dict[str, Dict[str, str]] = {}
+        paginator = client.get_paginator("describe_tags")
+        for page in paginator.paginate(
+            Filters=[
+                {"Name": "resource-type", "Values": ["instance"]},
+                {"Name": "resource-id", "Values": list(by_id)},
+            ]
+        ):
+            for t in page.get("Tags", []):
+                arn = by_id.get(t["ResourceId"])
+                if arn is not None:
+                    tags.setdefault(arn, {})[t["Key"]] = t["Value"]
+
+        return tags
+
+    @classmethod
+    def write_tags_batch(cls, adapters: List["EC2InstanceTagAdapter"], tags: Dict[str, str]) -> None:
+        """
+        Um create_tags para todas as instâncias do lote (mesmo delta).
+        """
+        adapters[0].client.create_tags(
+            Resources=[adapter._resource_id() for adapter in adapters],
+            Tags=[{"Key": k, "Value": v} for k, v in tags.items()],
+        )
+
     def _resource_id(self) -> str:
         # arn:aws:ec2:region:account:instance/i-abc123
         # resource = "instance/i-abc123"
@@ -63,15 +126,16 @@ class EC2InstanceTagAdapter(BaseTagAdapter):
         """
         instance_id = self._resource_id()
 
-        desired_tags, existing_tags, final_tags = self._get_aws_tags(tagset, override)
+        desired_tags, existing_tags, final_tags, changed_tags = self._get_aws_tags(tagset, override)
         desired_map = self._aws_tags_to_dict(desired_tags)
         existing_map = self._aws_tags_to_dict(existing_tags)
         final_map = self._aws_tags_to_dict(final_tags)
 
-        if not dry_run:
+        # CreateTags é aditivo: só enviamos o delta, e nada quando já está conforme
+        if not dry_run and changed_tags:
             self.client.create_tags(
                 Resources=[instance_id],
-                Tags=final_tags,
+                Tags=changed_tags,
             )
 
         return TagRunResult(
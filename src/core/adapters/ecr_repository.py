@@ -10,6 +10,8 @@ class ECRRepositoryTagAdapter(BaseTagAdapter):
     service = "ecr"
     resource_type = "repository"
     pretty_name = "ECR Repository"
+    tagging_api_type = "ecr:repository"
+    arn_resource_prefix = "repository/"
 
     @classmethod
     def supports(cls, arn: Arn) -> bool:
@@ -69,15 +71,16 @@ class ECRRepositoryTagAdapter(BaseTagAdapter):
     ) -> TagRunResult:
         resource_arn = self.arn.raw
 
-        desired_tags, existing_tags, final_tags = self._get_aws_tags(tagset, override)
+        desired_tags, existing_tags, final_tags, changed_tags = self._get_aws_tags(tagset, override)
         desired_map = self._aws_tags_to_dict(desired_tags)
         existing_map = self._aws_tags_to_dict(existing_tags)
         final_map = self._aws_tags_to_dict(final_tags)
 
-        if not dry_run:
+        # TagResource é aditivo: só enviamos o delta, e nada quando já está conforme
+        if not dry_run and changed_tags:
             self.client.tag_resource(
                 resourceArn=resource_arn,
-                tags=final_tags,
+                tags=changed_tags,
             )
 
         return TagRunResult(
@@ -15,6 +15,8 @@ class ECSTaskDefinitionTagAdapter(BaseTagAdapter):
     """
     service = "ecs"
     pretty_name = "ECS Task Definition"
+    tagging_api_type = "ecs:task-definition"
+    arn_resource_prefix = "task-definition/"
 
     @classmethod
     def supports(cls, arn: Arn) -> bool:
@@ -62,13 +64,14 @@ class ECSTaskDefinitionTagAdapter(BaseTagAdapter):
         resource_arn = self.arn.raw
 
         # Sempre em formato [{Key, Value}]
-        desired_tags, existing_tags, final_tags = self._get_aws_tags(tagset, override)
+        desired_tags, existing_tags, final_tags, changed_tags = self._get_aws_tags(tagset, override)
         desired_map = self._aws_tags_to_dict(desired_tags)
         existing_map = self._aws_tags_to_dict(existing_tags)
         final_map = self._aws_tags_to_dict(final_tags)
 
-        if not dry_run:
-            ecs_tags = self._to_ecs_format(final_tags)
+        # TagResource é aditivo: só enviamos o delta, e nada quando já está conforme
+        if not dry_run and changed_tags:
+            ecs_tags = self._to_ecs_format(changed_tags)
 
             self.client.tag_resource(
                 resourceArn=resource_arn,
@@ -1,7 +1,7 @@
-from typing import Dict, List
+from typing import Dict, Iterable, List
 from boto3.session import Session
 
-from .base import BaseTagAdapter
+from .base import BaseTagAdapter, ListedResource
 from ..models import TagSet, TagRunResult
 from ..arn import Arn
 
@@ -9,6 +9,11 @@ from ..arn import Arn
 class IAMRoleTagAdapter(BaseTagAdapter):
     service = "iam"
     pretty_name = "IAM Role"
+    # IAM é global e fica fora da Resource Groups Tagging API (que é regional):
+    # escritas em lote caem no próprio adapter.
+    tagging_api_type = None
+    arn_resource_prefix = "role/"
+    lists_with_tags = True
 
     @classmethod
     def supports(cls, arn: Arn) -> bool:
@@ -19,6 +24,21 @@ class IAMRoleTagAdapter(BaseTagAdapter):
         """
         return arn.service == "iam" and arn.resource.startswith("role/")
 
+    @classmethod
+    def list_resources(cls, session: Session) -> Iterable[ListedResource]:
+        """
+        Lista as roles com get_account_authorization_details, que devolve o
+        ARN e as tags de cada uma em poucas páginas: nenhum list_role_tags por
+        role (o IAM tem limites de taxa baixos).
+        """
+        client = session.client("iam")
+        paginator = client.get_paginator("get_account_authorization_details")
+
+        for page in paginator.paginate(Filter=["Role"]):
+            for role in page.get("RoleDetailList", []):
+                tags = {t["Key"]: t["Value"] for t in role.get("Tags", [])}
+                yield ListedResource(arn=Arn.parse(role["Arn"]), tags=tags)
+
     def __init__(self, arn: Arn, session: Session) -> None:
         super().__init__(arn, session)
         self.client = self.session.client("iam")
@@ -63,15 +83,16 @@ class IAMRoleTagAdapter(BaseTagAdapter):
     ) -> TagRunResult:
         role_name = self._role_name()
 
-        desired_tags, existing_tags, final_tags = self._get_aws_tags(tagset, override)
+        desired_tags, existing_tags, final_tags, changed_tags = self._get_aws_tags(tagset, override)
         desired_map = self._aws_tags_to_dict(desired_tags)
         existing_map = self._aws_tags_to_dict(existing_tags)
         final_map = self._aws_tags_to_dict(final_tags)
 
-        if not dry_run:
+        # TagRole é aditivo: só enviamos o delta, e nada quando já está conforme
+        if not dry_run and changed_tags:
             self.client.tag_role(
                 RoleName=role_name,
-                Tags=final_tags,
+                Tags=changed_tags,
             )
 
         return TagRunResult(
@@ -10,6 +10,8 @@ class LambdaFunctionTagAdapter(BaseTagAdapter):
     service = "lambda"
     resource_type = "functions"
     pretty_name = "Lambda Function"
+    tagging_api_type = "lambda:function"
+    arn_resource_prefix = "function:"
 
     @classmethod
     def supports(cls, arn: Arn) -> bool:
@@ -26,7 +28,7 @@ class LambdaFunctionTagAdapter(BaseTagAdapter):
         paginator = client.get_paginator("list_functions")
         for page in paginator.paginate():
             for fn in page.get("Functions", []):
-                yield Arn(fn["FunctionArn"])
+                yield Arn.parse(fn["FunctionArn"])
 
     def __init__(self, arn: Arn, session: Session) -> None:
         super().__init__(arn, session)
@@ -68,14 +70,15 @@ class LambdaFunctionTagAdapter(BaseTagAdapter):
         resource_arn = self.arn.raw
 
         # desired_tags, existing_tags, final_tags → sempre [{Key,Value}]
-        desired_tags, existing_tags, final_tags = self._get_aws_tags(tagset, override)
+        desired_tags, existing_tags, final_tags, changed_tags = self._get_aws_tags(tagset, override)
         desired_map = self._aws_tags_to_dict(desired_tags)
         existing_map = self._aws_tags_to_dict(existing_tags)
         final_map = self._aws_tags_to_dict(final_tags)
 
-        if not dry_run:
-            # Converte final_tags para o formato do Lambda ({key: value})
-            lambda_format = self._to_lambda_format(final_tags)
+        # TagResource é aditivo: só enviamos o delta, e nada quando já está conforme
+        if not dry_run and changed_tags:
+            # Converte changed_tags para o formato do Lambda ({key: value})
+            lambda_format = self._to_lambda_format(changed_tags)
 
             self.client.tag_resource(
                 Resource=resource_arn,
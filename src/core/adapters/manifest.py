@@ -0,0 +1,178 @@
+"""
+Manifest estático dos adapters: serviço/prefixo de ARN -> módulo.
+
+Permite importar só o módulo do adapter necessário (e listar os adapters no
+CLI) sem carregar boto3 nem os demais adapters.
+
+O conteúdo de ADAPTER_MANIFEST é gerado a partir dos atributos das classes
+(`service`, `resource_type`, `arn_resource_prefix`, `pretty_name` e se o
+adapter implementa `list_resources`). Depois de adicionar ou alterar um
+adapter, regenere com:
+
+    python -m core.adapters.manifest
+"""
+import importlib
+import json
+import pkgutil
+from dataclasses import dataclass, fields
+from typing import List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class AdapterManifestEntry:
+    module: str
+    name: str
+    service: str
+    resource_type: Optional[str]
+    arn_resource_prefix: Optional[str]
+    pretty_name: str
+    supports_listing: bool = False
+
+
+# --- gerado por `python -m core.adapters.manifest`; não edite à mão ---
+ADAPTER_MANIFEST: Tuple[AdapterManifestEntry, ...] = (
+    AdapterManifestEntry(
+        module="cloudwatch_loggroup",
+        name="CloudWatchLogGroupTagAdapter",
+        service="logs",
+        resource_type="log-group",
+        arn_resource_prefix="log-group:",
+        pretty_name="CloudWatch Log Group",
+        supports_listing=True,
+    ),
+    AdapterManifestEntry(
+        module="dynamodb_table",
+        name="DynamoDBTableTagAdapter",
+        service="dynamodb",
+        resource_type=None,
+        arn_resource_prefix="table/",
+        pretty_name="DynamoDB Table",
+        supports_listing=False,
+    ),
+    AdapterManifestEntry(
+        module="ec2_instance",
+        name="EC2InstanceTagAdapter",
+        service="ec2",
+        resource_type=None,
+        arn_resource_prefix="instance/",
+        pretty_name="EC2 Instance",
+        supports_listing=True,
+    ),
+    AdapterManifestEntry(
+        module="ecr_repository",
+        name="ECRRepositoryTagAdapter",
+        service="ecr",
+        resource_type="repository",
+        arn_resource_prefix="repository/",
+        pretty_name="ECR Repository",
+        supports_listing=True,
+    ),
+    AdapterManifestEntry(
+        module="ecs_taskdefinitions",
+        name="ECSTaskDefinitionTagAdapter",
+        service="ecs",
+        resource_type=None,
+        arn_resource_prefix="task-definition/",
+        pretty_name="ECS Task Definition",
+        supports_listing=False,
+    ),
+    AdapterManifestEntry(
+        module="iam_role",
+        name="IAMRoleTagAdapter",
+        service="iam",
+        resource_type=None,
+        arn_resource_prefix="role/",
+        pretty_name="IAM Role",
+        supports_listing=True,
+    ),
+    AdapterManifestEntry(
+        module="lambda_function",
+        name="LambdaFunctionTagAdapter",
+        service="lambda",
+        resource_type="functions",
+        arn_resource_prefix="function:",
+        pretty_name="Lambda Function",
+        supports_listing=True,
+    ),
+    AdapterManifestEntry(
+        module="s3_bucket",
+        name="S3BucketTagAdapter",
+        service="s3",
+        resource_type="bucket",
+        arn_resource_prefix=None,
+        pretty_name="S3 Bucket",
+        supports_listing=True,
+    ),
+    AdapterManifestEntry(
+        module="secretsmanager_secret",
+        name="SecretsManagerSecretTagAdapter",
+        service="secretsmanager",
+        resource_type=None,
+        arn_resource_prefix="secret:",
+        pretty_name="Secrets Manager Secret",
+        supports_listing=True,
+    ),
+    AdapterManifestEntry(
+        module="stepfunctions_stateMachine",
+        name="StepFunctionsStateMachineTagAdapter",
+        service="states",
+        resource_type=None,
+        arn_resource_prefix="stateMachine:",
+        pretty_name="Step Functions State Machine",
+        supports_listing=False,
+    ),
+)
+# --- fim do bloco gerado ---
+
+
+def build_manifest() -> Tuple[AdapterManifestEntry, ...]:
+    """
+    Importa todos os módulos de core.adapters e gera o manifest a partir das
+    classes registradas, ordenado por módulo/nome.
+    """
+    from . import __name__ as package_name, __path__ as package_path
+    from .base import BaseTagAdapter
+
+    for _, name, _ in pkgutil.iter_modules(package_path, package_name + "."):
+        if name.endswith((".base", ".manifest")):
+            continue
+        importlib.import_module(name)
+
+    entries: List[AdapterManifestEntry] = []
+    for adapter_cls in BaseTagAdapter.registry:
+        module = adapter_cls.__module__
+        if not module.startswith(package_name + "."):
+            continue
+        entries.append(
+            AdapterManifestEntry(
+                module=module.rsplit(".", 1)[1],
+                name=adapter_cls.__name__,
+                service=adapter_cls.service,
+                resource_type=adapter_cls.resource_type,
+                arn_resource_prefix=adapter_cls.arn_resource_prefix,
+                pretty_name=adapter_cls.pretty_name,
+                supports_listing=adapter_cls.supports_listing(),
+            )
+        )
+
+    return tuple(sorted(entries, key=lambda e: (e.module, e.name)))
+
+
+def render_manifest(entries: Tuple[AdapterManifestEntry, ...]) -> str:
+    """
+    Código Python do bloco ADAPTER_MANIFEST para as entradas informadas.
+    """
+    lines = ["ADAPTER_MANIFEST: Tuple[AdapterManifestEntry, ...] = ("]
+    for e in entries:
+        lines.append("    AdapterManifestEntry(")
+        for field in fields(AdapterManifestEntry):
+            value = getattr(e, field.name)
+            literal = repr(value) if value is None or isinstance(value, bool) else json.dumps(value, ensure_ascii=False)
+            lines.append(f"        {field.name}={literal},")
+        lines.append("    ),")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    print(render_manifest(build_manifest()), end="")
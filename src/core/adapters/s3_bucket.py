@@ -2,6 +2,7 @@ from typing import Iterable, List, Dict
 from botocore.exceptions import ClientError
 from boto3.session import Session
 from .base import BaseTagAdapter
+from ..bucket_regions import bucket_regions
 from ..models import TagSet, TagRunResult
 from ..arn import Arn
 
@@ -10,10 +11,33 @@ class S3BucketTagAdapter(BaseTagAdapter):
     service = "s3"
     resource_type = "bucket"
     pretty_name = "S3 Bucket"
+    tagging_api_type = "s3"
+    # O resource do ARN é o próprio nome do bucket: sem prefixo fixo.
+    arn_resource_prefix = None
 
     def __init__(self, arn: Arn, session: Session) -> None:
         super().__init__(arn, session)
-        self.client = self.session.client("s3")
+        self.client = self._regional_client()
+
+    def _regional_client(self):
+        """
+        Client S3 da região do bucket. Com o pool dos engines, a região vem do
+        resolver (list_buckets/HeadBucket) e o client do pool dessa região;
+        com uma Session simples, fica o client da região da sessão.
+        """
+        for_region = getattr(self.session, "for_region", None)
+        if for_region is None:
+            return self.session.client("s3")
+
+        region = bucket_regions.resolve(self._parse_bucket_name(), self.session.client("s3"))
+        return for_region(region).client("s3")
+
+    def tagging_api_region(self) -> str | None:
+        """
+        O ARN de S3 não traz região: a Tagging API precisa ser chamada na
+        região do bucket (já resolvida ao montar o client).
+        """
+        return bucket_regions.get(self._parse_bucket_name())
 
     def _parse_bucket_name(self) -> str:
         # arn:aws:s3:::bucket-name
@@ -34,7 +58,10 @@ class S3BucketTagAdapter(BaseTagAdapter):
 
         # list_buckets não tem paginação real, mas o paginator ainda protege contra mudanças de API
         for page in paginator.paginate():
-            for b in page.get("Buckets", []):
+            buckets = page.get("Buckets", [])
+            # a listagem já diz a região de cada bucket: evita HeadBucket depois
+            bucket_regions.remember((b["Name"], b.get("BucketRegion")) for b in buckets)
+            for b in buckets:
                 yield Arn.parse(b["BucketArn"])
 
     def get_current_tags(self) -> Dict[str, str]:
@@ -72,12 +99,14 @@ class S3BucketTagAdapter(BaseTagAdapter):
     ) -> TagRunResult:
         bucket_name = self._parse_bucket_name()
         
-        desired_tags, existing_tags, final_tags = self._get_aws_tags(tagset, override)
+        desired_tags, existing_tags, final_tags, changed_tags = self._get_aws_tags(tagset, override)
         desired_map = self._aws_tags_to_dict(desired_tags)
         existing_map = self._aws_tags_to_dict(existing_tags)
         final_map = self._aws_tags_to_dict(final_tags)
 
-        if not dry_run:
+        # PutBucketTagging substitui o TagSet inteiro, então enviamos o estado
+        # final completo; sem delta, não há escrita.
+        if not dry_run and changed_tags:
             self.client.put_bucket_tagging(
                 Bucket=bucket_name,
                 Tagging={"TagSet": final_tags},
@@ -1,9 +1,9 @@
 # import re
 
-from typing import List, Dict
+from typing import Dict, Iterable, List
 from boto3.session import Session
 
-from .base import BaseTagAdapter
+from .base import BaseTagAdapter, ListedResource
 from ..models import TagSet, TagRunResult
 from ..arn import Arn
 
@@ -11,6 +11,9 @@ from ..arn import Arn
 class SecretsManagerSecretTagAdapter(BaseTagAdapter):
     service = "secretsmanager"
     pretty_name = "Secrets Manager Secret"
+    tagging_api_type = "secretsmanager:secret"
+    arn_resource_prefix = "secret:"
+    lists_with_tags = True
 
     # _SECRET_SUFFIX_RE = re.compile(r"^(?P<base>.+)-[A-Za-z0-9]{6}$")
 
@@ -19,6 +22,20 @@ class SecretsManagerSecretTagAdapter(BaseTagAdapter):
         # arn:aws:secretsmanager:region:account:secret:NAME-SUFFIX
         return arn.service == "secretsmanager" and arn.resource.startswith("secret:")
 
+    @classmethod
+    def list_resources(cls, session: Session) -> Iterable[ListedResource]:
+        """
+        list_secrets já devolve as tags de cada secret: nada de
+        describe_secret por recurso no scan.
+        """
+        client = session.client("secretsmanager")
+        paginator = client.get_paginator("list_secrets")
+
+        for page in paginator.paginate():
+            for secret in page.get("SecretList", []):
+                tags = {t["Key"]: t["Value"] for t in secret.get("Tags", [])}
+                yield ListedResource(arn=Arn.parse(secret["ARN"]), tags=tags)
+
     def __init__(self, arn: Arn, session: Session) -> None:
         super().__init__(arn, session)
         self.client = self.session.client("secretsmanager")
@@ -69,16 +86,16 @@ class SecretsManagerSecretTagAdapter(BaseTagAdapter):
         # secret_id = self._secret_name()
 
         # desired_tags, existing_tags, final_tags já vêm em formato AWS [{Key,Value}]
-        desired_tags, existing_tags, final_tags = self._get_aws_tags(tagset, override)
+        desired_tags, existing_tags, final_tags, changed_tags = self._get_aws_tags(tagset, override)
         desired_map = self._aws_tags_to_dict(desired_tags)
         existing_map = self._aws_tags_to_dict(existing_tags)
         final_map = self._aws_tags_to_dict(final_tags)
 
-        if not dry_run:
-            # API para tagging Secrets Manager:
+        if not dry_run and changed_tags:
+            # API para tagging Secrets Manager (aditiva: só o delta):
             self.client.tag_resource(
                 SecretId=self.arn.raw,
-                Tags=final_tags,
+                Tags=changed_tags,
             )
 
         return TagRunResult(
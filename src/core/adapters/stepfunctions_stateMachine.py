@@ -9,6 +9,8 @@ from ..arn import Arn
 class StepFunctionsStateMachineTagAdapter(BaseTagAdapter):
     service = "states"
     pretty_name = "Step Functions State Machine"
+    tagging_api_type = "states:stateMachine"
+    arn_resource_prefix = "stateMachine:"
 
     @classmethod
     def supports(cls, arn: Arn) -> bool:
@@ -66,14 +68,15 @@ class StepFunctionsStateMachineTagAdapter(BaseTagAdapter):
         resource_arn = self.arn.raw
 
         # desired_tags, existing_tags, final_tags sempre em formato [{Key, Value}]
-        desired_tags, existing_tags, final_tags = self._get_aws_tags(tagset, override)
+        desired_tags, existing_tags, final_tags, changed_tags = self._get_aws_tags(tagset, override)
         desired_map = self._aws_tags_to_dict(desired_tags)
         existing_map = self._aws_tags_to_dict(existing_tags)
         final_map = self._aws_tags_to_dict(final_tags)
 
-        if not dry_run:
+        # TagResource é aditivo: só enviamos o delta, e nada quando já está conforme
+        if not dry_run and changed_tags:
             # Converte para o formato que a API de Step Functions espera
-            sf_tags = self._to_stepfunctions_format(final_tags)
+            sf_tags = self._to_stepfunctions_format(changed_tags)
 
             self.client.tag_resource(
                 resourceArn=resource_arn,
@@ -0,0 +1,139 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from .cache import cache_dir
+
+
+# Tempo (s) que o mapa bucket -> região fica válido no cache em disco,
+# lido da variável de ambiente. Sem ela, o cache fica só em memória.
+BUCKET_REGION_CACHE_TTL_ENV = "TAGO_S3_REGION_CACHE_TTL"
+BUCKET_REGION_CACHE_FILE = "s3-bucket-regions.json"
+
+
+def _bucket_region_cache_ttl() -> int:
+    try:
+        return max(int(os.environ.get(BUCKET_REGION_CACHE_TTL_ENV, "0")), 0)
+    except ValueError:
+        return 0
+
+
+class BucketRegionResolver:
+    """
+    Mapa bucket -> região, para rotear cada bucket ao client da sua região
+    (ARNs de S3 não trazem região; usar o client errado custa redirects).
+
+    Nomes de bucket são únicos na partição, então o mapa vale para o
+    processo inteiro. É preenchido pelo list_buckets (BucketRegion) ou, sob
+    demanda, por HeadBucket; com TAGO_S3_REGION_CACHE_TTL, também persiste
+    em disco entre execuções.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self._path = path
+        self._regions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        # serializa as regravações do arquivo entre as threads do engine
+        self._disk_lock = threading.Lock()
+        self._disk_loaded = False
+
+    @property
+    def path(self) -> Path:
+        return self._path or cache_dir() / BUCKET_REGION_CACHE_FILE
+
+    def _load_disk(self, ttl: int) -> None:
+        # chamado sob o lock
+        if self._disk_loaded:
+            return
+        self._disk_loaded = True
+
+        now = time.time()
+        for bucket, (region, stored_at) in self._read_disk().items():
+            if now - stored_at <= ttl:
+                self._regions.setdefault(bucket, region)
+
+    def _read_disk(self) -> Dict[str, Tuple[str, float]]:
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+            return {
+                str(bucket): (str(entry[0]), float(entry[1]))
+                for bucket, entry in entries.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError, IndexError):
+            return {}
+
+    def _write_disk(self, regions: Dict[str, str], ttl: int) -> None:
+        path = self.path
+        now = time.time()
+
+        # mantém as entradas válidas de outras contas/execuções
+        entries = {
+            bucket: [region, stored_at]
+            for bucket, (region, stored_at) in self._read_disk().items()
+            if now - stored_at <= ttl
+        }
+        entries.update({bucket: [region, now] for bucket, region in regions.items()})
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(entries), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            # cache é só otimização: falha de escrita não interrompe o comando
+            pass
+
+    def get(self, bucket: str) -> Optional[str]:
+        ttl = _bucket_region_cache_ttl()
+        with self._lock:
+            if bucket not in self._regions and ttl:
+                self._load_disk(ttl)
+            return self._regions.get(bucket)
+
+    def remember(self, regions: Iterable[Tuple[str, str]]) -> None:
+        """
+        Registra pares (bucket, região) já conhecidos (ex.: do list_buckets).
+        """
+        new = {bucket: region for bucket, region in regions if region}
+        if not new:
+            return
+
+        with self._lock:
+            changed = {b: r for b, r in new.items() if self._regions.get(b) != r}
+            self._regions.update(new)
+
+        ttl = _bucket_region_cache_ttl()
+        if changed and ttl:
+            with self._disk_lock:
+                self._write_disk(changed, ttl)
+
+    def resolve(self, bucket: str, client: Any) -> Optional[str]:
+        """
+        Região do bucket, pelo cache ou por HeadBucket (com `client` de
+        qualquer região). None se não der para descobrir.
+        """
+        region = self.get(bucket)
+        if region is not None:
+            return region
+
+        try:
+            resp = client.head_bucket(Bucket=bucket)
+        except ClientError as e:
+            # 301/403 ainda trazem a região no header
+            resp = e.response
+
+        region = resp.get("BucketRegion") or (
+            resp.get("ResponseMetadata", {}).get("HTTPHeaders", {}).get("x-amz-bucket-region")
+        )
+        if region:
+            self.remember([(bucket, region)])
+        return region
+
+
+# Compartilhado pelo processo: nomes de bucket são globais na partição.
+bucket_regions = BucketRegionResolver()
@@ -0,0 +1,10 @@
+import os
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """
+    Diretório de cache local do Tago: $XDG_CACHE_HOME/tago (default ~/.cache/tago).
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "tago"
@@ -0,0 +1,125 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from botocore.config import Config
+from boto3.session import Session
+
+
+# Default do botocore para o pool HTTP de cada client.
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+
+class ClientPool:
+    """
+    Pool thread-safe de clients boto3, compartilhado por todos os adapters de
+    uma execução.
+
+    Cada client é criado uma única vez por (serviço, região, credenciais) e
+    reaproveitado entre recursos, o que evita recarregar os service models e
+    reabrir conexões TCP/TLS a cada ARN.
+
+    Expõe a mesma interface `client(service_name)` de uma Session, então pode
+    ser passado no lugar dela para os adapters e para `list_resources`.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+    ) -> None:
+        self.session = session
+        # O pool HTTP de cada client acompanha a concorrência do engine,
+        # senão as threads ficam disputando conexões.
+        self.max_pool_connections = max(max_pool_connections, DEFAULT_MAX_POOL_CONNECTIONS)
+        self._clients: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+        self._lock = threading.Lock()
+        # as credenciais da sessão já foram resolvidas uma vez (sob o lock)
+        self._credentials_loaded = False
+
+    @property
+    def region_name(self) -> Optional[str]:
+        return getattr(self.session, "region_name", None)
+
+    @property
+    def profile_name(self) -> Optional[str]:
+        return getattr(self.session, "profile_name", None)
+
+    def _credentials_key(self) -> Optional[str]:
+        """
+        Identifica as credenciais da sessão pelo access key id (nunca pelo secret).
+
+        A primeira resolução (a cadeia de providers da Session, que não é
+        thread-safe) acontece sob o lock; depois a Session só devolve o objeto
+        de credenciais já carregado, que o botocore renova de forma
+        thread-safe, então as chamadas seguintes não disputam o lock do pool.
+        """
+        if not self._credentials_loaded:
+            with self._lock:
+                key = self._read_credentials_key()
+                self._credentials_loaded = True
+            return key
+        return self._read_credentials_key()
+
+    def _read_credentials_key(self) -> Optional[str]:
+        get_credentials = getattr(self.session, "get_credentials", None)
+        credentials = get_credentials() if get_credentials else None
+        if credentials is None:
+            return None
+        return credentials.get_frozen_credentials().access_key
+
+    def client(self, service_name: str, region_name: Optional[str] = None) -> Any:
+        """
+        Devolve o client do serviço/região, criando-o na primeira chamada.
+        Sem region_name, usa a região default da sessão.
+        """
+        region = region_name or self.region_name
+        key = (service_name, region, self._credentials_key())
+
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        # Session não é thread-safe: a criação do client acontece sob o lock.
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self.session.client(
+                    service_name,
+                    region_name=region,
+                    config=Config(max_pool_connections=self.max_pool_connections),
+                )
+                self._clients[key] = client
+
+        return client
+
+    def for_region(self, region_name: Optional[str]) -> "ClientPool | RegionalClientPool":
+        """
+        Visão do pool presa a uma região, para adapters de ARNs regionais.
+
+        ARNs sem região (serviços globais como IAM, ou S3) usam o próprio pool,
+        compartilhando o client da região default.
+        """
+        if not region_name or region_name == self.region_name:
+            return self
+        return RegionalClientPool(self, region_name)
+
+
+class RegionalClientPool:
+    """
+    Visão de um ClientPool com outra região default. Os clients continuam
+    vindo (e sendo compartilhados) do pool de origem.
+    """
+
+    def __init__(self, pool: ClientPool, region_name: str) -> None:
+        self.pool = pool
+        self.region_name = region_name
+
+    @property
+    def profile_name(self) -> Optional[str]:
+        return self.pool.profile_name
+
+    def client(self, service_name: str, region_name: Optional[str] = None) -> Any:
+        return self.pool.client(service_name, region_name=region_name or self.region_name)
+
+    def for_region(self, region_name: Optional[str]) -> "ClientPool | RegionalClientPool":
+        return self.pool.for_region(region_name)
@@ -0,0 +1,5 @@
+# Constantes leves dos engines: o CLI as importa no startup, sem puxar
+# boto3/jinja2 dos módulos de engine.
+
+# Modos de verificação pós-escrita do tag (--verify).
+VERIFY_MODES = ("full", "sample", "none")
@@ -1,15 +1,105 @@
-import boto3
+import hashlib
+import json
+import os
 import sys
-from botocore.exceptions import BotoCoreError, ClientError
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import asdict, dataclass
 from functools import wraps
-from typing import Any, Callable, Optional, TypeVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, TypeVar
 
 
+from ..cache import cache_dir
 from ..models import AwsIdentity, AwsIdentityError
 
+if TYPE_CHECKING:
+    from boto3.session import Session
+
 T = TypeVar("T", bound=Callable[..., Any])
 
+# Cache em disco da identidade validada: TTL em segundos via variável de
+# ambiente (ex.: TAGO_IDENTITY_CACHE_TTL=300). Sem ela, o cache fica desligado.
+IDENTITY_CACHE_TTL_ENV = "TAGO_IDENTITY_CACHE_TTL"
+IDENTITY_CACHE_FILE = "identity.json"
+
+# Sessions já validadas nesta execução, por (profile, region): o engine
+# reaproveita a mesma Session ao invés de criar outra.
+_validated_sessions: Dict[Tuple[Optional[str], Optional[str]], "Session"] = {}
+_sessions_lock = threading.Lock()
+
+
+def _identity_cache_ttl() -> int:
+    try:
+        return max(int(os.environ.get(IDENTITY_CACHE_TTL_ENV, "0")), 0)
+    except ValueError:
+        return 0
+
+
+def _identity_cache_path() -> Path:
+    return cache_dir() / IDENTITY_CACHE_FILE
+
+
+def _credentials_fingerprint(
+    session: "Session",
+    profile: Optional[str],
+    region: Optional[str],
+) -> Optional[str]:
+    """
+    Chave do cache: hash de profile/region + credenciais resolvidas. Trocar
+    de credencial (ex.: novo login SSO) muda a chave; nada sensível é gravado.
+    """
+    credentials = session.get_credentials()
+    if credentials is None:
+        return None
+
+    frozen = credentials.get_frozen_credentials()
+    raw = "\0".join(
+        [profile or "", region or "", frozen.access_key or "", frozen.secret_key or "", frozen.token or ""]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _read_identity_cache(key: str) -> Optional[AwsIdentity]:
+    try:
+        entries = json.loads(_identity_cache_path().read_text(encoding="utf-8"))
+        entry = entries[key]
+        if entry["expires_at"] <= time.time():
+            return None
+        return AwsIdentity(**entry["identity"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_identity_cache(key: str, identity: AwsIdentity, ttl: int) -> None:
+    path = _identity_cache_path()
+    now = time.time()
+
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(entries, dict):
+            entries = {}
+    except (OSError, ValueError):
+        entries = {}
+
+    # descarta entradas vencidas para o arquivo não crescer indefinidamente
+    entries = {
+        k: v for k, v in entries.items()
+        if isinstance(v, dict) and v.get("expires_at", 0) > now
+    }
+    entries[key] = {"expires_at": now + ttl, "identity": asdict(identity)}
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entries), encoding="utf-8")
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, path)
+    except OSError:
+        # cache é só otimização: falha de escrita não interrompe o comando
+        pass
+
+
 def get_current_aws_identity(
     profile: Optional[str] = None,
     region: Optional[str] = None,
@@ -17,11 +107,34 @@ def get_current_aws_identity(
     """
     Tenta descobrir a identidade AWS atual usando STS (Security Token Service),
     respeitando profile/region passados explicitamente (se houver).
+
+    A Session validada fica disponível via get_validated_session(). Com
+    TAGO_IDENTITY_CACHE_TTL definido, a identidade é reaproveitada do cache em
+    disco (por profile/region/credenciais) sem chamar o STS.
     """
+    # Import tardio: este módulo é carregado pelo CLI no startup (decorator),
+    # e boto3 só é necessário quando um comando realmente roda.
+    import boto3.session
+    from botocore.exceptions import BotoCoreError, ClientError
+
     session = boto3.session.Session(
         profile_name=profile,
         region_name=region,
     )
+
+    ttl = _identity_cache_ttl()
+    cache_key = None
+    if ttl:
+        try:
+            cache_key = _credentials_fingerprint(session, profile, region)
+        except (BotoCoreError, ClientError) as e:
+            raise AwsIdentityError(f"Não foi possível obter a identidade AWS atual: {e}") from e
+
+        cached = _read_identity_cache(cache_key) if cache_key else None
+        if cached is not None:
+            _remember_session(profile, region, session)
+            return cached
+
     sts = session.client("sts")
 
     try:
@@ -29,7 +142,7 @@ def get_current_aws_identity(
     except (BotoCoreError, ClientError) as e:
         raise AwsIdentityError(f"Não foi possível obter a identidade AWS atual: {e}") from e
 
-    return AwsIdentity(
+    identity = AwsIdentity(
         account=resp["Account"],
         arn=resp["Arn"],
         user_id=resp["UserId"],
@@ -37,6 +150,30 @@ def get_current_aws_identity(
         profile=session.profile_name,
     )
 
+    if cache_key:
+        _write_identity_cache(cache_key, identity, ttl)
+
+    _remember_session(profile, region, session)
+    return identity
+
+
+def _remember_session(profile: Optional[str], region: Optional[str], session: "Session") -> None:
+    with _sessions_lock:
+        _validated_sessions[(profile, region)] = session
+
+
+def get_validated_session(
+    profile: Optional[str] = None,
+    region: Optional[str] = None,
+) -> Optional["Session"]:
+    """
+    Session já validada por get_current_aws_identity para profile/region,
+    ou None se a identidade ainda não foi verificada nesta execução.
+    """
+    with _sessions_lock:
+        return _validated_sessions.get((profile, region))
+
+
 def requires_aws_identity(func: T) -> T:
     @wraps(func)
     def wrapper(*args, **kwargs):
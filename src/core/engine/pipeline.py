@@ -0,0 +1,101 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+# Itens em voo por worker (fila do lister + leituras pendentes).
+PIPELINE_DEPTH_PER_WORKER = 4
+
+# Intervalo (s) em que o lister bloqueado confere se o consumidor desistiu.
+_PUT_POLL_SECONDS = 0.1
+
+
+class _Done:
+    pass
+
+
+class _Failure:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+_DONE = _Done()
+
+
+def pipelined_map(
+    fn: Callable[[T], R],
+    source: Iterable[T],
+    *,
+    concurrency: int = 1,
+    depth: Optional[int] = None,
+) -> Iterator[R]:
+    """
+    Pipeline em três estágios, preservando a ordem de `source`:
+
+    - lister: uma thread consome `source` (ex.: list_resources paginado) e
+      alimenta uma fila limitada;
+    - readers: um pool de `concurrency` threads aplica `fn` em cada item;
+    - agregador: quem consome o iterador recebe os resultados em ordem.
+
+    A fila e o número de leituras pendentes são limitados a `depth` (default
+    concurrency * PIPELINE_DEPTH_PER_WORKER): se o agregador atrasa, readers
+    e lister ficam bloqueados (backpressure) e a memória não cresce com o
+    tamanho da listagem.
+
+    Erros do lister ou de `fn` são relançados no consumidor.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency deve ser >= 1.")
+
+    depth = depth or concurrency * PIPELINE_DEPTH_PER_WORKER
+    items: "queue.Queue[object]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in source:
+                if not _put(item):
+                    return
+        except BaseException as exc:  # repassa para o consumidor
+            _put(_Failure(exc))
+            return
+        _put(_DONE)
+
+    lister = threading.Thread(target=_produce, name="tago-pipeline-lister", daemon=True)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="tago-pipeline-reader")
+    pending: Deque[Future] = deque()
+
+    lister.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _Failure):
+                raise item.exc
+
+            pending.append(executor.submit(fn, item))  # type: ignore[arg-type]
+            if len(pending) >= depth:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # consumidor terminou (ou desistiu): libera o lister e descarta o resto
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        lister.join()
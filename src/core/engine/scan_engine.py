@@ -1,16 +1,27 @@
 # tago/scan_service.py
 from __future__ import annotations
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Iterable, Set
+from typing import Any, Dict, List, Iterable, Iterator, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from ..template_engine import load_template
+from ..template_engine import compile_template
 
 from boto3.session import Session
+from botocore.exceptions import BotoCoreError, ClientError
 import yaml
 
 from ..arn import Arn
+from ..clients import ClientPool
+from ..inventory import Inventory
 from ..models import ScanReport, ScanResourceReport
-from ..adapters import get_adapters_for_service
+from ..report_writer import ScanReportWriter
+from ..rules import RuleTable
+from ..adapters import get_adapters_for_service, get_listing_adapters
+from ..adapters.base import BaseTagAdapter, ListedResource
+from .pipeline import pipelined_map
+from .tagging_api import get_tags_by_type
 
 
 def _extract_required_keys(template_dict: Dict) -> Set[str]:
@@ -52,37 +63,130 @@ def _extract_tag_keys(raw_tags: Any) -> Set[str]:
     # Se chegar aqui, formato desconhecido
     raise TypeError(f"Formato de tags não suportado: {type(raw_tags)!r}")
 
-def scan_resources(
-    service: str,
-    service_type: str | None,
-    template_path: str,
-    profile: str,
-    region: str,
-) -> ScanReport:
-    session = Session(profile_name=profile, region_name=region)
 
-    template_dict = load_template(template_path)
-    required_keys = _extract_required_keys(template_dict)
-    
-    adapter_cls = get_adapters_for_service(service, service_type)
+def _tags_to_dict(raw_tags: Any) -> Dict[str, str]:
+    """
+    Normaliza os mesmos formatos de _extract_tag_keys para {Key: Value},
+    que é como as tags ficam no inventário.
+    """
+    if not raw_tags:
+        return {}
 
-    resources: List[ScanResourceReport] = []
+    if isinstance(raw_tags, dict):
+        return dict(raw_tags)
+
+    raw_list = list(raw_tags)
+    if isinstance(raw_list[0], dict) and "Key" in raw_list[0]:
+        return {t["Key"]: t["Value"] for t in raw_list}
+    if hasattr(raw_list[0], "key"):
+        return {t.key: t.value for t in raw_list}
+
+    raise TypeError(f"Formato de tags não suportado: {type(raw_tags)!r}")
+
+class _SummaryCounter:
+    """
+    Summary do scan calculado conforme os recursos passam, sem guardá-los.
+    """
+
+    __slots__ = ("total", "non_compliant")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.non_compliant = 0
 
-    # garante que o adapter sabe se listar
-    if not hasattr(adapter_cls, "list_resources"):
+    def add(self, resource: ScanResourceReport) -> None:
+        self.total += 1
+        if resource.status == "non_compliant":
+            self.non_compliant += 1
+
+    def merge(self, other: "_SummaryCounter") -> None:
+        self.total += other.total
+        self.non_compliant += other.non_compliant
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "total_resources": self.total,
+            "compliant": self.total - self.non_compliant,
+            "non_compliant": self.non_compliant,
+        }
+
+
+def _iter_adapter_resources(
+    adapter_cls: type[BaseTagAdapter],
+    pool: ClientPool,
+    required_keys: Set[str],
+    *,
+    use_tagging_api: bool,
+    concurrency: int,
+    inventory: Optional[Inventory] = None,
+    refresh_older_than: Optional[float] = None,
+    rules: Optional[RuleTable] = None,
+) -> Iterator[ScanResourceReport]:
+    """
+    Lista os recursos de um adapter e produz o ScanResourceReport de cada um,
+    conforme a agregação avança.
+
+    Com inventário, entradas lidas há no máximo refresh_older_than segundos
+    são usadas sem ir à AWS; o resto é relido e gravado de volta.
+
+    Itens ListedResource (tags já devolvidas pela listagem) não geram
+    leitura por recurso.
+
+    Com `rules` (seção rules: do template), os valores das tags também são
+    validados e as violações vão para o ScanResourceReport.
+    """
+    now = time.time()
+
+    # garante que o adapter sabe se listar: o BaseTagAdapter define
+    # list_resources, então o que conta é o adapter sobrescrevê-lo
+    list_resources = getattr(adapter_cls, "list_resources", None)
+    if list_resources is None or getattr(list_resources, "__func__", None) is BaseTagAdapter.list_resources.__func__:
         raise NotImplementedError(f"Adapter {adapter_cls.__name__} does not support listing resources.")
 
-    for arn in adapter_cls.list_resources(session=session):
-        adapter = adapter_cls(arn=arn, session=session)
+    snapshot: Dict[str, Dict[str, str]] | None = None
+    # adapters que listam já com as tags dispensam o snapshot (GetResources)
+    if use_tagging_api and adapter_cls.tagging_api_type and not getattr(adapter_cls, "lists_with_tags", False):
+        snapshot = get_tags_by_type(pool, adapter_cls.tagging_api_type)
+
+    def _read_tags(item: Arn | ListedResource) -> tuple[Arn, Any, bool]:
+        # tags que vieram na própria listagem: nenhuma leitura extra
+        if isinstance(item, ListedResource):
+            return item.arn, item.tags, True
 
-        # aqui uso o que você já tem pra pegar tags atuais
-        aws_tags = adapter.get_current_tags()  # List[Dict[Key, Value]] ou List[Tag]
+        arn = item
+        if inventory is not None and refresh_older_than is not None:
+            entry = inventory.get(getattr(arn, "raw", None) or str(arn))
+            if entry is not None and entry.is_fresh(refresh_older_than, now):
+                return arn, entry.tags, False
 
-        existing_keys = _extract_tag_keys(aws_tags)
+        aws_tags = None
+        if snapshot is not None:
+            aws_tags = snapshot.get(adapter_cls.tagging_api_arn(arn))
+            # Ausente do snapshot = sem tags, desde que o recurso seja da
+            # região consultada. ARNs sem região (ex.: S3) ou de outra região
+            # não são conclusivos e caem na leitura individual.
+            if aws_tags is None and arn.region and arn.region == pool.region_name:
+                aws_tags = {}
+
+        if aws_tags is None:
+            adapter = adapter_cls(arn=arn, session=pool)
+
+            # aqui uso o que você já tem pra pegar tags atuais
+            aws_tags = adapter.get_current_tags()  # List[Dict[Key, Value]] ou List[Tag]
+
+        return arn, aws_tags, True
+
+    listed = adapter_cls.list_resources(session=pool)
+    for arn, aws_tags, fetched in pipelined_map(_read_tags, listed, concurrency=concurrency):
+        # o dict normalizado só é montado quando alguém usa os valores
+        tag_map = _tags_to_dict(aws_tags) if rules or inventory is not None else None
+
+        existing_keys = set(tag_map) if tag_map is not None else _extract_tag_keys(aws_tags)
 
         missing = sorted(required_keys - existing_keys)
+        violations = rules.evaluate(tag_map) if rules and tag_map is not None else []
 
-        if missing:
+        if missing or violations:
             status = "non_compliant"
         else:
             status = "compliant"
@@ -90,28 +194,203 @@ def scan_resources(
         name = getattr(arn, "resource", None) or str(arn)  # adapta ao seu Arn
         arn_str = getattr(arn, "raw", None) or str(arn)  # adapta ao seu Arn
 
-        resources.append(
-            ScanResourceReport(
-                name=name,
-                arn=arn_str,
-                adapter=adapter_cls.__name__,
-                status=status,
-                missing_tags=missing,
-            )
+        if inventory is not None:
+            if fetched:
+                inventory.record_tags(arn_str, adapter_cls.__name__, tag_map or {}, now)
+            else:
+                inventory.record_seen(arn_str, adapter_cls.__name__, now)
+
+        yield ScanResourceReport(
+            name=name,
+            arn=arn_str,
+            adapter=adapter_cls.__name__,
+            status=status,
+            missing_tags=missing,
+            violations=violations,
         )
 
-    total = len(resources)
-    non_compliant = sum(1 for r in resources if r.status == "non_compliant")
-    compliant = total - non_compliant
+    if inventory is not None:
+        inventory.commit()
 
-    return ScanReport(
+
+def scan_resources(
+    service: str,
+    service_type: str | None,
+    template_path: str,
+    profile: str,
+    region: str,
+    use_tagging_api: bool = False,
+    session: Session | None = None,
+    concurrency: int = 1,
+    inventory: Inventory | None = None,
+    refresh_older_than: float | None = None,
+    writer: ScanReportWriter | None = None,
+) -> ScanReport:
+    """
+    Lista os recursos do adapter do serviço e compara as tags atuais com as
+    chaves exigidas pelo template e com as regras de valor (rules:).
+
+    Com use_tagging_api=True, as tags vêm de um snapshot paginado da
+    Resource Groups Tagging API (GetResources) ao invés de uma leitura por
+    recurso; adapters sem tagging_api_type continuam lendo recurso a recurso.
+
+    A listagem, a leitura das tags (por `concurrency` threads) e a agregação
+    rodam em pipeline (ver pipelined_map), com fila limitada entre os estágios.
+
+    Com `inventory`, os recursos listados e suas tags são gravados no
+    inventário local; com `refresh_older_than` (segundos), as tags lidas
+    há menos tempo que isso vêm do inventário, e só o resto vai à AWS.
+
+    Com `writer`, o relatório é escrito em streaming (cabeçalho, recursos
+    conforme são lidos, summary) e os recursos não ficam em memória: o
+    ScanReport devolvido traz só cabeçalho e summary.
+
+    session: Session já validada (ex.: pelo CLI); se omitida, uma nova é criada.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency deve ser >= 1.")
+
+    # Reaproveita a Session já validada pelo CLI (requires_aws_identity)
+    if session is None:
+        session = Session(profile_name=profile, region_name=region)
+    pool = ClientPool(session, max_pool_connections=concurrency)
+
+    template = compile_template(template_path)
+    required_keys = _extract_required_keys(template.template)
+    
+    adapter_cls = get_adapters_for_service(service, service_type)
+
+    checked_at = datetime.now(timezone.utc).isoformat()
+    if writer is not None:
+        writer.begin(service, service_type, checked_at)
+
+    counter = _SummaryCounter()
+    resources: List[ScanResourceReport] = []
+
+    for resource in _iter_adapter_resources(
+        adapter_cls,
+        pool,
+        required_keys,
+        use_tagging_api=use_tagging_api,
+        concurrency=concurrency,
+        inventory=inventory,
+        refresh_older_than=refresh_older_than,
+        rules=template.rules,
+    ):
+        counter.add(resource)
+        if writer is not None:
+            writer.write_resource(resource)
+        else:
+            resources.append(resource)
+
+    report = ScanReport(
         service=service,
         service_type=service_type,
-        checked_at=datetime.now(timezone.utc).isoformat(),
-        summary={
-            "total_resources": total,
-            "compliant": compliant,
-            "non_compliant": non_compliant,
-        },
+        checked_at=checked_at,
+        summary=counter.as_dict(),
         resources=resources,
     )
+
+    if writer is not None:
+        writer.finish(report.summary)
+
+    return report
+
+
+def scan_all_resources(
+    template_path: str,
+    profile: str | None,
+    region: str | None,
+    use_tagging_api: bool = False,
+    session: Session | None = None,
+    concurrency: int = 1,
+    inventory: Inventory | None = None,
+    refresh_older_than: float | None = None,
+    writer: ScanReportWriter | None = None,
+) -> ScanReport:
+    """
+    Varre todos os adapters que implementam list_resources, em paralelo (um
+    worker por adapter, cada um com `concurrency` leitores), compartilhando
+    Session, pool de clients e template compilado.
+
+    Devolve um único ScanReport (service="all") com o summary geral e um
+    summary por adapter. Falha de AWS em um adapter (ex.: sem permissão no
+    serviço) vai para o summary dele, sem derrubar os demais (os recursos
+    lidos até a falha continuam no relatório).
+
+    Com `writer`, os recursos são escritos conforme cada adapter os produz
+    (intercalados entre adapters) e não ficam em memória; sem ele, o
+    relatório segue a ordem dos adapters.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency deve ser >= 1.")
+
+    if session is None:
+        session = Session(profile_name=profile, region_name=region)
+    pool = ClientPool(session, max_pool_connections=concurrency)
+
+    template = compile_template(template_path)
+    required_keys = _extract_required_keys(template.template)
+
+    adapters = get_listing_adapters()
+
+    checked_at = datetime.now(timezone.utc).isoformat()
+    if writer is not None:
+        writer.begin("all", None, checked_at)
+    # o writer não é thread-safe: os workers dos adapters revezam nele
+    writer_lock = threading.Lock()
+
+    def _scan(
+        adapter_cls: type[BaseTagAdapter],
+    ) -> tuple[List[ScanResourceReport], _SummaryCounter, Optional[str]]:
+        counter = _SummaryCounter()
+        collected: List[ScanResourceReport] = []
+        try:
+            for resource in _iter_adapter_resources(
+                adapter_cls,
+                pool,
+                required_keys,
+                use_tagging_api=use_tagging_api,
+                concurrency=concurrency,
+                inventory=inventory,
+                refresh_older_than=refresh_older_than,
+                rules=template.rules,
+            ):
+                counter.add(resource)
+                if writer is not None:
+                    with writer_lock:
+                        writer.write_resource(resource)
+                else:
+                    collected.append(resource)
+        except (BotoCoreError, ClientError) as e:
+            return collected, counter, str(e)
+        return collected, counter, None
+
+    total = _SummaryCounter()
+    resources: List[ScanResourceReport] = []
+    adapter_summaries: Dict[str, Dict[str, Any]] = {}
+
+    if adapters:
+        with ThreadPoolExecutor(max_workers=len(adapters)) as executor:
+            # executor.map preserva a ordem dos adapters
+            for adapter_cls, (adapter_resources, counter, error) in zip(adapters, executor.map(_scan, adapters)):
+                resources.extend(adapter_resources)
+                total.merge(counter)
+                adapter_summaries[adapter_cls.__name__] = {
+                    **counter.as_dict(),
+                    **({"error": error} if error else {}),
+                }
+
+    report = ScanReport(
+        service="all",
+        service_type=None,
+        checked_at=checked_at,
+        summary=total.as_dict(),
+        resources=resources,
+        adapter_summaries=adapter_summaries,
+    )
+
+    if writer is not None:
+        writer.finish(report.summary, report.adapter_summaries)
+
+    return report
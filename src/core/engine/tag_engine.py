@@ -1,53 +1,402 @@
+import itertools
+import math
+import random
 import time
 
-from typing import Dict, Any, Iterable, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Tuple, TypeVar
 from boto3.session import Session
+from botocore.exceptions import BotoCoreError, ClientError
 
 from ..arn import Arn
+from ..clients import ClientPool
+from ..inventory import Inventory
 from ..merge import build_tagset
+from ..template_engine import CompiledTemplate, compile_template
 from ..models import TagSet, TagRunResult
 from ..adapters import get_adapter_for_arn
+from ..adapters.base import BaseTagAdapter
+from . import VERIFY_MODES
+from .tagging_api import bulk_tag_resources, get_tags_for_arns, tagging_api_region
 
-def _read_tags_with_retry(
-    adapter,
-    expected_tagset: TagSet,
-    max_attempts: int = 5,
-    delay_seconds: float = 0.5,
-) -> Dict[str, str]:
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+# Agenda de backoff compartilhada pela fase de verificação (segundos entre rodadas).
+VERIFY_BACKOFF_SECONDS = (0.5, 1.0, 2.0, 4.0)
+
+# Modo "sample": verifica esta fração dos recursos escritos, com um mínimo absoluto.
+VERIFY_SAMPLE_RATIO = 0.1
+VERIFY_SAMPLE_MIN = 10
+
+# ARNs lidos, escritos e verificados por vez no modo streaming.
+STREAM_BATCH_SIZE = 500
+
+
+def _is_applied(result: TagRunResult, current: Dict[str, str]) -> bool:
     """
-    Lê as tags atuais do recurso com retry e backoff.
-    expected_tagset é um TagSet (não um dict).
+    True quando todas as tags escritas (o delta) já aparecem na leitura.
+    """
+    return all(current.get(k) == v for k, v in result.changed_tags.items())
+
 
-    - expected_tagset: TagSet com Tag(key, value)
-    - adapter.get_current_tags(): Dict[str, str]
-    - Retorna: Dict[str, str] com as tags lidas da AWS (ou último valor lido)
+def _select_for_verification(
+    pending: List[Tuple[BaseTagAdapter, TagRunResult]],
+    verify: str,
+) -> List[Tuple[BaseTagAdapter, TagRunResult]]:
+    if verify == "none":
+        return []
+    if verify == "sample" and len(pending) > VERIFY_SAMPLE_MIN:
+        size = max(VERIFY_SAMPLE_MIN, math.ceil(len(pending) * VERIFY_SAMPLE_RATIO))
+        return random.sample(pending, min(size, len(pending)))
+    return pending
+
+
+def _batch_api_size(adapter: BaseTagAdapter) -> int | None:
+    return getattr(type(adapter), "batch_api_size", None)
+
+
+def _group_for_batch_api(
+    items: Iterable[Tuple[BaseTagAdapter, T]],
+    key: Callable[[Tuple[BaseTagAdapter, T]], Any] = lambda item: None,
+) -> List[List[Tuple[BaseTagAdapter, T]]]:
     """
+    Agrupa itens de adapters com API em lote por (adapter, região, key(item))
+    e fatia cada grupo em lotes de até batch_api_size.
+    """
+    groups: Dict[Tuple[Any, ...], List[Tuple[BaseTagAdapter, T]]] = {}
+    for item in items:
+        adapter = item[0]
+        groups.setdefault((type(adapter), adapter.arn.region, key(item)), []).append(item)
 
-    # 1) extrai as chaves esperadas a partir do TagSet
-    expected_keys = {t.key for t in expected_tagset.tags}
+    chunks: List[List[Tuple[BaseTagAdapter, T]]] = []
+    for members in groups.values():
+        size = _batch_api_size(members[0][0]) or len(members)
+        chunks.extend(members[i : i + size] for i in range(0, len(members), size))
+    return chunks
 
-    last_tags: Dict[str, str] = {}
 
-    for attempt in range(1, max_attempts + 1):
-        # 2) lê as tags atuais do adapter (sempre dict[str, str])
-        current = adapter.get_current_tags() or {}
-        last_tags = current
+def _read_tags_batch(adapters: List[BaseTagAdapter]) -> Dict[str, Dict[str, str]] | None:
+    """
+    Leitura em lote pelo adapter; None se falhar (quem chama cai na leitura
+    individual, que já trata os erros recurso a recurso).
+    """
+    try:
+        snapshot = type(adapters[0]).read_tags_batch(adapters)
+    except (BotoCoreError, ClientError):
+        return None
+    return {adapter.arn.raw: snapshot.get(adapter.arn.raw, {}) for adapter in adapters}
 
-        current_keys = set(current.keys())
 
-        # 3) se todas as keys esperadas já aparecem, ou acabou o número de tentativas, devolve
-        if expected_keys.issubset(current_keys) or attempt == max_attempts:
-            return current
+def _read_current_tags(
+    outstanding: List[Tuple[BaseTagAdapter, TagRunResult]],
+    pool: ClientPool,
+    concurrency: int,
+    batch_reads: bool,
+) -> Dict[str, Dict[str, str]]:
+    """
+    Lê as tags atuais de todos os recursos pendentes, indexadas por ARN.
 
-        # 4) ainda não bateu, espera e tenta de novo (backoff exponencial)
-        time.sleep(delay_seconds)
-        delay_seconds *= 2
+    Com batch_reads, recursos cobertos pela Tagging API são lidos em lotes de
+    100 via GetResources. Adapters com API de leitura em lote (ex.: EC2) leem
+    um lote por chamada; os demais em paralelo pelo próprio adapter.
+    """
+    current: Dict[str, Dict[str, str]] = {}
+    individual: List[Tuple[BaseTagAdapter, TagRunResult]] = []
+    batchable: List[Tuple[BaseTagAdapter, TagRunResult]] = []
+    batches: Dict[str | None, List[Tuple[str, str]]] = {}
 
-    # Se nunca bater o subset, devolve a última leitura
-    return last_tags
+    for adapter, result in outstanding:
+        if batch_reads and adapter.tagging_api_type:
+            region = tagging_api_region(adapter, pool)
+            batches.setdefault(region, []).append((adapter.tagging_api_arn(adapter.arn), result.arn))
+        elif _batch_api_size(adapter):
+            batchable.append((adapter, result))
+        else:
+            individual.append((adapter, result))
 
+    chunks = _group_for_batch_api(batchable)
+    snapshots = _map(lambda chunk: _read_tags_batch([adapter for adapter, _ in chunk]), chunks, concurrency)
+    for chunk, snapshot in zip(chunks, snapshots):
+        if snapshot is None:
+            individual.extend(chunk)
+        else:
+            current.update(snapshot)
 
-def tag_resources(
+    for region, members in batches.items():
+        by_api_arn = dict(members)
+        snapshot = get_tags_for_arns(pool, list(by_api_arn.keys()), region)
+        for api_arn, raw_arn in by_api_arn.items():
+            # ausente do snapshot = recurso (ainda) sem tags no índice
+            current[raw_arn] = snapshot.get(api_arn, {})
+
+    def _read(item: Tuple[BaseTagAdapter, TagRunResult]) -> Tuple[str, Dict[str, str]]:
+        adapter, result = item
+        return result.arn, adapter.get_current_tags() or {}
+
+    current.update(_map(_read, individual, concurrency))
+    return current
+
+
+def _verify_results(
+    pending: List[Tuple[BaseTagAdapter, TagRunResult]],
+    pool: ClientPool,
+    *,
+    verify: str = "full",
+    concurrency: int = 1,
+    batch_reads: bool = False,
+) -> None:
+    """
+    Fase de verificação, executada depois de todas as escritas.
+
+    Todos os recursos pendentes são relidos juntos a cada rodada; os que ainda
+    não refletem o delta escrito esperam a próxima rodada da agenda de backoff
+    compartilhada (VERIFY_BACKOFF_SECONDS), ao invés de cada ARN dormir sozinho.
+    applied_tags recebe a última leitura de cada recurso verificado.
+
+    Se a leitura em lote (Tagging API, eventualmente consistente) não convergir,
+    os recursos restantes recebem uma última leitura direta pelo adapter.
+    """
+    outstanding = _select_for_verification(pending, verify)
+
+    for delay in (*VERIFY_BACKOFF_SECONDS, None):
+        if not outstanding:
+            return
+
+        current = _read_current_tags(outstanding, pool, concurrency, batch_reads)
+
+        still_outstanding = []
+        for adapter, result in outstanding:
+            result.applied_tags = current.get(result.arn, {})
+            if not _is_applied(result, result.applied_tags):
+                still_outstanding.append((adapter, result))
+        outstanding = still_outstanding
+
+        if delay is not None and outstanding:
+            time.sleep(delay)
+
+    if outstanding and batch_reads:
+        current = _read_current_tags(outstanding, pool, concurrency, batch_reads=False)
+        for _, result in outstanding:
+            result.applied_tags = current.get(result.arn, {})
+
+
+def _map(fn: Callable[[T], R], items: Iterable[T], concurrency: int) -> List[R]:
+    """
+    Aplica fn em todos os itens, em paralelo quando concurrency > 1,
+    preservando a ordem de entrada.
+    """
+    if concurrency == 1:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # executor.map preserva a ordem de entrada
+        return list(executor.map(fn, items))
+
+
+def _interleave_groups(arns: List[Arn]) -> List[int]:
+    """
+    Ordem de processamento (índices de `arns`) que alterna entre os grupos
+    (conta, região), para que os grupos avancem em paralelo no pool de
+    workers ao invés de uma região inteira ficar na fila atrás da outra.
+    """
+    groups: Dict[Tuple[str | None, str | None], List[int]] = {}
+    for i, arn in enumerate(arns):
+        groups.setdefault((arn.account_id, arn.region), []).append(i)
+
+    order: List[int] = []
+    for round_ in itertools.zip_longest(*groups.values()):
+        order.extend(i for i in round_ if i is not None)
+    return order
+
+
+def _build_adapter(
+    arn: Arn,
+    template: CompiledTemplate,
+    overrides: Dict[str, Any],
+    pool: ClientPool,
+) -> Tuple[BaseTagAdapter, TagSet]:
+    """
+    Resolve o adapter do ARN e renderiza o TagSet desejado para ele.
+
+    O adapter recebe o pool roteado para a região do próprio ARN; ARNs sem
+    região (IAM, S3) ficam com os clients da região default.
+    """
+    adapter_cls = get_adapter_for_arn(arn)
+
+    adapter = adapter_cls(arn, pool.for_region(arn.region))
+
+    adapter_ctx = adapter.get_context()  # ex: {"usage": "storage"}
+    ctx: Dict[str, Any] = {**adapter_ctx, **overrides}
+    return adapter, build_tagset(template, ctx)
+
+
+def _prefetch_batched_tags(
+    built: List[Tuple[BaseTagAdapter, TagSet]],
+    concurrency: int,
+) -> None:
+    """
+    Lê em lote as tags atuais dos recursos cujo adapter tem API em lote
+    (ex.: um describe_tags para até 200 instâncias EC2), antes do merge.
+    """
+    batchable = [item for item in built if _batch_api_size(item[0])]
+
+    def _read(chunk: List[Tuple[BaseTagAdapter, TagSet]]) -> None:
+        adapters = [adapter for adapter, _ in chunk]
+        snapshot = _read_tags_batch(adapters)
+        if snapshot is None:
+            return
+        for adapter in adapters:
+            adapter.prefetch_tags(snapshot[adapter.arn.raw])
+
+    _map(_read, _group_for_batch_api(batchable), concurrency)
+
+
+def _write_batched_tags(
+    planned: List[Tuple[BaseTagAdapter, TagRunResult]],
+    concurrency: int,
+) -> None:
+    """
+    Envia os deltas planejados agrupando os recursos com o mesmo delta numa
+    única escrita em lote (ex.: create_tags com várias instâncias).
+    Falhas vão para TagRunResult.error de todo o grupo.
+    """
+    changed = [(adapter, result) for adapter, result in planned if result.changed_tags]
+
+    def _write(chunk: List[Tuple[BaseTagAdapter, TagRunResult]]) -> None:
+        adapters = [adapter for adapter, _ in chunk]
+        try:
+            type(adapters[0]).write_tags_batch(adapters, chunk[0][1].changed_tags)
+        except (BotoCoreError, ClientError) as e:
+            for _, result in chunk:
+                result.error = str(e)
+
+    _map(
+        _write,
+        _group_for_batch_api(changed, key=lambda item: tuple(sorted(item[1].changed_tags.items()))),
+        concurrency,
+    )
+
+
+def _tag_resources(
+    built: List[Tuple[BaseTagAdapter, TagSet]],
+    dry_run: bool,
+    override: bool,
+    concurrency: int,
+) -> List[Tuple[BaseTagAdapter, TagRunResult]]:
+    """
+    Modo padrão: cada adapter faz merge e escrita do seu recurso. Adapters
+    com API de escrita em lote só planejam aqui, e os deltas vão depois,
+    agrupados (_write_batched_tags). A leitura de volta fica para a fase de
+    verificação.
+    """
+
+    def _apply(item: Tuple[BaseTagAdapter, TagSet]) -> Tuple[BaseTagAdapter, TagRunResult]:
+        adapter, tagset = item
+        plan_only = dry_run or bool(_batch_api_size(adapter))
+        return adapter, adapter.apply_tags(tagset, dry_run=plan_only, override=override)
+
+    processed = _map(_apply, built, concurrency)
+
+    if not dry_run:
+        _write_batched_tags([item for item in processed if _batch_api_size(item[0])], concurrency)
+
+    return processed
+
+
+def _tag_resources_bulk(
+    built: List[Tuple[BaseTagAdapter, TagSet]],
+    pool: ClientPool,
+    override: bool,
+    concurrency: int,
+) -> List[Tuple[BaseTagAdapter, TagRunResult]]:
+    """
+    Modo bulk: planeja cada recurso (leitura + merge, sem escrita) e envia os
+    deltas pela Resource Groups Tagging API em lotes.
+
+    Recursos fora da cobertura da API (tagging_api_type = None) seguem o
+    caminho normal do adapter.
+    """
+
+    def _plan(item: Tuple[BaseTagAdapter, TagSet]) -> Tuple[BaseTagAdapter, TagRunResult]:
+        adapter, tagset = item
+
+        dry_run = adapter.tagging_api_type is not None
+        return adapter, adapter.apply_tags(tagset, dry_run=dry_run, override=override)
+
+    planned = _map(_plan, built, concurrency)
+
+    errors = bulk_tag_resources(
+        pool,
+        [(adapter, result) for adapter, result in planned if adapter.tagging_api_type],
+    )
+
+    for _, result in planned:
+        if result.arn in errors:
+            result.error = errors[result.arn]
+
+    return planned
+
+
+def _tag_batch(
+    arns: List[Arn],
+    template: CompiledTemplate,
+    overrides: Dict[str, Any],
+    pool: ClientPool,
+    *,
+    dry_run: bool,
+    override: bool,
+    concurrency: int,
+    bulk: bool,
+    verify: str,
+) -> List[TagRunResult]:
+    """
+    Escreve e verifica um lote de ARNs já parseados, devolvendo os
+    resultados na ordem do lote.
+    """
+    order = _interleave_groups(arns)
+    scheduled = [arns[i] for i in order]
+
+    def _build(arn: Arn) -> Tuple[BaseTagAdapter, TagSet]:
+        return _build_adapter(arn, template, overrides, pool)
+
+    built = _map(_build, scheduled, concurrency)
+    _prefetch_batched_tags(built, concurrency)
+
+    if bulk and not dry_run:
+        processed_scheduled = _tag_resources_bulk(built, pool, override, concurrency)
+    else:
+        processed_scheduled = _tag_resources(built, dry_run, override, concurrency)
+
+    # devolve para a ordem de entrada
+    processed: List[Tuple[BaseTagAdapter, TagRunResult]] = [None] * len(arns)  # type: ignore[list-item]
+    for i, item in zip(order, processed_scheduled):
+        processed[i] = item
+
+    if not dry_run:
+        pending = []
+        for adapter, result in processed:
+            if result.error:
+                continue
+            if result.status == "unchanged":
+                # nenhuma escrita foi feita: o estado atual já é o final
+                result.applied_tags = dict(result.existing_tags)
+            else:
+                pending.append((adapter, result))
+
+        _verify_results(
+            pending,
+            pool,
+            verify=verify,
+            concurrency=concurrency,
+            batch_reads=bulk,
+        )
+
+    return [result for _, result in processed]
+
+
+def iter_tag_resources(
     arns: Iterable[str],
     template_path: str,
     overrides: Dict[str, Any],
@@ -56,26 +405,117 @@ def tag_resources(
     region: str | None = None,
     dry_run: bool = False,
     override: bool = False,
-) -> List[TagRunResult]:
-    session = Session(profile_name=profile, region_name=region)
+    concurrency: int = 1,
+    bulk: bool = False,
+    verify: str = "full",
+    batch_size: int = STREAM_BATCH_SIZE,
+    session: Session | None = None,
+    inventory: Inventory | None = None,
+) -> Iterator[TagRunResult]:
+    """
+    Aplica o template em todos os ARNs informados, em streaming.
+
+    Os ARNs são consumidos de forma preguiçosa, em lotes de batch_size: cada
+    lote é escrito, verificado e devolvido (na ordem de entrada) antes do
+    próximo ser lido, então a memória fica limitada ao tamanho do lote mesmo
+    com milhões de ARNs.
+
+    Com concurrency > 1 os ARNs de cada lote são processados por um pool
+    limitado de threads.
+
+    Cada ARN é roteado para os clients da sua própria região, e os grupos
+    (conta, região) são intercalados para serem processados em paralelo.
+
+    Com bulk=True (e fora do dry-run), as escritas são agrupadas na
+    Resource Groups Tagging API; falhas por ARN vão para TagRunResult.error.
+
+    Depois das escritas de cada lote, a fase de verificação relê os recursos
+    alterados (verify="full"), uma amostra deles ("sample") ou nenhum ("none").
+
+    session: Session já validada (ex.: pelo CLI); se omitida, uma nova é criada.
+
+    inventory: inventário local do scan; os recursos alterados têm as tags
+    invalidadas para serem relidos da AWS no próximo scan.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency deve ser >= 1.")
+    if batch_size < 1:
+        raise ValueError("batch_size deve ser >= 1.")
+    if verify not in VERIFY_MODES:
+        raise ValueError(f"verify deve ser um de {VERIFY_MODES}.")
 
-    results: List[TagRunResult] = []
+    # Reaproveita a Session já validada pelo CLI (requires_aws_identity)
+    if session is None:
+        session = Session(profile_name=profile, region_name=region)
+    # Um client por serviço para a execução inteira, com pool HTTP
+    # dimensionado para o número de workers.
+    pool = ClientPool(session, max_pool_connections=concurrency)
+    template = compile_template(template_path)
 
-    for arn_str in arns:
-        arn = Arn.parse(arn_str)
-        adapter_cls = get_adapter_for_arn(arn)
+    arns_iter = iter(arns)
+    while True:
+        batch = [Arn.parse(arn_str) for arn_str in itertools.islice(arns_iter, batch_size)]
+        if not batch:
+            return
 
-        adapter = adapter_cls(arn, session)
-        
-        adapter_ctx = adapter.get_context()  # ex: {"usage": "storage"}
-        ctx: Dict[str, Any] = {**adapter_ctx, **overrides}
-        tagset = build_tagset(template_path, ctx)
+        results = _tag_batch(
+            batch,
+            template,
+            overrides,
+            pool,
+            dry_run=dry_run,
+            override=override,
+            concurrency=concurrency,
+            bulk=bulk,
+            verify=verify,
+        )
 
-        result = adapter.apply_tags(tagset, dry_run=dry_run, override=override)
+        if inventory is not None and not dry_run:
+            # falhas também: a escrita pode ter chegado a parte dos recursos
+            inventory.invalidate(r.arn for r in results if r.status != "unchanged")
+            inventory.commit()
 
-        if not dry_run:
-            result.applied_tags = _read_tags_with_retry(adapter, expected_tagset=tagset)
+        yield from results
 
-        results.append(result)
 
-    return results
+def tag_resources(
+    arns: Iterable[str],
+    template_path: str,
+    overrides: Dict[str, Any],
+    *,
+    profile: str | None = None,
+    region: str | None = None,
+    dry_run: bool = False,
+    override: bool = False,
+    concurrency: int = 1,
+    bulk: bool = False,
+    verify: str = "full",
+    batch_size: int = STREAM_BATCH_SIZE,
+    session: Session | None = None,
+    inventory: Inventory | None = None,
+) -> List[TagRunResult]:
+    """
+    Versão materializada de iter_tag_resources (mesmos parâmetros).
+
+    Para execuções grandes, materialize no formato colunar, que ocupa bem
+    menos memória que a lista (resultados somente leitura):
+
+        TagRunStore(override=override, results=iter_tag_resources(...))
+    """
+    return list(
+        iter_tag_resources(
+            arns,
+            template_path,
+            overrides,
+            profile=profile,
+            region=region,
+            dry_run=dry_run,
+            override=override,
+            concurrency=concurrency,
+            bulk=bulk,
+            verify=verify,
+            batch_size=batch_size,
+            session=session,
+            inventory=inventory,
+        )
+    )
@@ -0,0 +1,131 @@
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from ..clients import ClientPool
+from ..models import TagRunResult
+
+
+# Limite da API: TagResources aceita no máximo 20 ARNs por chamada.
+TAG_RESOURCES_BATCH_SIZE = 20
+
+# Máximo de recursos por página em GetResources.
+GET_RESOURCES_PAGE_SIZE = 100
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def tagging_api_region(adapter: object, pool: ClientPool) -> str | None:
+    """
+    Região da Tagging API para o recurso do adapter: a informada pelo
+    adapter (ex.: região do bucket S3) ou a default da execução.
+    """
+    region_of = getattr(adapter, "tagging_api_region", None)
+    region = region_of() if region_of is not None else adapter.arn.region  # type: ignore[attr-defined]
+    return region or pool.region_name
+
+
+def bulk_tag_resources(
+    pool: ClientPool,
+    planned: Iterable[Tuple[object, TagRunResult]],
+) -> Dict[str, str]:
+    """
+    Escreve o delta de cada recurso pela Resource Groups Tagging API.
+
+    - planned: pares (adapter, TagRunResult) já planejados (dry-run), com
+      `tagging_api_type` definido no adapter.
+    - Agrupa por (região, delta idêntico) e envia em lotes de até 20 ARNs.
+    - Retorna {arn: mensagem de erro} para os recursos que falharam, a partir do
+      FailedResourcesMap (ou do erro da chamada inteira, para o lote afetado).
+    """
+    groups: Dict[Tuple[str | None, FrozenSet[Tuple[str, str]]], List[Tuple[str, str]]] = {}
+
+    for adapter, result in planned:
+        changed = result.changed_tags
+        if not changed:
+            continue
+
+        region = tagging_api_region(adapter, pool)
+        key = (region, frozenset(changed.items()))
+        api_arn = adapter.tagging_api_arn(adapter.arn)
+        groups.setdefault(key, []).append((api_arn, result.arn))
+
+    errors: Dict[str, str] = {}
+
+    for (region, changed_items), members in groups.items():
+        client = pool.client("resourcegroupstaggingapi", region_name=region)
+        tags = dict(changed_items)
+
+        for chunk in _chunks(members, TAG_RESOURCES_BATCH_SIZE):
+            by_api_arn = dict(chunk)
+
+            try:
+                resp = client.tag_resources(
+                    ResourceARNList=list(by_api_arn.keys()),
+                    Tags=tags,
+                )
+            except (BotoCoreError, ClientError) as e:
+                for raw_arn in by_api_arn.values():
+                    errors[raw_arn] = str(e)
+                continue
+
+            for api_arn, failure in (resp.get("FailedResourcesMap") or {}).items():
+                raw_arn = by_api_arn.get(api_arn, api_arn)
+                errors[raw_arn] = (
+                    f"{failure.get('ErrorCode', 'Error')}: {failure.get('ErrorMessage', '')}".strip()
+                )
+
+    return errors
+
+
+def get_tags_by_type(
+    pool: ClientPool,
+    resource_type: str,
+    region: str | None = None,
+) -> Dict[str, Dict[str, str]]:
+    """
+    Snapshot {arn: {key: value}} de todos os recursos do tipo informado
+    (ex.: "logs:log-group"), lido em páginas de 100 via GetResources.
+
+    A API só devolve recursos que têm (ou já tiveram) tags: um ARN ausente do
+    snapshot, na mesma região, não tem tags.
+    """
+    client = pool.client("resourcegroupstaggingapi", region_name=region)
+    paginator = client.get_paginator("get_resources")
+
+    snapshot: Dict[str, Dict[str, str]] = {}
+    for page in paginator.paginate(
+        ResourceTypeFilters=[resource_type],
+        ResourcesPerPage=GET_RESOURCES_PAGE_SIZE,
+    ):
+        for mapping in page.get("ResourceTagMappingList", []):
+            snapshot[mapping["ResourceARN"]] = {
+                t["Key"]: t["Value"] for t in mapping.get("Tags", [])
+            }
+
+    return snapshot
+
+
+def get_tags_for_arns(
+    pool: ClientPool,
+    arns: List[str],
+    region: str | None = None,
+) -> Dict[str, Dict[str, str]]:
+    """
+    Lê as tags de ARNs específicos via GetResources(ResourceARNList), em lotes
+    de até 100. ARNs sem tags não aparecem no resultado.
+    """
+    client = pool.client("resourcegroupstaggingapi", region_name=region)
+
+    tags_by_arn: Dict[str, Dict[str, str]] = {}
+    for chunk in _chunks(arns, GET_RESOURCES_PAGE_SIZE):
+        resp = client.get_resources(ResourceARNList=chunk)
+        for mapping in resp.get("ResourceTagMappingList", []):
+            tags_by_arn[mapping["ResourceARN"]] = {
+                t["Key"]: t["Value"] for t in mapping.get("Tags", [])
+            }
+
+    return tags_by_arn
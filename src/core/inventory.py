@@ -0,0 +1,143 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .cache import cache_dir
+
+
+INVENTORY_FILE = "inventory.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    arn          TEXT PRIMARY KEY,
+    adapter      TEXT NOT NULL,
+    tags         TEXT,
+    last_seen    REAL NOT NULL,
+    last_fetched REAL
+)
+"""
+
+
+def default_inventory_path() -> Path:
+    return cache_dir() / INVENTORY_FILE
+
+
+@dataclass(frozen=True, slots=True)
+class InventoryEntry:
+    arn: str
+    adapter: str
+    # None quando as tags nunca foram lidas (ou foram invalidadas)
+    tags: Optional[Dict[str, str]]
+    last_seen: float
+    last_fetched: Optional[float]
+
+    def is_fresh(self, max_age: float, now: Optional[float] = None) -> bool:
+        """
+        True se as tags foram lidas da AWS há no máximo max_age segundos.
+        """
+        if self.tags is None or self.last_fetched is None:
+            return False
+        return (now if now is not None else time.time()) - self.last_fetched <= max_age
+
+
+class Inventory:
+    """
+    Inventário local (SQLite) de recursos e suas tags.
+
+    - last_seen: última vez que o recurso apareceu numa listagem;
+    - last_fetched: última vez que as tags foram lidas da AWS.
+
+    O scan consulta o inventário para só reler da AWS as entradas mais velhas
+    que a política de refresh. A conexão é compartilhada entre as threads do
+    pipeline, protegida por um lock; as escritas viram uma única transação,
+    confirmada em commit()/close().
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path) if path is not None else default_inventory_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "Inventory":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def get(self, arn: str) -> Optional[InventoryEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT arn, adapter, tags, last_seen, last_fetched FROM resources WHERE arn = ?",
+                (arn,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        arn, adapter, tags, last_seen, last_fetched = row
+        return InventoryEntry(
+            arn=arn,
+            adapter=adapter,
+            tags=json.loads(tags) if tags is not None else None,
+            last_seen=last_seen,
+            last_fetched=last_fetched,
+        )
+
+    def record_seen(self, arn: str, adapter: str, now: Optional[float] = None) -> None:
+        """
+        Marca o recurso como visto na listagem, sem mexer nas tags.
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO resources (arn, adapter, last_seen) VALUES (?, ?, ?) "
+                "ON CONFLICT(arn) DO UPDATE SET adapter = excluded.adapter, last_seen = excluded.last_seen",
+                (arn, adapter, now),
+            )
+
+    def record_tags(
+        self,
+        arn: str,
+        adapter: str,
+        tags: Dict[str, str],
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Grava as tags recém-lidas da AWS (atualiza last_seen e last_fetched).
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO resources (arn, adapter, tags, last_seen, last_fetched) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(arn) DO UPDATE SET adapter = excluded.adapter, tags = excluded.tags, "
+                "last_seen = excluded.last_seen, last_fetched = excluded.last_fetched",
+                (arn, adapter, json.dumps(tags, sort_keys=True), now, now),
+            )
+
+    def invalidate(self, arns: Iterable[str]) -> None:
+        """
+        Força a releitura das tags no próximo scan (ex.: depois de um tag).
+        """
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE resources SET last_fetched = NULL WHERE arn = ?",
+                ((arn,) for arn in arns),
+            )
+
+    def commit(self) -> None:
+        with self._lock:
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
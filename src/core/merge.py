@@ -1,9 +1,16 @@
+from pathlib import Path
 from typing import Dict, Any
 from .models import TagSet
-from .template_engine import load_template, render_dynamic
+from .template_engine import CompiledTemplate, compile_template
 
 
-def build_tagset(template_path: str, overrides: Dict[str, Any]) -> TagSet:
-    tpl = load_template(template_path)
-    merged = render_dynamic(tpl, overrides)
-    return TagSet.from_dict(merged)
+def build_tagset(template: str | Path | CompiledTemplate, overrides: Dict[str, Any]) -> TagSet:
+    """
+    Renderiza o template com o contexto informado.
+
+    Aceita o caminho do template ou um CompiledTemplate já carregado
+    (caso dos engines, que compilam uma vez por execução).
+    """
+    if not isinstance(template, CompiledTemplate):
+        template = compile_template(template)
+    return template.render_tagset(overrides)
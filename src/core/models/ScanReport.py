@@ -1,16 +1,26 @@
-import yaml
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
 
-from dataclasses import dataclass
-from typing import Dict, List
 
-
-@dataclass
+@dataclass(slots=True)
 class ScanResourceReport:
     name: str
     arn: str
     adapter: str
     status: str  # 'compliant' | 'non_compliant'
     missing_tags: List[str]
+    # Violações das regras de valor do template (rules:)
+    violations: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "arn": self.arn,
+            "adapter": self.adapter,
+            "status": self.status,
+            **({"missing_tags": self.missing_tags} if self.missing_tags else {}),
+            **({"violations": self.violations} if self.violations else {}),
+        }
 
 
 @dataclass
@@ -20,22 +30,16 @@ class ScanReport:
     checked_at: str
     summary: Dict[str, int]
     resources: List[ScanResourceReport]
+    # Só em scans de vários adapters (tago scan --all): summary por adapter
+    adapter_summaries: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def to_yaml(self) -> str:
-        doc = {
-            "service": self.service,
-            **({"service_type": self.service_type} if self.service_type else {}),
-            "checked_at": self.checked_at,
-            "summary": self.summary,
-            "resources": [
-                {
-                    "name": r.name,
-                    "arn": r.arn,
-                    "adapter": r.adapter,
-                    "status": r.status,
-                    **({"missing_tags": r.missing_tags} if r.missing_tags else {}),
-                }
-                for r in self.resources
-            ],
-        }
-        return yaml.safe_dump(doc, sort_keys=False, allow_unicode=True)
\ No newline at end of file
+        import io
+
+        from ..report_writer import ScanReportWriter
+
+        # Mesmo writer do relatório em streaming; com o summary já conhecido,
+        # ele sai antes dos recursos
+        buf = io.StringIO()
+        ScanReportWriter(stream=buf).write_report(self)
+        return buf.getvalue()
@@ -1,7 +1,27 @@
+import sys
 from dataclasses import dataclass
+from typing import Dict
 
 
-@dataclass(frozen=True)
+def intern_tags(tags: Dict[str, str]) -> Dict[str, str]:
+    """
+    Copia o dict com chaves e valores internados: as mesmas chaves (e
+    valores como "prd", "team-x") se repetem em todos os recursos de uma
+    execução e passam a ocupar uma única string em memória.
+    """
+    return {
+        sys.intern(k) if type(k) is str else k: sys.intern(v) if type(v) is str else v
+        for k, v in tags.items()
+    }
+
+
+@dataclass(frozen=True, slots=True)
 class Tag:
     key: str
     value: str
+
+    def __post_init__(self) -> None:
+        if type(self.key) is str:
+            object.__setattr__(self, "key", sys.intern(self.key))
+        if type(self.value) is str:
+            object.__setattr__(self, "value", sys.intern(self.value))
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TagRunResult:
     """
     Resultado de um apply_tags, independente de dry-run.
@@ -14,3 +14,22 @@ class TagRunResult:
     final_tags: Dict[str, str]
     pretty_name: str
     applied_tags: Optional[Dict[str, str]] = None
+    # Preenchido quando a escrita falhou sem abortar a execução (ex.: modo bulk)
+    error: Optional[str] = None
+
+    @property
+    def changed_tags(self) -> Dict[str, str]:
+        """
+        Tags que o apply precisa escrever (novas ou com valor diferente).
+        """
+        return {k: v for k, v in self.final_tags.items() if self.existing_tags.get(k) != v}
+
+    @property
+    def status(self) -> str:
+        """
+        'failed' quando a escrita falhou (error preenchido), 'unchanged' quando o
+        recurso já estava no estado final, 'updated' caso contrário.
+        """
+        if self.error is not None:
+            return "failed"
+        return "updated" if self.changed_tags else "unchanged"
@@ -0,0 +1,188 @@
+import sys
+from array import array
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple, overload
+
+from .Tag import intern_tags
+from .TagRunResult import TagRunResult
+
+
+# Estado de applied_tags de cada recurso (coluna _applied).
+_APPLIED_NONE = 0
+_APPLIED_FINAL = 1
+_APPLIED_OTHER = 2
+
+_TagItems = Tuple[Tuple[str, str], ...]
+
+
+class TagRunStore(Sequence[TagRunResult]):
+    """
+    Armazenamento colunar de TagRunResult para execuções grandes.
+
+    Ao invés de três dicts por recurso, guarda:
+    - os desired_tags distintos uma única vez (em geral poucos, já que vêm
+      do mesmo template), e por recurso só o índice do desired;
+    - existing_tags como delta contra o desired (chaves ausentes + pares
+      divergentes ou legados), vazio no caso comum;
+    - final_tags derivado de desired/existing pelo mesmo merge do adapter
+      (só é guardado explicitamente se não bater);
+    - applied_tags/error apenas quando diferem do esperado.
+
+    Os TagRunResult são reconstruídos sob demanda na leitura: cada acesso
+    devolve uma cópia nova, então alterações nela não voltam para o store.
+    Chaves e valores são internados aqui, no append (não em cada resultado).
+    """
+
+    __slots__ = (
+        "override",
+        "_desired",
+        "_desired_index",
+        "_pretty_names",
+        "_arns",
+        "_desired_ref",
+        "_pretty_ref",
+        "_missing",
+        "_delta",
+        "_applied",
+        "_final_overrides",
+        "_applied_overrides",
+        "_errors",
+    )
+
+    def __init__(self, override: bool = False, results: Iterable[TagRunResult] = ()) -> None:
+        self.override = override
+
+        self._desired: List[Dict[str, str]] = []
+        self._desired_index: Dict[FrozenSet[Tuple[str, str]], int] = {}
+        self._pretty_names: List[str] = []
+
+        self._arns: List[str] = []
+        self._desired_ref = array("I")
+        self._pretty_ref = array("H")
+        self._missing: List[Optional[Tuple[str, ...]]] = []
+        self._delta: List[Optional[_TagItems]] = []
+        self._applied = array("B")
+
+        # colunas esparsas: só recursos fora do caso comum
+        self._final_overrides: Dict[int, Dict[str, str]] = {}
+        self._applied_overrides: Dict[int, Dict[str, str]] = {}
+        self._errors: Dict[int, str] = {}
+
+        self.extend(results)
+
+    def _merge(self, desired: Dict[str, str], existing: Dict[str, str]) -> Dict[str, str]:
+        # mesmo merge de BaseTagAdapter._get_aws_tags
+        if self.override:
+            return {**existing, **desired}
+        return {**desired, **existing}
+
+    def _desired_ref_for(self, desired: Dict[str, str]) -> int:
+        key = frozenset(desired.items())
+        ref = self._desired_index.get(key)
+        if ref is None:
+            ref = len(self._desired)
+            self._desired.append(intern_tags(desired))
+            self._desired_index[key] = ref
+        return ref
+
+    def _pretty_ref_for(self, pretty_name: str) -> int:
+        try:
+            return self._pretty_names.index(pretty_name)
+        except ValueError:
+            self._pretty_names.append(sys.intern(pretty_name))
+            return len(self._pretty_names) - 1
+
+    def append(self, result: TagRunResult) -> None:
+        i = len(self._arns)
+        desired = result.desired_tags
+        existing = result.existing_tags
+
+        missing = tuple(sys.intern(k) for k in desired if k not in existing)
+        delta = tuple(
+            (sys.intern(k), sys.intern(v))
+            for k, v in existing.items()
+            if desired.get(k) != v
+        )
+
+        self._arns.append(result.arn)
+        self._desired_ref.append(self._desired_ref_for(desired))
+        self._pretty_ref.append(self._pretty_ref_for(result.pretty_name))
+        self._missing.append(missing or None)
+        self._delta.append(delta or None)
+
+        if self._merge(desired, existing) != result.final_tags:
+            self._final_overrides[i] = intern_tags(result.final_tags)
+
+        if result.applied_tags is None:
+            self._applied.append(_APPLIED_NONE)
+        elif result.applied_tags == result.final_tags:
+            self._applied.append(_APPLIED_FINAL)
+        else:
+            self._applied.append(_APPLIED_OTHER)
+            self._applied_overrides[i] = intern_tags(result.applied_tags)
+
+        if result.error is not None:
+            self._errors[i] = result.error
+
+    def extend(self, results: Iterable[TagRunResult]) -> None:
+        for result in results:
+            self.append(result)
+
+    def _build(self, i: int) -> TagRunResult:
+        desired = self._desired[self._desired_ref[i]]
+
+        missing = self._missing[i] or ()
+        existing = {k: v for k, v in desired.items() if k not in missing}
+        existing.update(self._delta[i] or ())
+
+        final = self._final_overrides.get(i)
+        if final is None:
+            final = self._merge(desired, existing)
+
+        applied_state = self._applied[i]
+        if applied_state == _APPLIED_NONE:
+            applied = None
+        elif applied_state == _APPLIED_FINAL:
+            applied = dict(final)
+        else:
+            applied = self._applied_overrides[i]
+
+        return TagRunResult(
+            arn=self._arns[i],
+            desired_tags=dict(desired),
+            existing_tags=existing,
+            final_tags=final,
+            pretty_name=self._pretty_names[self._pretty_ref[i]],
+            applied_tags=applied,
+            error=self._errors.get(i),
+        )
+
+    def __len__(self) -> int:
+        return len(self._arns)
+
+    @overload
+    def __getitem__(self, index: int) -> TagRunResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[TagRunResult]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TagRunStore index out of range")
+        return self._build(index)
+
+    def __iter__(self) -> Iterator[TagRunResult]:
+        for i in range(len(self)):
+            yield self._build(i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TagRunStore, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TagRunStore({len(self)} results, {len(self._desired)} distinct desired tagsets)"
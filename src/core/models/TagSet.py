@@ -1,17 +1,24 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Tuple
 
 from .Tag import Tag
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TagSet:
     """
     Representação interna canônica de tags.
     Independente de como cada serviço AWS quer receber essas tags.
+
+    É imutável, para poder ser compartilhado entre recursos
+    (ver CompiledTemplate.render_tagset).
     """
 
-    tags: List[Tag]
+    tags: Tuple[Tag, ...]
+
+    def __post_init__(self) -> None:
+        # aceita qualquer iterável (ex.: list) e congela como tupla
+        object.__setattr__(self, "tags", tuple(self.tags))
 
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> "TagSet":
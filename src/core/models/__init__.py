@@ -3,6 +3,7 @@ from .ScanReport import ScanReport, ScanResourceReport
 from .Tag import Tag
 from .TagSet import TagSet
 from .TagRunResult import TagRunResult
+from .TagRunStore import TagRunStore
 
 __all__ = [
     "AwsIdentity",
@@ -12,4 +13,5 @@ __all__ = [
     "Tag",
     "TagSet",
     "TagRunResult",
+    "TagRunStore",
 ]
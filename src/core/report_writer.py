@@ -0,0 +1,212 @@
+import gzip
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .models import ScanReport, ScanResourceReport
+
+
+# Recursos serializados por chamada ao dumper: amortiza o custo de montar o
+# emitter sem segurar mais que isso em memória.
+WRITE_BATCH_SIZE = 500
+
+# Nível de compressão do .gz: o default do gzip (9) custa bem mais CPU para
+# ganhar pouco em relatórios YAML.
+GZIP_COMPRESSLEVEL = 6
+
+
+def _yaml_dump(data: Any, stream: IO[str]) -> None:
+    import yaml
+
+    # Dumper em C (libyaml) quando o PyYAML foi compilado com ele
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    yaml.dump(
+        data,
+        stream,
+        Dumper=dumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+    )
+
+
+def chunk_path(path: Path, index: int) -> Path:
+    """
+    Nome do arquivo de um chunk: relatorio.yaml.gz -> relatorio.00001.yaml.gz
+    """
+    name = path.name
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[: -len(".gz")]
+
+    base = Path(name)
+    chunk_name = f"{base.stem}.{index:05d}{base.suffix}" + (".gz" if compressed else "")
+    return path.with_name(chunk_name)
+
+
+class ScanReportWriter:
+    """
+    Escreve o relatório do scan em streaming, com memória constante:
+    cabeçalho (service, service_type, checked_at), depois os recursos
+    conforme o scan os produz e, por último, o summary. Quando o summary já
+    é conhecido no begin (relatório montado em memória) e não há chunks, ele
+    vai no cabeçalho, antes dos recursos, como no formato original.
+
+    Destino:
+    - stream: um arquivo texto já aberto (ex.: stdout);
+    - path: arquivo; comprimido com gzip se terminar em .gz. Com chunk_size,
+      rotaciona a cada chunk_size recursos (relatorio.00001.yaml, ...): cada
+      chunk é um documento YAML com o cabeçalho e o número da parte, e o
+      summary vai no último.
+
+    Não é thread-safe: quem escreve de várias threads serializa as chamadas.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        stream: Optional[IO[str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> None:
+        if (path is None) == (stream is None):
+            raise ValueError("Informe path ou stream.")
+        if chunk_size is not None:
+            if path is None:
+                raise ValueError("chunk_size exige path.")
+            if chunk_size < 1:
+                raise ValueError("chunk_size deve ser >= 1.")
+
+        self.path = Path(path) if path is not None else None
+        self.chunk_size = chunk_size
+        # arquivos gravados, na ordem
+        self.paths: List[Path] = []
+
+        self._stream = stream
+        self._file: Optional[IO[str]] = None
+        self._header: Optional[Dict[str, Any]] = None
+        self._pending: List[Dict[str, Any]] = []
+        # recursos no arquivo atual (escritos + pendentes)
+        self._in_file = 0
+        self._resources_open = False
+        self._summary_written = False
+
+    def __enter__(self) -> "ScanReportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _open_next(self) -> IO[str]:
+        assert self.path is not None
+        path = self.path if self.chunk_size is None else chunk_path(self.path, len(self.paths) + 1)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if path.name.endswith(".gz"):
+            fh: IO[str] = gzip.open(path, "wt", encoding="utf-8", compresslevel=GZIP_COMPRESSLEVEL)
+        else:
+            fh = open(path, "w", encoding="utf-8")
+
+        self.paths.append(path)
+        return fh
+
+    def _out(self) -> IO[str]:
+        if self._stream is not None:
+            return self._stream
+
+        if self._file is None:
+            self._file = self._open_next()
+            header = dict(self._header or {})
+            if self.chunk_size is not None:
+                header["part"] = len(self.paths)
+            _yaml_dump(header, self._file)
+
+        return self._file
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+
+        out = self._out()
+        if not self._resources_open:
+            out.write("resources:\n")
+            self._resources_open = True
+
+        _yaml_dump(self._pending, out)
+        self._pending = []
+
+    def _rotate(self) -> None:
+        self._flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._in_file = 0
+        self._resources_open = False
+
+    def begin(
+        self,
+        service: str,
+        service_type: Optional[str],
+        checked_at: str,
+        summary: Optional[Dict[str, int]] = None,
+    ) -> None:
+        # com chunks, o summary continua só no último arquivo
+        if self.chunk_size is not None:
+            summary = None
+
+        self._header = {
+            "service": service,
+            **({"service_type": service_type} if service_type else {}),
+            "checked_at": checked_at,
+            **({"summary": summary} if summary is not None else {}),
+        }
+        self._summary_written = summary is not None
+        if self._stream is not None:
+            _yaml_dump(self._header, self._stream)
+        else:
+            self._out()
+
+    def write_resource(self, resource: "ScanResourceReport") -> None:
+        if self.chunk_size is not None and self._in_file >= self.chunk_size:
+            self._rotate()
+
+        self._pending.append(resource.to_dict())
+        self._in_file += 1
+
+        if len(self._pending) >= WRITE_BATCH_SIZE:
+            self._flush()
+
+    def finish(
+        self,
+        summary: Dict[str, int],
+        adapter_summaries: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        self._flush()
+
+        out = self._out()
+        if not self._resources_open:
+            out.write("resources: []\n")
+            self._resources_open = True
+
+        footer = {
+            **({} if self._summary_written else {"summary": summary}),
+            **({"adapter_summaries": adapter_summaries} if adapter_summaries else {}),
+        }
+        if footer:
+            _yaml_dump(footer, out)
+        out.flush()
+
+    def write_report(self, report: "ScanReport") -> None:
+        """
+        Escreve um ScanReport já montado em memória, com o summary antes
+        dos recursos.
+        """
+        self.begin(report.service, report.service_type, report.checked_at, summary=report.summary)
+        for resource in report.resources:
+            self.write_resource(resource)
+        self.finish(report.summary, report.adapter_summaries)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
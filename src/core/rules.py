@@ -0,0 +1,146 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Pattern, Tuple
+
+
+RULE_KINDS = ("regex", "enum", "required_if")
+
+
+@dataclass(frozen=True, slots=True)
+class _ValueRule:
+    key: str
+    kind: str  # 'regex' | 'enum'
+    pattern: Optional[Pattern[str]] = None
+    allowed: frozenset = frozenset()
+    # texto da regra, usado nas mensagens de violação
+    spec: str = ""
+
+    def check(self, value: str) -> Optional[str]:
+        if self.kind == "regex":
+            if self.pattern is not None and self.pattern.fullmatch(value):
+                return None
+        elif value in self.allowed:
+            return None
+        return f"{self.key}={value!r} ({self.kind}: {self.spec})"
+
+
+@dataclass(frozen=True, slots=True)
+class _RequiredIfRule:
+    key: str
+    # (tag, valores aceitos) — todas precisam bater para a tag ser exigida
+    conditions: Tuple[Tuple[str, frozenset], ...]
+    spec: str = ""
+
+    def check(self, tags: Mapping[str, str]) -> Optional[str]:
+        if tags.get(self.key):
+            return None
+        for tag, values in self.conditions:
+            if tags.get(tag) not in values:
+                return None
+        return f"{self.key} ausente (required_if: {self.spec})"
+
+
+def _as_values(raw: Any) -> frozenset:
+    if isinstance(raw, (list, tuple, set)):
+        return frozenset(str(v) for v in raw)
+    return frozenset([str(raw)])
+
+
+class RuleTable:
+    """
+    Regras de valor da seção `rules:` do template, compiladas uma única vez:
+
+        rules:
+          Environment:
+            enum: [dev, hml, prd]
+          CostCenter:
+            regex: "^[0-9]+$"
+          DataClassification:
+            required_if:
+              Environment: prd
+
+    - regex: o valor da tag precisa casar por inteiro com a expressão;
+    - enum: o valor precisa estar na lista;
+    - required_if: a tag é obrigatória quando todas as condições batem
+      (valor único ou lista de valores aceitos por tag).
+
+    regex/enum só valem para tags presentes; ausência é assunto das chaves
+    obrigatórias do template ou de required_if.
+    """
+
+    __slots__ = ("_by_key", "_required_if")
+
+    def __init__(self, rules: Optional[Mapping[str, Any]] = None) -> None:
+        self._by_key: Dict[str, Tuple[_ValueRule, ...]] = {}
+        self._required_if: Tuple[_RequiredIfRule, ...] = ()
+
+        required_if: List[_RequiredIfRule] = []
+
+        for key, spec in (rules or {}).items():
+            key = str(key)
+            if not isinstance(spec, Mapping):
+                raise ValueError(f"Regra inválida para a tag {key!r}: esperado um mapa com {', '.join(RULE_KINDS)}.")
+
+            unknown = set(spec) - set(RULE_KINDS)
+            if unknown:
+                raise ValueError(f"Regra desconhecida para a tag {key!r}: {', '.join(sorted(map(str, unknown)))}.")
+
+            value_rules: List[_ValueRule] = []
+
+            if "regex" in spec:
+                expr = str(spec["regex"])
+                try:
+                    pattern = re.compile(expr)
+                except re.error as e:
+                    raise ValueError(f"Regex inválida para a tag {key!r}: {e}") from e
+                value_rules.append(_ValueRule(key=key, kind="regex", pattern=pattern, spec=expr))
+
+            if "enum" in spec:
+                allowed = _as_values(spec["enum"])
+                value_rules.append(
+                    _ValueRule(key=key, kind="enum", allowed=allowed, spec="|".join(sorted(allowed)))
+                )
+
+            if "required_if" in spec:
+                conditions = spec["required_if"]
+                if not isinstance(conditions, Mapping) or not conditions:
+                    raise ValueError(f"required_if da tag {key!r} deve ser um mapa {{tag: valor}}.")
+                compiled = tuple((str(tag), _as_values(values)) for tag, values in conditions.items())
+                required_if.append(
+                    _RequiredIfRule(
+                        key=key,
+                        conditions=compiled,
+                        spec=", ".join(f"{tag}={'|'.join(sorted(values))}" for tag, values in compiled),
+                    )
+                )
+
+            if value_rules:
+                self._by_key[key] = tuple(value_rules)
+
+        self._required_if = tuple(required_if)
+
+    def __bool__(self) -> bool:
+        return bool(self._by_key or self._required_if)
+
+    def evaluate(self, tags: Mapping[str, str]) -> List[str]:
+        """
+        Avalia todas as regras contra as tags de um recurso, numa passada.
+        Devolve as violações (vazio = conforme).
+        """
+        violations: List[str] = []
+
+        for key, value_rules in self._by_key.items():
+            value = tags.get(key)
+            if value is None:
+                continue
+            for rule in value_rules:
+                violation = rule.check(str(value))
+                if violation is not None:
+                    violations.append(violation)
+
+        for rule in self._required_if:
+            violation = rule.check(tags)
+            if violation is not None:
+                violations.append(violation)
+
+        return violations
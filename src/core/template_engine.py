@@ -1,11 +1,23 @@
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 import yaml
-from jinja2 import Environment, StrictUndefined
+from jinja2 import Environment, StrictUndefined, meta
+from jinja2 import Template as JinjaTemplate
+
+from .models import TagSet
+from .rules import RuleTable
 
 
 env = Environment(undefined=StrictUndefined)
 
+# Limite de TagSets memoizados por template; numa execução típica há poucas
+# dezenas de contextos distintos (um por tipo de adapter + overrides).
+RENDER_CACHE_SIZE = 1024
+
 
 def load_template(path: str | Path) -> Dict[str, Any]:
     content = Path(path).read_text(encoding="utf-8")
@@ -13,6 +25,124 @@ def load_template(path: str | Path) -> Dict[str, Any]:
     return yaml.safe_load(content)
 
 
+class CompiledTemplate:
+    """
+    Template já parseado, com as expressões de `dynamic` compiladas pelo Jinja.
+
+    É criado uma vez por execução e reaproveitado para todos os ARNs,
+    ao invés de reler o YAML e recompilar as expressões a cada recurso.
+    """
+
+    def __init__(self, template: Dict[str, Any] | None) -> None:
+        self.template: Dict[str, Any] = template or {}
+        self.defaults: Dict[str, Any] = self.template.get("defaults", {}) or {}
+        self.fixed: Dict[str, Any] = self.template.get("fixed", {}) or {}
+        # Regras de valor (rules:) usadas pelo scan, compiladas junto com o template
+        self.rules = RuleTable(self.template.get("rules"))
+
+        dynamic = self.template.get("dynamic", {}) or {}
+        # expr é uma string Jinja2
+        self.dynamic: Dict[str, JinjaTemplate] = {
+            key: env.from_string(str(expr)) for key, expr in dynamic.items()
+        }
+
+        # Variáveis de contexto que o template de fato usa: só elas entram
+        # no fingerprint da memoização.
+        self.variables: Tuple[str, ...] = tuple(
+            sorted(
+                {
+                    name
+                    for expr in dynamic.values()
+                    for name in meta.find_undeclared_variables(env.parse(str(expr)))
+                }
+            )
+        )
+
+        self._rendered: Dict[Tuple[Tuple[str, str], ...], TagSet] = {}
+        self._rendered_lock = threading.Lock()
+
+    def render(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
+        rendered_dynamic: Dict[str, Any] = {
+            key: template_obj.render(**ctx) for key, template_obj in self.dynamic.items()
+        }
+
+        # ordem: defaults < fixed < dynamic (dynamic ganha)
+        merged: Dict[str, Any] = {**self.defaults, **self.fixed, **rendered_dynamic}
+        return merged
+
+    def _fingerprint(self, ctx: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+        # Variáveis ausentes ficam fora do fingerprint; o render falha com
+        # StrictUndefined antes de memoizar qualquer coisa.
+        return tuple(
+            (name, json.dumps(ctx[name], sort_keys=True, default=str))
+            for name in self.variables
+            if name in ctx
+        )
+
+    def render_tagset(self, ctx: Dict[str, Any]) -> TagSet:
+        """
+        Renderiza o template como TagSet, memoizado pelo fingerprint do contexto.
+
+        Recursos com o mesmo contexto efetivo recebem o mesmo TagSet
+        (imutável), sem re-renderizar as expressões Jinja.
+        """
+        key = self._fingerprint(ctx)
+
+        with self._rendered_lock:
+            tagset = self._rendered.get(key)
+        if tagset is not None:
+            return tagset
+
+        tagset = TagSet.from_dict(self.render(ctx))
+
+        with self._rendered_lock:
+            if len(self._rendered) >= RENDER_CACHE_SIZE:
+                # descarta o mais antigo (dict mantém ordem de inserção)
+                self._rendered.pop(next(iter(self._rendered)))
+            return self._rendered.setdefault(key, tagset)
+
+
+@dataclass
+class _CacheEntry:
+    stamp: Tuple[int, int]
+    digest: str
+    compiled: CompiledTemplate
+
+
+_compiled_cache: Dict[Path, _CacheEntry] = {}
+_compiled_cache_lock = threading.Lock()
+
+
+def compile_template(path: str | Path) -> CompiledTemplate:
+    """
+    Carrega e compila o template, com cache por arquivo.
+
+    O cache é invalidado quando o mtime/tamanho do arquivo muda; se o
+    conteúdo (sha256) continuar igual, o template compilado é mantido.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    with _compiled_cache_lock:
+        entry = _compiled_cache.get(resolved)
+        if entry is not None and entry.stamp == stamp:
+            return entry.compiled
+
+        content = resolved.read_text(encoding="utf-8")
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+        if entry is not None and entry.digest == digest:
+            # arquivo "tocado" sem alteração de conteúdo
+            entry.stamp = stamp
+            return entry.compiled
+
+        # Suporta YAML e JSON (YAML já é superset)
+        compiled = CompiledTemplate(yaml.safe_load(content))
+        _compiled_cache[resolved] = _CacheEntry(stamp=stamp, digest=digest, compiled=compiled)
+        return compiled
+
+
 def render_dynamic(template: Dict[str, Any], ctx: Dict[str, Any]) -> Dict[str, Any]:
     """
     Espera algo como:
@@ -25,16 +155,4 @@ def render_dynamic(template: Dict[str, Any], ctx: Dict[str, Any]) -> Dict[str, A
         }
     }
     """
-    defaults = template.get("defaults", {}) or {}
-    fixed = template.get("fixed", {}) or {}
-    dynamic = template.get("dynamic", {}) or {}
-
-    rendered_dynamic: Dict[str, Any] = {}
-    for key, expr in dynamic.items():
-        # expr é uma string Jinja2
-        template_obj = env.from_string(str(expr))
-        rendered_dynamic[key] = template_obj.render(**ctx)
-
-    # ordem: defaults < fixed < dynamic (dynamic ganha)
-    merged: Dict[str, Any] = {**defaults, **fixed, **rendered_dynamic}
-    return merged
+    return CompiledTemplate(template).render(ctx)
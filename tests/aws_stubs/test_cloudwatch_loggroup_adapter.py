@@ -30,7 +30,7 @@ def test_cloudwatch_loggroup_apply_tags_calls_tag_log_group(monkeypatch):
         {},
         expected_params={
             "logGroupName": log_group_name,
-            "tags": {"Keep": "yes", "Owner": "team"},
+            "tags": {"Owner": "team"},
         },
     )
 
@@ -23,15 +23,15 @@ def test_dynamodb_apply_tags_calls_tag_resource(monkeypatch):
     )
 
     tagset = TagSet.from_dict({"Owner": "team"})
-    expected_final = [
-        {"Key": "Keep", "Value": "yes"},
+    # API aditiva: só o delta é enviado
+    expected_changed = [
         {"Key": "Owner", "Value": "team"},
     ]
 
     stubber.add_response(
         "tag_resource",
         {},
-        expected_params={"ResourceArn": arn_str, "Tags": expected_final},
+        expected_params={"ResourceArn": arn_str, "Tags": expected_changed},
     )
 
     monkeypatch.setattr(session, "client", lambda name: client)
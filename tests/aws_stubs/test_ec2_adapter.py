@@ -26,15 +26,15 @@ def test_ec2_apply_tags_calls_create_tags(monkeypatch):
     )
 
     tagset = TagSet.from_dict({"Owner": "team"})
-    expected_final = [
-        {"Key": "Keep", "Value": "yes"},
+    # API aditiva: só o delta é enviado
+    expected_changed = [
         {"Key": "Owner", "Value": "team"},
     ]
 
     stubber.add_response(
         "create_tags",
         {},
-        expected_params={"Resources": [instance_id], "Tags": expected_final},
+        expected_params={"Resources": [instance_id], "Tags": expected_changed},
     )
 
     monkeypatch.setattr(session, "client", lambda name: client)
@@ -45,3 +45,122 @@ def test_ec2_apply_tags_calls_create_tags(monkeypatch):
 
     assert result.pretty_name == "EC2 Instance"
     assert result.final_tags == {"Keep": "yes", "Owner": "team"}
+
+
+def test_ec2_apply_tags_skips_write_when_already_compliant(monkeypatch):
+    session = boto3.session.Session(region_name="us-east-1")
+    client = session.client("ec2")
+    stubber = Stubber(client)
+
+    arn = Arn.parse("arn:aws:ec2:us-east-1:123456789012:instance/i-abc123")
+
+    stubber.add_response(
+        "describe_tags",
+        {"Tags": [{"Key": "Owner", "Value": "team"}, {"Key": "Keep", "Value": "yes"}]},
+        expected_params={
+            "Filters": [{"Name": "resource-id", "Values": ["i-abc123"]}],
+        },
+    )
+    # nenhum create_tags registrado: o Stubber falha se houver escrita
+
+    monkeypatch.setattr(session, "client", lambda name: client)
+
+    with stubber:
+        adapter = EC2InstanceTagAdapter(arn, session)
+        result = adapter.apply_tags(TagSet.from_dict({"Owner": "team"}), dry_run=False, override=True)
+        stubber.assert_no_pending_responses()
+
+    assert result.status == "unchanged"
+    assert result.changed_tags == {}
+
+
+def test_ec2_list_resources_harvests_tags_from_describe_instances(monkeypatch):
+    from core.adapters.base import ListedResource
+
+    session = boto3.session.Session(region_name="us-east-1")
+    client = session.client("ec2")
+    stubber = Stubber(client)
+
+    stubber.add_response(
+        "describe_instances",
+        {
+            "Reservations": [
+                {
+                    "OwnerId": "123456789012",
+                    "Instances": [
+                        {"InstanceId": "i-1", "State": {"Name": "running"}, "Tags": [{"Key": "Owner", "Value": "team"}]},
+                        {"InstanceId": "i-2", "State": {"Name": "stopped"}},
+                        {"InstanceId": "i-3", "State": {"Name": "terminated"}},
+                    ],
+                }
+            ]
+        },
+        expected_params={},
+    )
+
+    monkeypatch.setattr(session, "client", lambda name: client)
+
+    with stubber:
+        listed = list(EC2InstanceTagAdapter.list_resources(session))
+
+    assert all(isinstance(item, ListedResource) for item in listed)
+    assert [item.arn.raw for item in listed] == [
+        "arn:aws:ec2:us-east-1:123456789012:instance/i-1",
+        "arn:aws:ec2:us-east-1:123456789012:instance/i-2",
+    ]
+    assert [item.tags for item in listed] == [{"Owner": "team"}, {}]
+
+
+def test_ec2_batch_reads_and_writes_use_one_call_per_batch(monkeypatch):
+    session = boto3.session.Session(region_name="us-east-1")
+    client = session.client("ec2")
+    stubber = Stubber(client)
+
+    monkeypatch.setattr(session, "client", lambda name: client)
+    adapters = [
+        EC2InstanceTagAdapter(Arn.parse(f"arn:aws:ec2:us-east-1:123456789012:instance/i-{i}"), session)
+        for i in range(3)
+    ]
+
+    stubber.add_response(
+        "describe_tags",
+        {
+            "Tags": [
+                {"ResourceId": "i-0", "ResourceType": "instance", "Key": "Owner", "Value": "team"},
+                {"ResourceId": "i-0", "ResourceType": "instance", "Key": "Keep", "Value": "yes"},
+            ],
+            "NextToken": "t",
+        },
+        expected_params={
+            "Filters": [
+                {"Name": "resource-type", "Values": ["instance"]},
+                {"Name": "resource-id", "Values": ["i-0", "i-1", "i-2"]},
+            ],
+        },
+    )
+    stubber.add_response(
+        "describe_tags",
+        {"Tags": [{"ResourceId": "i-2", "ResourceType": "instance", "Key": "Owner", "Value": "other"}]},
+        expected_params={
+            "Filters": [
+                {"Name": "resource-type", "Values": ["instance"]},
+                {"Name": "resource-id", "Values": ["i-0", "i-1", "i-2"]},
+            ],
+            "NextToken": "t",
+        },
+    )
+    stubber.add_response(
+        "create_tags",
+        {},
+        expected_params={"Resources": ["i-1", "i-2"], "Tags": [{"Key": "Owner", "Value": "team"}]},
+    )
+
+    with stubber:
+        tags = EC2InstanceTagAdapter.read_tags_batch(adapters)
+        EC2InstanceTagAdapter.write_tags_batch(adapters[1:], {"Owner": "team"})
+        stubber.assert_no_pending_responses()
+
+    assert tags == {
+        "arn:aws:ec2:us-east-1:123456789012:instance/i-0": {"Owner": "team", "Keep": "yes"},
+        "arn:aws:ec2:us-east-1:123456789012:instance/i-2": {"Owner": "other"},
+    }
@@ -24,15 +24,15 @@ def test_iam_role_apply_tags_calls_tag_role(monkeypatch):
     )
 
     tagset = TagSet.from_dict({"Owner": "team"})
-    expected_final = [
-        {"Key": "Keep", "Value": "yes"},
+    # API aditiva: só o delta é enviado
+    expected_changed = [
         {"Key": "Owner", "Value": "team"},
     ]
 
     stubber.add_response(
         "tag_role",
         {},
-        expected_params={"RoleName": role_name, "Tags": expected_final},
+        expected_params={"RoleName": role_name, "Tags": expected_changed},
     )
 
     monkeypatch.setattr(session, "client", lambda name: client)
@@ -43,3 +43,47 @@ def test_iam_role_apply_tags_calls_tag_role(monkeypatch):
 
     assert result.pretty_name == "IAM Role"
     assert result.final_tags == {"Keep": "yes", "Owner": "team"}
+
+
+def test_iam_role_list_resources_sweeps_authorization_details(monkeypatch):
+    from core.adapters.base import ListedResource
+
+    session = boto3.session.Session(region_name="us-east-1")
+    client = session.client("iam")
+    stubber = Stubber(client)
+
+    def _role(name, tags=None):
+        role = {
+            "Path": "/",
+            "RoleName": name,
+            "RoleId": "AROAEXAMPLEID0000000" + name[-1],
+            "Arn": f"arn:aws:iam::123456789012:role/{name}",
+            "CreateDate": "2024-01-01T00:00:00Z",
+        }
+        if tags is not None:
+            role["Tags"] = tags
+        return role
+
+    stubber.add_response(
+        "get_account_authorization_details",
+        {"RoleDetailList": [_role("Role1", [{"Key": "Owner", "Value": "team"}])], "IsTruncated": True, "Marker": "m"},
+        expected_params={"Filter": ["Role"]},
+    )
+    stubber.add_response(
+        "get_account_authorization_details",
+        {"RoleDetailList": [_role("Role2")], "IsTruncated": False},
+        expected_params={"Filter": ["Role"], "Marker": "m"},
+    )
+
+    monkeypatch.setattr(session, "client", lambda name: client)
+
+    with stubber:
+        listed = list(IAMRoleTagAdapter.list_resources(session))
+        stubber.assert_no_pending_responses()
+
+    assert all(isinstance(item, ListedResource) for item in listed)
+    assert [(item.arn.raw, item.tags) for item in listed] == [
+        ("arn:aws:iam::123456789012:role/Role1", {"Owner": "team"}),
+        ("arn:aws:iam::123456789012:role/Role2", {}),
+    ]
+    assert IAMRoleTagAdapter.supports_listing()
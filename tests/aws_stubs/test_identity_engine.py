@@ -27,7 +27,7 @@ def test_get_current_aws_identity_uses_sts(monkeypatch):
             assert name == "sts"
             return sts
 
-    monkeypatch.setattr(identity_engine.boto3.session, "Session", _FakeSession)
+    monkeypatch.setattr(boto3.session, "Session", _FakeSession)
 
     with stubber:
         ident = identity_engine.get_current_aws_identity(profile="p", region="us-east-1")
@@ -35,3 +35,80 @@ def test_get_current_aws_identity_uses_sts(monkeypatch):
     assert ident.account == "123"
     assert ident.profile == "p"
     assert ident.region == "us-east-1"
+
+
+class _FakeCredentials:
+    def __init__(self, access_key):
+        self.access_key = access_key
+        self.secret_key = "secret"
+        self.token = None
+
+    def get_frozen_credentials(self):
+        return self
+
+
+def _fake_session_factory(calls, access_key="AKIA1"):
+    class _FakeSTS:
+        def get_caller_identity(self):
+            calls.append("sts")
+            return {"Account": "123", "Arn": "arn:aws:sts::123:assumed-role/x/y", "UserId": "U"}
+
+    class _FakeSession:
+        def __init__(self, profile_name=None, region_name=None):
+            self.profile_name = profile_name
+            self.region_name = region_name
+
+        def client(self, name):
+            assert name == "sts"
+            return _FakeSTS()
+
+        def get_credentials(self):
+            return _FakeCredentials(access_key)
+
+    return _FakeSession
+
+
+def test_get_current_aws_identity_keeps_validated_session(monkeypatch):
+    monkeypatch.setattr(boto3.session, "Session", _fake_session_factory([]))
+    monkeypatch.delenv(identity_engine.IDENTITY_CACHE_TTL_ENV, raising=False)
+
+    identity_engine.get_current_aws_identity(profile="keep", region="sa-east-1")
+
+    session = identity_engine.get_validated_session("keep", "sa-east-1")
+    assert session is not None and session.profile_name == "keep"
+    assert identity_engine.get_validated_session("other", "sa-east-1") is None
+
+
+def test_get_current_aws_identity_uses_disk_cache(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setenv(identity_engine.IDENTITY_CACHE_TTL_ENV, "60")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(boto3.session, "Session", _fake_session_factory(calls))
+
+    first = identity_engine.get_current_aws_identity(profile="p", region="us-east-1")
+    second = identity_engine.get_current_aws_identity(profile="p", region="us-east-1")
+
+    assert first == second
+    assert calls == ["sts"]
+    assert (tmp_path / "tago" / "identity.json").exists()
+
+    # outras credenciais -> outra chave, volta ao STS
+    monkeypatch.setattr(boto3.session, "Session", _fake_session_factory(calls, access_key="AKIA2"))
+    identity_engine.get_current_aws_identity(profile="p", region="us-east-1")
+    assert calls == ["sts", "sts"]
+
+
+def test_get_current_aws_identity_disk_cache_expires(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setenv(identity_engine.IDENTITY_CACHE_TTL_ENV, "60")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(boto3.session, "Session", _fake_session_factory(calls))
+
+    now = [1000.0]
+    monkeypatch.setattr(identity_engine.time, "time", lambda: now[0])
+
+    identity_engine.get_current_aws_identity(profile="p", region="us-east-1")
+    now[0] += 61
+    identity_engine.get_current_aws_identity(profile="p", region="us-east-1")
+
+    assert calls == ["sts", "sts"]
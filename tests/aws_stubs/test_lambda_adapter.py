@@ -24,11 +24,11 @@ def test_lambda_apply_tags_calls_tag_resource_with_dict(monkeypatch):
     )
 
     tagset = TagSet.from_dict({"Owner": "team"})
-    # override=True means desired wins; final should include Keep + Owner
+    # override=True means desired wins; only the delta (Owner) is sent
     stubber.add_response(
         "tag_resource",
         {},
-        expected_params={"Resource": arn_str, "Tags": {"Keep": "yes", "Owner": "team"}},
+        expected_params={"Resource": arn_str, "Tags": {"Owner": "team"}},
     )
 
     monkeypatch.setattr(session, "client", lambda name: client)
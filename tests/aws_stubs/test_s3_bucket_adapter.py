@@ -70,3 +70,46 @@ def test_s3_apply_tags_calls_put_bucket_tagging(monkeypatch):
 
     assert result.pretty_name == "S3 Bucket"
     assert result.final_tags == {"Owner": "team", "Env": "hml"}
+
+
+def test_s3_list_resources_records_bucket_regions_and_routes_clients(monkeypatch):
+    import core.adapters.s3_bucket as s3_module
+    from core.bucket_regions import BucketRegionResolver
+
+    resolver = BucketRegionResolver()
+    monkeypatch.setattr(s3_module, "bucket_regions", resolver)
+
+    session = boto3.session.Session(region_name="us-east-1")
+    client = session.client("s3")
+    stubber = Stubber(client)
+    stubber.add_response(
+        "list_buckets",
+        {
+            "Buckets": [
+                {"Name": "a", "BucketArn": "arn:aws:s3:::a", "BucketRegion": "sa-east-1"},
+                {"Name": "b", "BucketArn": "arn:aws:s3:::b", "BucketRegion": "us-east-1"},
+            ]
+        },
+        expected_params={},
+    )
+
+    class _Pool:
+        region_name = "us-east-1"
+
+        def __init__(self, region="us-east-1"):
+            self.region = region
+
+        def client(self, name):
+            return (name, self.region)
+
+        def for_region(self, region):
+            return _Pool(region)
+
+    monkeypatch.setattr(session, "client", lambda name: client)
+
+    with stubber:
+        arns = list(S3BucketTagAdapter.list_resources(session))
+
+    # nenhum HeadBucket: a região veio da listagem
+    assert S3BucketTagAdapter(arns[0], _Pool()).client == ("s3", "sa-east-1")
+    assert S3BucketTagAdapter(arns[1], _Pool()).client == ("s3", "us-east-1")
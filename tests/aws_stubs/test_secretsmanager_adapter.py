@@ -23,15 +23,15 @@ def test_secretsmanager_apply_tags_calls_tag_resource(monkeypatch):
     )
 
     tagset = TagSet.from_dict({"Owner": "team"})
-    expected_final = [
-        {"Key": "Keep", "Value": "yes"},
+    # API aditiva: só o delta é enviado
+    expected_changed = [
         {"Key": "Owner", "Value": "team"},
     ]
 
     stubber.add_response(
         "tag_resource",
         {},
-        expected_params={"SecretId": arn_str, "Tags": expected_final},
+        expected_params={"SecretId": arn_str, "Tags": expected_changed},
     )
 
     monkeypatch.setattr(session, "client", lambda name: client)
@@ -42,3 +42,24 @@ def test_secretsmanager_apply_tags_calls_tag_resource(monkeypatch):
 
     assert result.pretty_name == "Secrets Manager Secret"
     assert result.final_tags == {"Keep": "yes", "Owner": "team"}
+
+
+def test_secretsmanager_list_resources_harvests_tags_from_list_secrets(monkeypatch):
+    session = boto3.session.Session(region_name="us-east-1")
+    client = session.client("secretsmanager")
+    stubber = Stubber(client)
+
+    arn = "arn:aws:secretsmanager:us-east-1:123456789012:secret:db-AbCdEf"
+    stubber.add_response(
+        "list_secrets",
+        {"SecretList": [{"ARN": arn, "Name": "db", "Tags": [{"Key": "Owner", "Value": "team"}]}]},
+        expected_params={},
+    )
+
+    monkeypatch.setattr(session, "client", lambda name: client)
+
+    with stubber:
+        (listed,) = SecretsManagerSecretTagAdapter.list_resources(session)
+
+    assert listed.arn.raw == arn
+    assert listed.tags == {"Owner": "team"}
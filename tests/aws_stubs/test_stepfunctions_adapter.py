@@ -23,8 +23,8 @@ def test_stepfunctions_apply_tags_calls_tag_resource(monkeypatch):
     )
 
     tagset = TagSet.from_dict({"Owner": "team"})
+    # API aditiva: só o delta é enviado
     expected_sf_tags = [
-        {"key": "Keep", "value": "yes"},
         {"key": "Owner", "value": "team"},
     ]
 
@@ -0,0 +1,147 @@
+from pathlib import Path
+
+import yaml
+from typer.testing import CliRunner
+
+from cli.main import app
+from core.models import ScanReport, ScanResourceReport
+
+
+runner = CliRunner()
+
+
+def test_cli_scan_all_uses_combined_report(monkeypatch, tmp_path: Path):
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    import importlib
+    cmd = importlib.import_module("cli.commands.scan")
+
+    received = {}
+
+    def fake_scan_all_resources(**kwargs):
+        received.update(kwargs)
+        report = ScanReport(
+            service="all",
+            service_type=None,
+            checked_at="2024-01-01T00:00:00+00:00",
+            summary={"total_resources": 1, "compliant": 1, "non_compliant": 0},
+            resources=[
+                ScanResourceReport(name="b", arn="arn:aws:s3:::b", adapter="S3BucketTagAdapter", status="compliant", missing_tags=[]),
+            ],
+            adapter_summaries={"S3BucketTagAdapter": {"total_resources": 1, "compliant": 1, "non_compliant": 0}},
+        )
+        kwargs["writer"].write_report(report)
+        return report
+
+    monkeypatch.setattr(cmd, "scan_all_resources", fake_scan_all_resources)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    res = runner.invoke(app, ["scan", "--all", "--template", str(tpl), "--concurrency", "4"])
+
+    assert res.exit_code == 0, res.stdout
+    assert received["concurrency"] == 4
+    doc = yaml.safe_load(res.stdout)
+    assert doc["service"] == "all"
+    assert doc["adapter_summaries"]["S3BucketTagAdapter"]["total_resources"] == 1
+
+
+def test_cli_scan_requires_service_or_all(monkeypatch, tmp_path: Path):
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    assert runner.invoke(app, ["scan", "--template", str(tpl)]).exit_code != 0
+    assert runner.invoke(app, ["scan", "s3", "--all", "--template", str(tpl)]).exit_code != 0
+
+
+def test_cli_scan_passes_inventory_and_refresh_policy(monkeypatch, tmp_path: Path):
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    import importlib
+    cmd = importlib.import_module("cli.commands.scan")
+
+    received = {}
+
+    def fake_scan_resources(**kwargs):
+        received.update(kwargs)
+        report = ScanReport(
+            service="s3",
+            service_type=None,
+            checked_at="2024-01-01T00:00:00+00:00",
+            summary={"total_resources": 0, "compliant": 0, "non_compliant": 0},
+            resources=[],
+        )
+        kwargs["writer"].write_report(report)
+        return report
+
+    monkeypatch.setattr(cmd, "scan_resources", fake_scan_resources)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+    inv = tmp_path / "inv.sqlite3"
+
+    res = runner.invoke(app, [
+        "scan", "s3", "--template", str(tpl),
+        "--inventory", str(inv), "--refresh-older-than", "6h",
+    ])
+
+    assert res.exit_code == 0, res.stdout
+    assert received["refresh_older_than"] == 6 * 3600
+    assert received["inventory"].path == inv
+    assert inv.exists()
+
+    bad = runner.invoke(app, ["scan", "s3", "--template", str(tpl), "--refresh-older-than", "soon"])
+    assert bad.exit_code != 0
+
+
+def test_cli_scan_writes_gzip_chunks(monkeypatch, tmp_path: Path):
+    import gzip
+
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    import importlib
+    cmd = importlib.import_module("cli.commands.scan")
+
+    def fake_scan_resources(**kwargs):
+        report = ScanReport(
+            service="s3",
+            service_type=None,
+            checked_at="2024-01-01T00:00:00+00:00",
+            summary={"total_resources": 3, "compliant": 3, "non_compliant": 0},
+            resources=[
+                ScanResourceReport(name=f"b{i}", arn=f"arn:aws:s3:::b{i}", adapter="S3BucketTagAdapter", status="compliant", missing_tags=[])
+                for i in range(3)
+            ],
+        )
+        kwargs["writer"].write_report(report)
+        return report
+
+    monkeypatch.setattr(cmd, "scan_resources", fake_scan_resources)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    res = runner.invoke(app, [
+        "scan", "s3", "--template", str(tpl),
+        "--output", str(tmp_path / "out" / "report.yaml.gz"), "--chunk-size", "2",
+    ])
+
+    assert res.exit_code == 0, res.stdout
+    first, second = (
+        yaml.safe_load(gzip.open(tmp_path / "out" / name, "rt", encoding="utf-8"))
+        for name in ("report.00001.yaml.gz", "report.00002.yaml.gz")
+    )
+    assert [r["name"] for r in first["resources"]] == ["b0", "b1"]
+    assert [r["name"] for r in second["resources"]] == ["b2"]
+    assert (first["part"], second["part"]) == (1, 2)
+    assert "summary" not in first
+    assert second["summary"]["total_resources"] == 3
+
+    assert runner.invoke(app, ["scan", "s3", "--template", str(tpl), "--chunk-size", "2"]).exit_code != 0
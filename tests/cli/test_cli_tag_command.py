@@ -15,7 +15,7 @@ def test_cli_tag_dry_run_json(monkeypatch, tmp_path: Path):
     import core.engine.identity_engine as identity
     monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
 
-    # fake tag_resources return
+    # fake iter_tag_resources return
     import importlib
     cmd = importlib.import_module("cli.commands.tag")
     fake_result = TagRunResult(
@@ -25,7 +25,7 @@ def test_cli_tag_dry_run_json(monkeypatch, tmp_path: Path):
         final_tags={"Owner": "team", "Keep": "yes"},
         pretty_name="S3 Bucket",
     )
-    monkeypatch.setattr(cmd, "tag_resources", lambda **kwargs: [fake_result])
+    monkeypatch.setattr(cmd, "iter_tag_resources", lambda **kwargs: iter([fake_result]))
 
     tpl = tmp_path / "t.yaml"
     tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
@@ -46,7 +46,8 @@ def test_cli_tag_dry_run_json(monkeypatch, tmp_path: Path):
 
     assert res.exit_code == 0, res.stdout
     payload = json.loads(res.stdout)
-    assert "desired" in payload and "existing" in payload and "final" in payload
+    assert len(payload) == 1
+    assert "desired" in payload[0] and "existing" in payload[0] and "final" in payload[0]
 
 
 def test_cli_tag_dry_run_json_multiple_arns(monkeypatch, tmp_path: Path):
@@ -71,7 +72,7 @@ def test_cli_tag_dry_run_json_multiple_arns(monkeypatch, tmp_path: Path):
             pretty_name="S3 Bucket",
         ),
     ]
-    monkeypatch.setattr(cmd, "tag_resources", lambda **kwargs: fake_results)
+    monkeypatch.setattr(cmd, "iter_tag_resources", lambda **kwargs: iter(fake_results))
 
     tpl = tmp_path / "t.yaml"
     tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
@@ -94,4 +95,298 @@ def test_cli_tag_dry_run_json_multiple_arns(monkeypatch, tmp_path: Path):
 
     assert res.exit_code == 0, res.stdout
     payload = json.loads(res.stdout)
-    assert "desired" in payload and "existing" in payload and "final" in payload
+    assert [p["arn"] for p in payload] == ["arn:aws:s3:::a", "arn:aws:s3:::b"]
+    assert all("desired" in p and "existing" in p and "final" in p for p in payload)
+
+
+def _fake_streaming_engine(seen):
+    def fake_iter_tag_resources(arns, **kwargs):
+        for arn in arns:
+            seen.append(arn)
+            yield TagRunResult(
+                arn=arn,
+                desired_tags={"Owner": "team"},
+                existing_tags={},
+                final_tags={"Owner": "team"},
+                pretty_name="S3 Bucket",
+            )
+    return fake_iter_tag_resources
+
+
+def test_cli_tag_reads_arn_file(monkeypatch, tmp_path: Path):
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    import importlib
+    cmd = importlib.import_module("cli.commands.tag")
+    seen = []
+    monkeypatch.setattr(cmd, "iter_tag_resources", _fake_streaming_engine(seen))
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+    arn_file = tmp_path / "arns.txt"
+    arn_file.write_text("# buckets\narn:aws:s3:::a\n\n  arn:aws:s3:::b  \n", encoding="utf-8")
+
+    res = runner.invoke(
+        app,
+        ["tag", "--arn-file", str(arn_file), "--template", str(tpl), "--dry-run", "--output", "json"],
+    )
+
+    assert res.exit_code == 0, res.stdout
+    assert seen == ["arn:aws:s3:::a", "arn:aws:s3:::b"]
+    assert [p["arn"] for p in json.loads(res.stdout)] == seen
+
+
+def test_cli_tag_reads_arns_from_stdin(monkeypatch, tmp_path: Path):
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    import importlib
+    cmd = importlib.import_module("cli.commands.tag")
+    seen = []
+    monkeypatch.setattr(cmd, "iter_tag_resources", _fake_streaming_engine(seen))
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    res = runner.invoke(
+        app,
+        ["tag", "--arn", "arn:aws:s3:::first", "--arn", "-", "--template", str(tpl), "--dry-run"],
+        input="arn:aws:s3:::a\narn:aws:s3:::b\n",
+    )
+
+    assert res.exit_code == 0, res.stdout
+    assert seen == ["arn:aws:s3:::first", "arn:aws:s3:::a", "arn:aws:s3:::b"]
+    assert [p["arn"] for p in json.loads(res.stdout)] == seen
+
+
+def test_cli_tag_ndjson_emits_one_line_per_resource(monkeypatch, tmp_path: Path):
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    import importlib
+    cmd = importlib.import_module("cli.commands.tag")
+    seen = []
+    monkeypatch.setattr(cmd, "iter_tag_resources", _fake_streaming_engine(seen))
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    res = runner.invoke(
+        app,
+        ["tag", "--arn", "arn:aws:s3:::a", "--arn", "arn:aws:s3:::b", "--template", str(tpl), "--ndjson"],
+    )
+
+    assert res.exit_code == 0, res.stdout
+    lines = res.stdout.splitlines()
+    assert len(lines) == 2
+    records = [json.loads(line) for line in lines]
+    assert [r["arn"] for r in records] == ["arn:aws:s3:::a", "arn:aws:s3:::b"]
+    assert all(r["status"] == "updated" and "applied" in r for r in records)
+
+
+def test_cli_tag_default_json_streams_each_result(monkeypatch, tmp_path: Path):
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    import importlib
+    cmd = importlib.import_module("cli.commands.tag")
+
+    echoed = []
+    real_echo = cmd.typer.echo
+
+    def recording_echo(message=None, **kwargs):
+        echoed.append(message)
+        real_echo(message, **kwargs)
+
+    monkeypatch.setattr(cmd.typer, "echo", recording_echo)
+
+    # quantos trechos já tinham sido impressos quando cada recurso foi produzido
+    echoed_before = []
+    streaming = _fake_streaming_engine([])
+
+    def fake_iter_tag_resources(arns, **kwargs):
+        for result in streaming(arns, **kwargs):
+            echoed_before.append(len(echoed))
+            yield result
+
+    monkeypatch.setattr(cmd, "iter_tag_resources", fake_iter_tag_resources)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    res = runner.invoke(
+        app,
+        ["tag", "--arn", "arn:aws:s3:::a", "--arn", "arn:aws:s3:::b", "--template", str(tpl)],
+    )
+
+    assert res.exit_code == 0, res.stdout
+    # o primeiro recurso já foi impresso antes do engine produzir o segundo
+    assert echoed_before[0] == 0 and echoed_before[1] > 0
+    payload = json.loads(res.stdout)
+    assert [p["arn"] for p in payload] == ["arn:aws:s3:::a", "arn:aws:s3:::b"]
+
+
+def test_echo_document_matches_whole_document_dump(capsys):
+    import yaml
+
+    from cli.commands.tag import _echo_document
+
+    payloads = [{"arn": "arn:aws:s3:::a", "tags": {"Owner": "time"}}, {"arn": "arn:aws:s3:::b", "tags": {}}]
+
+    for output, dump in (
+        ("json", lambda data: json.dumps(data, indent=2, ensure_ascii=False) + "\n"),
+        ("yaml", lambda data: yaml.dump(data, allow_unicode=True) + "\n"),
+    ):
+        for data in (payloads, []):
+            _echo_document(iter(data), output)
+            assert capsys.readouterr().out == dump(data)
+
+
+def test_cli_tag_hands_validated_session_to_engine(monkeypatch, tmp_path: Path):
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    import importlib
+    cmd = importlib.import_module("cli.commands.tag")
+    validated = object()
+    monkeypatch.setattr(cmd, "get_validated_session", lambda profile, region: validated)
+
+    received = {}
+
+    def fake_iter_tag_resources(**kwargs):
+        received.update(kwargs)
+        return iter([])
+
+    monkeypatch.setattr(cmd, "iter_tag_resources", fake_iter_tag_resources)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    res = runner.invoke(app, ["tag", "--arn", "arn:aws:s3:::a", "--template", str(tpl), "--dry-run"])
+
+    assert res.exit_code == 0, res.stdout
+    assert received["session"] is validated
+
+
+def test_cli_tag_rejects_unknown_verify_mode(monkeypatch, tmp_path: Path):
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    from core.engine import VERIFY_MODES
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    res = runner.invoke(
+        app,
+        ["tag", "--arn", "arn:aws:s3:::a", "--template", str(tpl), "--verify", "always"],
+    )
+
+    assert res.exit_code != 0
+    assert ", ".join(VERIFY_MODES) in res.output
+
+
+def test_cli_tag_exits_non_zero_when_create_tags_fails(monkeypatch, tmp_path: Path):
+    import boto3
+    from botocore.stub import Stubber
+
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    import importlib
+    cmd = importlib.import_module("cli.commands.tag")
+
+    session = boto3.session.Session(
+        region_name="us-east-1", aws_access_key_id="testing", aws_secret_access_key="testing"
+    )
+    client = session.client("ec2")
+    stubber = Stubber(client)
+    stubber.add_response(
+        "describe_tags",
+        {"Tags": [{"ResourceId": "i-abc123", "Key": "Keep", "Value": "yes"}]},
+    )
+    stubber.add_client_error("create_tags", service_error_code="UnauthorizedOperation")
+
+    monkeypatch.setattr(session, "client", lambda name, **kwargs: client)
+    monkeypatch.setattr(cmd, "get_validated_session", lambda profile, region: session)
+    monkeypatch.setattr(cmd, "_open_inventory", lambda path: None)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    with stubber:
+        res = runner.invoke(
+            app,
+            ["tag", "--arn", "arn:aws:ec2:us-east-1:123456789012:instance/i-abc123", "--template", str(tpl)],
+        )
+
+    stubber.assert_no_pending_responses()
+    assert res.exit_code == 1
+    [record] = json.loads(res.stdout)
+    assert record["status"] == "failed"
+    assert "UnauthorizedOperation" in record["error"]
+
+
+def test_cli_tag_bulk_exits_non_zero_on_partially_failed_chunk(monkeypatch, tmp_path: Path):
+    import core.engine.identity_engine as identity
+    monkeypatch.setattr(identity, "get_current_aws_identity", lambda profile=None, region=None: object())
+
+    import core.adapters.s3_bucket as s3_module
+    from core.bucket_regions import BucketRegionResolver
+
+    resolver = BucketRegionResolver()
+    resolver.remember([("ok-bucket", "us-east-1"), ("denied-bucket", "us-east-1")])
+    monkeypatch.setattr(s3_module, "bucket_regions", resolver)
+
+    import importlib
+    cmd = importlib.import_module("cli.commands.tag")
+
+    ok, denied = "arn:aws:s3:::ok-bucket", "arn:aws:s3:::denied-bucket"
+    sent = []
+
+    class _S3:
+        class exceptions:
+            class NoSuchKey(Exception):
+                pass
+
+        def get_bucket_tagging(self, Bucket):
+            return {"TagSet": [{"Key": "Keep", "Value": "yes"}]}
+
+    class _Tagging:
+        def tag_resources(self, ResourceARNList, Tags):
+            sent.append(sorted(ResourceARNList))
+            return {"FailedResourcesMap": {denied: {"ErrorCode": "AccessDenied", "ErrorMessage": "no"}}}
+
+        def get_resources(self, ResourceARNList):
+            tags = [{"Key": "Keep", "Value": "yes"}, {"Key": "Owner", "Value": "team"}]
+            return {"ResourceTagMappingList": [{"ResourceARN": ok, "Tags": tags}]}
+
+    class _Session:
+        region_name = "us-east-1"
+        profile_name = None
+
+        def get_credentials(self):
+            return None
+
+        def client(self, service_name, region_name=None, config=None):
+            return _S3() if service_name == "s3" else _Tagging()
+
+    monkeypatch.setattr(cmd, "get_validated_session", lambda profile, region: _Session())
+    monkeypatch.setattr(cmd, "_open_inventory", lambda path: None)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    res = runner.invoke(
+        app,
+        ["tag", "--arn", ok, "--arn", denied, "--template", str(tpl), "--bulk", "--ndjson"],
+    )
+
+    # um único TagResources com os dois ARNs, só um deles falhou
+    assert sent == [sorted([ok, denied])]
+    assert res.exit_code == 1
+    records = {r["arn"]: r for r in map(json.loads, res.stdout.splitlines())}
+    assert records[ok]["status"] == "updated"
+    assert records[denied]["status"] == "failed"
+    assert records[denied]["error"] == "AccessDenied: no"
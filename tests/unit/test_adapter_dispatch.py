@@ -0,0 +1,100 @@
+import pytest
+
+import core.adapters as adapters
+from core.adapters import get_adapter_for_arn, get_adapters_for_service
+from core.adapters.dynamodb_table import DynamoDBTableTagAdapter
+from core.adapters.lambda_function import LambdaFunctionTagAdapter
+from core.adapters.s3_bucket import S3BucketTagAdapter
+from core.arn import Arn
+
+
+def test_resource_prefix_takes_first_token():
+    assert adapters._resource_prefix("function:minha-fn:1") == "function:"
+    assert adapters._resource_prefix("table/T/stream/x") == "table/"
+    assert adapters._resource_prefix("log-group:/aws/lambda/x:*") == "log-group:"
+    assert adapters._resource_prefix("my-bucket") == ""
+
+
+def test_get_adapter_for_arn_uses_index_and_memoizes(monkeypatch):
+    fn = Arn.parse("arn:aws:lambda:us-east-1:123456789012:function:a")
+    table = Arn.parse("arn:aws:dynamodb:us-east-1:123456789012:table/T")
+    bucket = Arn.parse("arn:aws:s3:::my-bucket")
+
+    assert get_adapter_for_arn(fn) is LambdaFunctionTagAdapter
+    assert get_adapter_for_arn(table) is DynamoDBTableTagAdapter
+    assert get_adapter_for_arn(bucket) is S3BucketTagAdapter
+
+    # depois da primeira resolução, o mesmo (serviço, prefixo) não chama supports()
+    calls = []
+    original = LambdaFunctionTagAdapter.supports.__func__
+
+    def _counting(cls, arn):
+        calls.append(arn.raw)
+        return original(cls, arn)
+
+    monkeypatch.setattr(LambdaFunctionTagAdapter, "supports", classmethod(_counting))
+
+    other_fn = Arn.parse("arn:aws:lambda:sa-east-1:123456789012:function:b")
+    assert get_adapter_for_arn(other_fn) is LambdaFunctionTagAdapter
+    assert calls == []
+
+
+def test_get_adapter_for_arn_memo_matches_supports_case():
+    bucket = Arn.parse("arn:aws:s3:::my-bucket")
+    assert get_adapter_for_arn(bucket) is S3BucketTagAdapter
+
+    # supports() diferencia maiúsculas: o memo de "s3" não pode responder "S3"
+    with pytest.raises(ValueError):
+        get_adapter_for_arn(Arn.parse("arn:aws:S3:::my-bucket"))
+
+
+def test_get_adapter_for_arn_memo_skips_unknown_prefixes(monkeypatch):
+    monkeypatch.setattr(adapters, "_arn_memo", {})
+
+    for i in range(3):
+        obj = Arn.parse(f"arn:aws:s3:::bucket-{i}/key")
+        assert get_adapter_for_arn(obj) is S3BucketTagAdapter
+
+    fn = Arn.parse("arn:aws:lambda:us-east-1:123456789012:function:a")
+    assert get_adapter_for_arn(fn) is LambdaFunctionTagAdapter
+
+    # "bucket-N/" não é prefixo do índice: só o da Lambda fica memoizado
+    assert set(adapters._arn_memo) == {("lambda", "function:")}
+
+
+def test_get_adapter_for_arn_unknown_raises():
+    with pytest.raises(ValueError):
+        get_adapter_for_arn(Arn.parse("arn:aws:lambda:us-east-1:123456789012:layer:x"))
+
+    with pytest.raises(ValueError):
+        get_adapter_for_arn(Arn.parse("arn:aws:sqs:us-east-1:123456789012:queue"))
+
+
+def test_get_adapters_for_service_by_service_and_type():
+    assert get_adapters_for_service("S3", None) is S3BucketTagAdapter
+    assert get_adapters_for_service("lambda", "Functions") is LambdaFunctionTagAdapter
+
+    with pytest.raises(ValueError):
+        get_adapters_for_service("lambda", "layers")
+
+
+def test_get_listing_adapters_returns_only_listing_adapters():
+    from core.adapters import get_listing_adapters
+
+    listing = get_listing_adapters()
+
+    assert S3BucketTagAdapter in listing
+    assert LambdaFunctionTagAdapter in listing
+    assert DynamoDBTableTagAdapter not in listing
+    assert all(a.supports_listing() for a in listing)
+
+
+def test_adapters_listing_with_tags_declare_it():
+    from core.adapters.ec2_instance import EC2InstanceTagAdapter
+    from core.adapters.iam_role import IAMRoleTagAdapter
+    from core.adapters.secretsmanager_secret import SecretsManagerSecretTagAdapter
+
+    assert EC2InstanceTagAdapter.lists_with_tags
+    assert SecretsManagerSecretTagAdapter.lists_with_tags
+    assert IAMRoleTagAdapter.lists_with_tags
+    assert not LambdaFunctionTagAdapter.lists_with_tags
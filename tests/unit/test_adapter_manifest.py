@@ -0,0 +1,57 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from cli.main import app
+from core.adapters.manifest import ADAPTER_MANIFEST, build_manifest
+
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def test_manifest_is_in_sync_with_adapters():
+    # se falhar: rode `python -m core.adapters.manifest` e atualize o bloco gerado
+    assert ADAPTER_MANIFEST == build_manifest()
+
+
+def test_adapter_lookup_imports_only_the_needed_module():
+    code = (
+        "import sys\n"
+        "from core.adapters import get_adapter_for_arn\n"
+        "from core.arn import Arn\n"
+        "get_adapter_for_arn(Arn.parse('arn:aws:dynamodb:us-east-1:123456789012:table/T'))\n"
+        "print(','.join(sorted(m for m in sys.modules if m.startswith('core.adapters.'))))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC, capture_output=True, text=True, check=True
+    ).stdout
+
+    assert out.strip().split(",") == [
+        "core.adapters.base",
+        "core.adapters.dynamodb_table",
+        "core.adapters.manifest",
+    ]
+
+
+def test_adapters_manifest_does_not_import_boto3():
+    code = (
+        "import sys\n"
+        "import core.adapters.manifest\n"
+        "print('boto3' in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC, capture_output=True, text=True, check=True
+    ).stdout
+
+    assert out.strip() == "False"
+
+
+def test_cli_adapters_lists_from_manifest():
+    res = CliRunner().invoke(app, ["adapters", "--json"])
+
+    assert res.exit_code == 0, res.stdout
+    payload = json.loads(res.stdout)
+    assert {a["name"] for a in payload} == {e.name for e in ADAPTER_MANIFEST}
@@ -26,23 +26,49 @@ def test_get_aws_tags_safe_mode_preserves_existing_on_conflict(monkeypatch):
     # bypass __init__; we only need get_current_tags + helpers
 
     tagset = TagSet.from_dict({"K": "desired", "D": "new"})
-    desired, existing, final = _FakeAdapter._get_aws_tags(adapter, tagset, override=False)
+    desired, existing, final, changed = _FakeAdapter._get_aws_tags(adapter, tagset, override=False)
 
     final_map = {t["Key"]: t["Value"] for t in final}
     # SAFE: existing wins
     assert final_map["K"] == "existing"
     assert final_map["E"] == "keep"
     assert final_map["D"] == "new"
+    # só a chave nova precisa ser escrita
+    assert changed == [{"Key": "D", "Value": "new"}]
 
 
 def test_get_aws_tags_override_mode_desired_wins_on_conflict(monkeypatch):
     adapter = object.__new__(_FakeAdapter)
 
     tagset = TagSet.from_dict({"K": "desired", "D": "new"})
-    desired, existing, final = _FakeAdapter._get_aws_tags(adapter, tagset, override=True)
+    desired, existing, final, changed = _FakeAdapter._get_aws_tags(adapter, tagset, override=True)
 
     final_map = {t["Key"]: t["Value"] for t in final}
     # OVERRIDE: desired wins
     assert final_map["K"] == "desired"
     assert final_map["E"] == "keep"
     assert final_map["D"] == "new"
+    # valor sobrescrito + chave nova
+    assert {t["Key"]: t["Value"] for t in changed} == {"K": "desired", "D": "new"}
+
+
+def test_get_aws_tags_empty_delta_when_compliant():
+    adapter = object.__new__(_FakeAdapter)
+
+    tagset = TagSet.from_dict({"K": "existing"})
+    _, _, _, changed = _FakeAdapter._get_aws_tags(adapter, tagset, override=True)
+
+    assert changed == []
+
+
+def test_get_aws_tags_uses_prefetched_snapshot_once():
+    adapter = object.__new__(_FakeAdapter)
+    adapter.prefetch_tags({"K": "prefetched"})
+
+    tagset = TagSet.from_dict({"D": "new"})
+    _, existing, _, _ = _FakeAdapter._get_aws_tags(adapter, tagset, override=False)
+    assert existing == [{"Key": "K", "Value": "prefetched"}]
+
+    # consumido: o próximo merge volta a ler do recurso
+    _, existing, _, _ = _FakeAdapter._get_aws_tags(adapter, tagset, override=False)
+    assert {t["Key"] for t in existing} == {"K", "E"}
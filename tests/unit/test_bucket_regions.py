@@ -0,0 +1,57 @@
+from botocore.exceptions import ClientError
+
+from core.bucket_regions import BUCKET_REGION_CACHE_TTL_ENV, BucketRegionResolver
+
+
+class _HeadClient:
+    def __init__(self, response=None, error_region=None):
+        self.response = response
+        self.error_region = error_region
+        self.calls = []
+
+    def head_bucket(self, Bucket):
+        self.calls.append(Bucket)
+        if self.error_region:
+            raise ClientError(
+                {
+                    "Error": {"Code": "301", "Message": "Moved Permanently"},
+                    "ResponseMetadata": {"HTTPHeaders": {"x-amz-bucket-region": self.error_region}},
+                },
+                "HeadBucket",
+            )
+        return self.response
+
+
+def test_resolver_uses_listing_regions_then_head_bucket(monkeypatch, tmp_path):
+    monkeypatch.delenv(BUCKET_REGION_CACHE_TTL_ENV, raising=False)
+    resolver = BucketRegionResolver(tmp_path / "regions.json")
+
+    resolver.remember([("listed", "sa-east-1"), ("unknown", None)])
+    client = _HeadClient(response={"BucketRegion": "eu-west-1"})
+
+    assert resolver.resolve("listed", client) == "sa-east-1"
+    assert resolver.resolve("other", client) == "eu-west-1"
+    # memoizado: HeadBucket só uma vez por bucket
+    assert resolver.resolve("other", client) == "eu-west-1"
+    assert client.calls == ["other"]
+
+    # redirect/403 ainda trazem a região no header
+    assert resolver.resolve("moved", _HeadClient(error_region="ap-south-1")) == "ap-south-1"
+
+    # sem TTL, nada vai para o disco
+    assert not (tmp_path / "regions.json").exists()
+
+
+def test_resolver_persists_to_disk_with_ttl(monkeypatch, tmp_path):
+    monkeypatch.setenv(BUCKET_REGION_CACHE_TTL_ENV, "3600")
+    path = tmp_path / "regions.json"
+
+    BucketRegionResolver(path).remember([("b1", "us-west-2")])
+
+    fresh = BucketRegionResolver(path)
+    client = _HeadClient(response={})
+    assert fresh.resolve("b1", client) == "us-west-2"
+    assert client.calls == []
+
+    # HeadBucket sem região: não memoiza nem inventa
+    assert fresh.resolve("b2", client) is None
@@ -0,0 +1,112 @@
+import threading
+
+from core.clients import ClientPool
+
+
+class _FakeCredentials:
+    def __init__(self, access_key):
+        self.access_key = access_key
+
+    def get_frozen_credentials(self):
+        return self
+
+
+class _FakeSession:
+    region_name = "us-east-1"
+    profile_name = "p"
+
+    def __init__(self):
+        self.access_key = "AKIA1"
+        self.calls = []
+
+    def get_credentials(self):
+        return _FakeCredentials(self.access_key)
+
+    def client(self, service_name, region_name=None, config=None):
+        self.calls.append((service_name, region_name, config))
+        return object()
+
+
+def test_client_pool_reuses_client_per_service_and_region():
+    session = _FakeSession()
+    pool = ClientPool(session, max_pool_connections=32)
+
+    a = pool.client("s3")
+    b = pool.client("s3")
+    c = pool.client("s3", region_name="sa-east-1")
+    d = pool.client("lambda")
+
+    assert a is b
+    assert a is not c
+    assert a is not d
+    assert [(name, region) for name, region, _ in session.calls] == [
+        ("s3", "us-east-1"),
+        ("s3", "sa-east-1"),
+        ("lambda", "us-east-1"),
+    ]
+    assert session.calls[0][2].max_pool_connections == 32
+
+
+def test_client_pool_keys_on_credentials():
+    session = _FakeSession()
+    pool = ClientPool(session)
+
+    a = pool.client("s3")
+    session.access_key = "AKIA2"
+    b = pool.client("s3")
+
+    assert a is not b
+
+
+def test_client_pool_is_thread_safe():
+    session = _FakeSession()
+    pool = ClientPool(session)
+    seen = []
+
+    def _worker():
+        for _ in range(50):
+            seen.append(pool.client("dynamodb"))
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(session.calls) == 1
+    assert len({id(c) for c in seen}) == 1
+
+
+def test_client_pool_reads_credentials_outside_the_lock_after_first_load():
+    session = _FakeSession()
+    pool = ClientPool(session)
+    lock_held = []
+
+    original = session.get_credentials
+
+    def _tracking_get_credentials():
+        lock_held.append(pool._lock.locked())
+        return original()
+
+    session.get_credentials = _tracking_get_credentials
+
+    pool.client("s3")
+    pool.client("s3")
+    pool.client("lambda")
+
+    # só a primeira resolução acontece sob o lock do pool
+    assert lock_held == [True, False, False]
+
+
+def test_client_pool_for_region_routes_to_regional_clients():
+    session = _FakeSession()
+    pool = ClientPool(session)
+
+    sa = pool.for_region("sa-east-1")
+    assert sa.region_name == "sa-east-1"
+    assert sa.client("lambda") is pool.client("lambda", region_name="sa-east-1")
+
+    # sem região (IAM/S3) ou na região default: o próprio pool
+    assert pool.for_region(None) is pool
+    assert pool.for_region("us-east-1") is pool
+    assert sa.for_region(None) is pool
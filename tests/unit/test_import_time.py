@@ -0,0 +1,85 @@
+"""
+Orçamento de import do CLI, medido com `python -X importtime`.
+
+O startup (`tago --version`, `--help`, `adapters`) não pode carregar boto3,
+jinja2 nem yaml: eles só entram quando um comando de engine roda.
+
+A verificação padrão olha `sys.modules`, que não depende da máquina; o
+orçamento em tempo de relógio é opt-in (TAGO_IMPORT_TIME_BUDGET_MS).
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+HEAVY_MODULES = ("boto3", "botocore", "jinja2", "yaml")
+
+# Tempo cumulativo máximo (ms) de `import cli.main`, só medido quando a
+# variável está definida: em CI compartilhado o relógio varia demais.
+IMPORT_TIME_BUDGET_ENV = "TAGO_IMPORT_TIME_BUDGET_MS"
+
+
+def _importtime(code: str) -> Dict[str, int]:
+    """
+    Roda `code` com -X importtime e devolve {módulo: tempo cumulativo em µs}.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+    )
+
+    modules: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--version"], ["--help"], ["tag", "--help"], ["adapters", "--text"]],
+)
+def test_cli_startup_does_not_import_heavy_modules(argv):
+    code = (
+        "from cli.main import app\n"
+        f"app({argv!r}, standalone_mode=False)\n"
+    )
+    modules = _importtime(code)
+
+    assert "cli.main" in modules
+    assert not [m for m in modules if m.split(".")[0] in HEAVY_MODULES]
+
+
+def test_cli_import_leaves_heavy_modules_out_of_sys_modules():
+    code = (
+        "import json, sys\n"
+        "import cli.main\n"
+        f"print(json.dumps(sorted(m for m in sys.modules if m.split('.')[0] in {HEAVY_MODULES!r})))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=SRC, capture_output=True, text=True)
+
+    assert proc.returncode == 0, proc.stderr
+    assert json.loads(proc.stdout) == []
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not os.environ.get(IMPORT_TIME_BUDGET_ENV),
+    reason=f"defina {IMPORT_TIME_BUDGET_ENV} para medir o orçamento de import",
+)
+def test_cli_import_time_budget():
+    budget_ms = int(os.environ[IMPORT_TIME_BUDGET_ENV])
+    modules = _importtime("import cli.main")
+
+    assert modules["cli.main"] < budget_ms * 1000
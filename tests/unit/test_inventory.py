@@ -0,0 +1,39 @@
+import pytest
+import typer
+
+from cli.params import parse_duration
+from core.inventory import Inventory
+
+
+def test_inventory_round_trip_and_freshness(tmp_path):
+    path = tmp_path / "inv.sqlite3"
+
+    with Inventory(path) as inv:
+        inv.record_tags("arn:1", "FakeAdapter", {"A": "1"}, now=100.0)
+        inv.record_seen("arn:2", "FakeAdapter", now=100.0)
+
+    with Inventory(path) as inv:
+        entry = inv.get("arn:1")
+        assert entry.tags == {"A": "1"}
+        assert entry.is_fresh(60, now=150.0)
+        assert not entry.is_fresh(60, now=200.0)
+
+        # visto na listagem, mas tags nunca lidas
+        assert not inv.get("arn:2").is_fresh(60, now=100.0)
+        assert inv.get("arn:3") is None
+
+        inv.invalidate(["arn:1"])
+        assert not inv.get("arn:1").is_fresh(60, now=150.0)
+
+
+def test_parse_duration():
+    assert parse_duration(None) is None
+    assert parse_duration("90") == 90
+    assert parse_duration("30s") == 30
+    assert parse_duration("15m") == 900
+    assert parse_duration("6h") == 6 * 3600
+    assert parse_duration("1d") == 86400
+
+    for bad in ("", "abc", "5w", "-1h"):
+        with pytest.raises(typer.BadParameter):
+            parse_duration(bad)
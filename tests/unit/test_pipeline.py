@@ -0,0 +1,63 @@
+import threading
+import time
+
+import pytest
+
+from core.engine.pipeline import pipelined_map
+
+
+def test_pipelined_map_preserves_order_with_concurrency():
+    def _slow_square(x):
+        # itens pares demoram mais, para terminarem fora de ordem
+        time.sleep(0.01 if x % 2 == 0 else 0)
+        return x * x
+
+    assert list(pipelined_map(_slow_square, range(20), concurrency=4)) == [x * x for x in range(20)]
+
+
+def test_pipelined_map_applies_backpressure_to_lister():
+    produced = []
+
+    def _source():
+        for i in range(1000):
+            produced.append(i)
+            yield i
+
+    results = pipelined_map(lambda x: x, _source(), concurrency=2, depth=4)
+    assert next(results) == 0
+
+    # dá tempo para o lister avançar o quanto puder
+    time.sleep(0.3)
+    # fila (depth) + leituras pendentes (depth) + o item em mãos do lister
+    assert len(produced) <= 4 + 4 + 1
+
+    results.close()
+
+
+def test_pipelined_map_stops_lister_when_consumer_gives_up():
+    def _source():
+        i = 0
+        while True:
+            yield i
+            i += 1
+
+    results = pipelined_map(lambda x: x, _source(), concurrency=2, depth=2)
+    assert next(results) == 0
+    results.close()
+
+    assert not [t for t in threading.enumerate() if t.name == "tago-pipeline-lister"]
+
+
+def test_pipelined_map_propagates_errors():
+    def _broken_source():
+        yield 1
+        raise RuntimeError("listing failed")
+
+    with pytest.raises(RuntimeError, match="listing failed"):
+        list(pipelined_map(lambda x: x, _broken_source(), concurrency=2))
+
+    def _fail(x):
+        raise ValueError(f"read failed: {x}")
+
+    with pytest.raises(ValueError, match="read failed"):
+        list(pipelined_map(_fail, [1, 2], concurrency=2))
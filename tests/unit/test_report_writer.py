@@ -0,0 +1,73 @@
+import io
+
+import yaml
+
+import core.report_writer as report_writer
+from core.models import ScanReport, ScanResourceReport
+from core.report_writer import ScanReportWriter, chunk_path
+
+
+def _resource(i, status="compliant"):
+    return ScanResourceReport(
+        name=f"r{i}",
+        arn=f"arn:aws:s3:::r{i}",
+        adapter="S3BucketTagAdapter",
+        status=status,
+        missing_tags=["Owner"] if status == "non_compliant" else [],
+    )
+
+
+def test_writer_streams_header_resources_and_summary(monkeypatch):
+    monkeypatch.setattr(report_writer, "WRITE_BATCH_SIZE", 2)
+
+    buf = io.StringIO()
+    writer = ScanReportWriter(stream=buf)
+    writer.begin("s3", None, "2024-01-01T00:00:00+00:00")
+
+    writer.write_resource(_resource(0))
+    writer.write_resource(_resource(1, "non_compliant"))
+    # lote cheio: já foi escrito, antes do fim do scan
+    assert "arn:aws:s3:::r1" in buf.getvalue()
+
+    writer.write_resource(_resource(2))
+    writer.finish({"total_resources": 3, "compliant": 2, "non_compliant": 1})
+
+    doc = yaml.safe_load(buf.getvalue())
+    assert list(doc) == ["service", "checked_at", "resources", "summary"]
+    assert [r["name"] for r in doc["resources"]] == ["r0", "r1", "r2"]
+    assert doc["resources"][1]["missing_tags"] == ["Owner"]
+    assert doc["summary"]["non_compliant"] == 1
+
+
+def test_writer_empty_report_and_to_yaml_share_format():
+    report = ScanReport(
+        service="lambda",
+        service_type="functions",
+        checked_at="2024-01-01T00:00:00+00:00",
+        summary={"total_resources": 0, "compliant": 0, "non_compliant": 0},
+        resources=[],
+    )
+
+    doc = yaml.safe_load(report.to_yaml())
+    assert doc["service_type"] == "functions"
+    assert doc["resources"] == []
+
+
+def test_to_yaml_keeps_summary_before_resources():
+    report = ScanReport(
+        service="s3",
+        service_type=None,
+        checked_at="2024-01-01T00:00:00+00:00",
+        summary={"total_resources": 1, "compliant": 1, "non_compliant": 0},
+        resources=[_resource(0)],
+        adapter_summaries={"S3BucketTagAdapter": {"total_resources": 1}},
+    )
+
+    doc = yaml.safe_load(report.to_yaml())
+    assert list(doc) == ["service", "checked_at", "summary", "resources", "adapter_summaries"]
+    assert doc["summary"]["total_resources"] == 1
+
+
+def test_chunk_path_keeps_suffixes(tmp_path):
+    assert chunk_path(tmp_path / "report.yaml", 3).name == "report.00003.yaml"
+    assert chunk_path(tmp_path / "report.yaml.gz", 1).name == "report.00001.yaml.gz"
@@ -0,0 +1,47 @@
+import pytest
+
+from core.rules import RuleTable
+from core.template_engine import CompiledTemplate
+
+
+RULES = {
+    "Environment": {"enum": ["dev", "hml", "prd"]},
+    "CostCenter": {"regex": "[0-9]+"},
+    "DataClassification": {"required_if": {"Environment": "prd"}},
+    "Backup": {"required_if": {"Environment": ["hml", "prd"], "Tier": "db"}},
+}
+
+
+def test_rule_table_evaluates_regex_enum_and_required_if():
+    table = RuleTable(RULES)
+
+    assert table.evaluate({"Environment": "dev", "CostCenter": "4022"}) == []
+    # regex/enum só valem para tags presentes
+    assert table.evaluate({}) == []
+
+    violations = table.evaluate({"Environment": "prod", "CostCenter": "CC-4022"})
+    assert len(violations) == 2
+    assert violations[0].startswith("Environment='prod' (enum")
+    assert violations[1].startswith("CostCenter='CC-4022' (regex")
+
+    violations = table.evaluate({"Environment": "prd", "Tier": "db"})
+    assert [v.split(" ")[0] for v in violations] == ["DataClassification", "Backup"]
+
+    assert table.evaluate({"Environment": "prd", "Tier": "db", "DataClassification": "internal", "Backup": "daily"}) == []
+
+
+def test_rule_table_rejects_invalid_rules():
+    for bad in (
+        {"Environment": ["dev"]},
+        {"Environment": {"oneof": ["dev"]}},
+        {"CostCenter": {"regex": "("}},
+        {"Backup": {"required_if": "prd"}},
+    ):
+        with pytest.raises(ValueError):
+            RuleTable(bad)
+
+
+def test_compiled_template_compiles_rules_once():
+    tpl = CompiledTemplate({"defaults": {"Owner": "team"}, "rules": RULES})
+    assert tpl.rules
+    assert not CompiledTemplate({"defaults": {"Owner": "team"}}).rules
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import pytest
+
 from core.engine import scan_engine
 
 
@@ -56,3 +58,321 @@ def test_scan_resources_marks_missing_tags(monkeypatch, tmp_path):
     assert len(non) == 1
     assert non[0].arn == "arn:1"
     assert non[0].missing_tags == ["B"]
+
+
+def test_scan_resources_concurrent_keeps_listing_order(monkeypatch, tmp_path):
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  A: 1\n", encoding="utf-8")
+
+    class _ManyAdapter(_FakeAdapter):
+        @classmethod
+        def list_resources(cls, session):
+            for i in range(50):
+                yield _FakeArn(f"arn:{i}")
+
+        def get_current_tags(self):
+            return {"A": "1"} if int(self.arn.raw.split(":")[1]) % 2 else {}
+
+    monkeypatch.setattr(scan_engine, "get_adapters_for_service", lambda service, service_type: _ManyAdapter)
+    monkeypatch.setattr(scan_engine, "Session", lambda profile_name, region_name: object())
+
+    report = scan_engine.scan_resources(
+        service="s",
+        service_type="t",
+        template_path=str(tpl),
+        profile="p",
+        region="us-east-1",
+        concurrency=8,
+    )
+
+    assert [r.arn for r in report.resources] == [f"arn:{i}" for i in range(50)]
+    assert report.summary["non_compliant"] == 25
+
+
+def test_scan_rejects_adapter_without_listing_before_any_call(monkeypatch, tmp_path):
+    from core.adapters.base import BaseTagAdapter
+
+    class _NoListingAdapter(_FakeAdapter):
+        tagging_api_type = "s:t"
+        # herda o list_resources do BaseTagAdapter, sem sobrescrever
+        list_resources = BaseTagAdapter.__dict__["list_resources"]
+
+    sweeps = []
+    monkeypatch.setattr(scan_engine, "get_tags_by_type", lambda pool, resource_type: sweeps.append(resource_type))
+
+    with pytest.raises(NotImplementedError, match="_NoListingAdapter"):
+        list(scan_engine._iter_adapter_resources(_NoListingAdapter, object(), set(), use_tagging_api=True, concurrency=1))
+
+    assert sweeps == []
+
+
+class _FakeTaggingArn(_FakeArn):
+    def __init__(self, raw, region="us-east-1"):
+        super().__init__(raw)
+        self.region = region
+
+
+class _FakeTaggingAdapter(_FakeAdapter):
+    tagging_api_type = "fake:thing"
+    reads = []
+
+    @classmethod
+    def tagging_api_arn(cls, arn):
+        return arn.raw
+
+    @classmethod
+    def list_resources(cls, session):
+        yield _FakeTaggingArn("arn:1")
+        yield _FakeTaggingArn("arn:2")
+        yield _FakeTaggingArn("arn:3")
+        yield _FakeTaggingArn("arn:4", region="sa-east-1")
+
+    def get_current_tags(self):
+        type(self).reads.append(self.arn.raw)
+        return {"A": "1", "B": "2"}
+
+
+class _FakeSession:
+    region_name = "us-east-1"
+
+
+def test_scan_resources_uses_tagging_api_snapshot(monkeypatch, tmp_path):
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  A: 1\n  B: 2\n", encoding="utf-8")
+
+    monkeypatch.setattr(scan_engine, "get_adapters_for_service", lambda service, service_type: _FakeTaggingAdapter)
+    monkeypatch.setattr(scan_engine, "Session", lambda profile_name, region_name: _FakeSession())
+    monkeypatch.setattr(
+        scan_engine,
+        "get_tags_by_type",
+        lambda pool, resource_type: {"arn:1": {"A": "1", "B": "2"}, "arn:2": {"A": "1"}},
+    )
+    _FakeTaggingAdapter.reads = []
+
+    report = scan_engine.scan_resources(
+        service="s",
+        service_type="t",
+        template_path=str(tpl),
+        profile="p",
+        region="us-east-1",
+        use_tagging_api=True,
+    )
+
+    by_arn = {r.arn: r for r in report.resources}
+    assert by_arn["arn:1"].status == "compliant"
+    assert by_arn["arn:2"].missing_tags == ["B"]
+    # ausente do snapshot na mesma região: sem tags, sem leitura individual
+    assert by_arn["arn:3"].missing_tags == ["A", "B"]
+    # outra região: snapshot não é conclusivo, lê pelo adapter
+    assert by_arn["arn:4"].status == "compliant"
+    assert _FakeTaggingAdapter.reads == ["arn:4"]
+
+
+def test_scan_all_resources_combines_adapters(monkeypatch, tmp_path):
+    from botocore.exceptions import ClientError
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  A: 1\n  B: 2\n", encoding="utf-8")
+
+    class _DeniedAdapter(_FakeAdapter):
+        @classmethod
+        def list_resources(cls, session):
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "no"}}, "List")
+            yield  # pragma: no cover
+
+    sessions = []
+
+    def _fake_session(profile_name, region_name):
+        sessions.append(profile_name)
+        return object()
+
+    monkeypatch.setattr(scan_engine, "get_listing_adapters", lambda: [_FakeAdapter, _DeniedAdapter])
+    monkeypatch.setattr(scan_engine, "Session", _fake_session)
+
+    report = scan_engine.scan_all_resources(
+        template_path=str(tpl),
+        profile="p",
+        region="us-east-1",
+        concurrency=2,
+    )
+
+    assert sessions == ["p"]
+    assert report.service == "all"
+    assert [r.arn for r in report.resources] == ["arn:1", "arn:2"]
+    assert report.summary == {"total_resources": 2, "compliant": 1, "non_compliant": 1}
+    assert report.adapter_summaries["_FakeAdapter"]["total_resources"] == 2
+    assert "AccessDenied" in report.adapter_summaries["_DeniedAdapter"]["error"]
+    assert "adapter_summaries:" in report.to_yaml()
+
+
+def test_scan_resources_uses_fresh_inventory_entries(monkeypatch, tmp_path):
+    from core.inventory import Inventory
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  A: 1\n", encoding="utf-8")
+
+    reads = []
+
+    class _CountingAdapter(_FakeAdapter):
+        def get_current_tags(self):
+            reads.append(self.arn.raw)
+            return super().get_current_tags()
+
+    monkeypatch.setattr(scan_engine, "get_adapters_for_service", lambda service, service_type: _CountingAdapter)
+    monkeypatch.setattr(scan_engine, "Session", lambda profile_name, region_name: object())
+
+    def _scan(inv):
+        return scan_engine.scan_resources(
+            service="s",
+            service_type="t",
+            template_path=str(tpl),
+            profile="p",
+            region="us-east-1",
+            inventory=inv,
+            refresh_older_than=3600,
+        )
+
+    with Inventory(tmp_path / "inv.sqlite3") as inv:
+        first = _scan(inv)
+        assert reads == ["arn:1", "arn:2"]
+
+        # dentro da janela de refresh: nada é relido
+        second = _scan(inv)
+        assert reads == ["arn:1", "arn:2"]
+        assert [r.status for r in second.resources] == [r.status for r in first.resources]
+
+        # entrada invalidada (ex.: após um tag) volta a ser lida
+        inv.invalidate(["arn:2"])
+        _scan(inv)
+        assert reads == ["arn:1", "arn:2", "arn:2"]
+
+
+def test_scan_resources_streams_into_writer(monkeypatch, tmp_path):
+    import io
+
+    import yaml
+
+    from core.report_writer import ScanReportWriter
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  A: 1\ndynamic:\n  B: '{{ b }}'\n", encoding="utf-8")
+
+    monkeypatch.setattr(scan_engine, "get_adapters_for_service", lambda service, service_type: _FakeAdapter)
+    monkeypatch.setattr(scan_engine, "Session", lambda profile_name, region_name: object())
+
+    buf = io.StringIO()
+    report = scan_engine.scan_resources(
+        service="s",
+        service_type="t",
+        template_path=str(tpl),
+        profile="p",
+        region="us-east-1",
+        writer=ScanReportWriter(stream=buf),
+    )
+
+    # recursos vão para o writer, não para o ScanReport
+    assert report.resources == []
+    assert report.summary["non_compliant"] == 1
+
+    doc = yaml.safe_load(buf.getvalue())
+    assert [r["arn"] for r in doc["resources"]] == ["arn:1", "arn:2"]
+    assert doc["summary"] == report.summary
+
+
+def test_scan_resources_reports_rule_violations(monkeypatch, tmp_path):
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text(
+        "defaults:\n  A: 1\nrules:\n  A:\n    enum: ['1']\n  B:\n    regex: '[0-9]+'\n",
+        encoding="utf-8",
+    )
+
+    class _ValuesAdapter(_FakeAdapter):
+        def get_current_tags(self):
+            if self.arn.raw == "arn:1":
+                return [{"Key": "A", "Value": "1"}, {"Key": "B", "Value": "x"}]
+            return [{"Key": "A", "Value": "1"}, {"Key": "B", "Value": "2"}]
+
+    monkeypatch.setattr(scan_engine, "get_adapters_for_service", lambda service, service_type: _ValuesAdapter)
+    monkeypatch.setattr(scan_engine, "Session", lambda profile_name, region_name: object())
+
+    report = scan_engine.scan_resources(
+        service="s",
+        service_type="t",
+        template_path=str(tpl),
+        profile="p",
+        region="us-east-1",
+    )
+
+    first, second = report.resources
+    assert first.status == "non_compliant"
+    assert first.missing_tags == []
+    assert first.violations == ["B='x' (regex: [0-9]+)"]
+    assert second.status == "compliant"
+    assert "violations:" in report.to_yaml()
+
+
+def test_scan_resources_skips_reads_for_listed_snapshots(monkeypatch, tmp_path):
+    from core.adapters.base import ListedResource
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  A: 1\n  B: 2\n", encoding="utf-8")
+
+    reads = []
+
+    class _HarvestingAdapter(_FakeAdapter):
+        @classmethod
+        def list_resources(cls, session):
+            yield ListedResource(arn=_FakeArn("arn:1"), tags={"A": "1", "B": "2"})
+            # item sem snapshot continua usando a leitura do adapter
+            yield _FakeArn("arn:2")
+
+        def get_current_tags(self):
+            reads.append(self.arn.raw)
+            return {"A": "1"}
+
+    monkeypatch.setattr(scan_engine, "get_adapters_for_service", lambda service, service_type: _HarvestingAdapter)
+    monkeypatch.setattr(scan_engine, "Session", lambda profile_name, region_name: object())
+
+    report = scan_engine.scan_resources(
+        service="s",
+        service_type="t",
+        template_path=str(tpl),
+        profile="p",
+        region="us-east-1",
+        concurrency=2,
+    )
+
+    assert reads == ["arn:2"]
+    assert [(r.arn, r.status) for r in report.resources] == [("arn:1", "compliant"), ("arn:2", "non_compliant")]
+
+
+def test_scan_resources_skips_tagging_api_for_adapters_listing_with_tags(monkeypatch, tmp_path):
+    from core.adapters.base import ListedResource
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  A: 1\n", encoding="utf-8")
+
+    class _ListsWithTagsAdapter(_FakeTaggingAdapter):
+        lists_with_tags = True
+
+        @classmethod
+        def list_resources(cls, session):
+            yield ListedResource(arn=_FakeTaggingArn("arn:1"), tags={"A": "1"})
+
+    def _no_sweep(pool, resource_type):  # pragma: no cover
+        raise AssertionError("GetResources não deve ser chamado")
+
+    monkeypatch.setattr(scan_engine, "get_adapters_for_service", lambda service, service_type: _ListsWithTagsAdapter)
+    monkeypatch.setattr(scan_engine, "Session", lambda profile_name, region_name: _FakeSession())
+    monkeypatch.setattr(scan_engine, "get_tags_by_type", _no_sweep)
+
+    report = scan_engine.scan_resources(
+        service="s",
+        service_type="t",
+        template_path=str(tpl),
+        profile="p",
+        region="us-east-1",
+        use_tagging_api=True,
+    )
+
+    assert report.resources[0].status == "compliant"
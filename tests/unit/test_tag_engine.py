@@ -8,30 +8,85 @@ from core.models import TagSet, TagRunResult
 from core.engine import tag_engine
 
 
-class _RetryAdapter:
+class _SnapshotAdapter:
+    tagging_api_type = None
+
     def __init__(self, snapshots):
         self._it = iter(snapshots)
+        self.reads = 0
 
     def get_current_tags(self):
+        self.reads += 1
         try:
             return next(self._it)
         except StopIteration:
             return {}
 
 
-def test_read_tags_with_retry_stops_when_expected_keys_present(monkeypatch):
-    # avoid sleeping in tests
+def _written(arn, changed):
+    return TagRunResult(
+        arn=arn,
+        desired_tags=dict(changed),
+        existing_tags={},
+        final_tags=dict(changed),
+        pretty_name="Fake",
+    )
+
+
+def test_verify_results_polls_outstanding_on_shared_schedule(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(tag_engine.time, "sleep", sleeps.append)
+
+    fast = _SnapshotAdapter([{"A": "1"}])
+    slow = _SnapshotAdapter([{}, {"B": "2"}, {"B": "2", "C": "3"}])
+    fast_result = _written("arn:fast", {"A": "1"})
+    slow_result = _written("arn:slow", {"B": "2"})
+
+    tag_engine._verify_results(
+        [(fast, fast_result), (slow, slow_result)],
+        pool=None,
+        verify="full",
+    )
+
+    assert fast_result.applied_tags == {"A": "1"}
+    assert slow_result.applied_tags == {"B": "2"}
+    # recurso já verificado não é relido; a espera é única por rodada
+    assert (fast.reads, slow.reads) == (1, 2)
+    assert sleeps == [tag_engine.VERIFY_BACKOFF_SECONDS[0]]
+
+
+def test_verify_results_gives_up_after_schedule(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(tag_engine.time, "sleep", sleeps.append)
+
+    adapter = _SnapshotAdapter([{"X": "1"}] * 10)
+    result = _written("arn:never", {"A": "1"})
+
+    tag_engine._verify_results([(adapter, result)], pool=None, verify="full")
+
+    assert result.applied_tags == {"X": "1"}
+    assert adapter.reads == len(tag_engine.VERIFY_BACKOFF_SECONDS) + 1
+    assert sleeps == list(tag_engine.VERIFY_BACKOFF_SECONDS)
+
+
+def test_verify_results_sample_and_none_modes(monkeypatch):
     monkeypatch.setattr(tag_engine.time, "sleep", lambda _: None)
 
-    expected = TagSet.from_dict({"A": "1", "B": "2"})
-    adapter = _RetryAdapter([
-        {"A": "1"},
-        {"A": "1", "B": "2"},
-        {"A": "1", "B": "2", "C": "3"},
-    ])
+    pending = [
+        (_SnapshotAdapter([{"A": "1"}]), _written(f"arn:{i}", {"A": "1"}))
+        for i in range(100)
+    ]
 
-    out = tag_engine._read_tags_with_retry(adapter, expected, max_attempts=5, delay_seconds=0)
-    assert out == {"A": "1", "B": "2"}
+    tag_engine._verify_results(pending, pool=None, verify="sample")
+    verified = [r for _, r in pending if r.applied_tags is not None]
+    assert len(verified) == max(
+        tag_engine.VERIFY_SAMPLE_MIN, int(100 * tag_engine.VERIFY_SAMPLE_RATIO)
+    )
+
+    untouched = [(_SnapshotAdapter([{"A": "1"}]), _written("arn:x", {"A": "1"}))]
+    tag_engine._verify_results(untouched, pool=None, verify="none")
+    assert untouched[0][1].applied_tags is None
+    assert untouched[0][0].reads == 0
 
 
 class _FakeArn:
@@ -39,6 +94,8 @@ class _FakeArn:
         self.raw = raw
         self.service = "fake"
         self.resource = "x"
+        self.region = None
+        self.account_id = None
 
     @classmethod
     def parse(cls, s: str):
@@ -46,6 +103,8 @@ class _FakeArn:
 
 
 class _FakeAdapterImpl:
+    tagging_api_type = None
+
     def __init__(self, arn, session):
         self.arn = arn
         self.session = session
@@ -105,6 +164,26 @@ def test_tag_resources_sets_applied_tags_in_non_dry_run(monkeypatch, tmp_path):
     assert r.applied_tags["Owner"] == "team"
 
 
+def test_tag_resources_returns_plain_list_and_store_is_opt_in(monkeypatch, tmp_path):
+    from core.models import TagRunStore
+
+    monkeypatch.setattr(tag_engine, "Arn", _FakeArn)
+    monkeypatch.setattr(tag_engine, "get_adapter_for_arn", lambda arn: _FakeAdapterImpl)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+    kwargs = dict(template_path=str(tpl), overrides={}, dry_run=True)
+
+    results = tag_engine.tag_resources(arns=["arn:fake:1", "arn:fake:2"], **kwargs)
+
+    # list de verdade: os mesmos objetos a cada acesso, mutáveis
+    assert isinstance(results, list)
+    assert results[0] is results[0]
+
+    store = TagRunStore(results=tag_engine.iter_tag_resources(["arn:fake:1", "arn:fake:2"], **kwargs))
+    assert store == results
+
+
 def test_tag_resources_dry_run_does_not_set_applied_tags(monkeypatch, tmp_path):
     monkeypatch.setattr(tag_engine, "Arn", _FakeArn)
     monkeypatch.setattr(tag_engine, "get_adapter_for_arn", lambda arn: _FakeAdapterImpl)
@@ -143,3 +222,370 @@ def test_tag_resources_returns_results_for_multiple_arns(monkeypatch, tmp_path):
 
     assert len(results) == 2
     assert [r.arn for r in results] == ["arn:fake:1", "arn:fake:2"]
+
+
+def test_tag_resources_concurrent_preserves_input_order(monkeypatch, tmp_path):
+    monkeypatch.setattr(tag_engine, "Arn", _FakeArn)
+    monkeypatch.setattr(tag_engine, "get_adapter_for_arn", lambda arn: _FakeAdapterImpl)
+    monkeypatch.setattr(tag_engine.time, "sleep", lambda _: None)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    arns = [f"arn:fake:{i}" for i in range(20)]
+    kwargs = dict(
+        template_path=str(tpl),
+        overrides={},
+        profile=None,
+        region="us-east-1",
+        dry_run=False,
+        override=False,
+    )
+
+    serial = tag_engine.tag_resources(arns=arns, **kwargs)
+    parallel = tag_engine.tag_resources(arns=arns, concurrency=4, **kwargs)
+
+    assert [r.arn for r in parallel] == arns
+    assert parallel == serial
+
+
+def test_iter_tag_resources_consumes_arns_lazily_in_batches(monkeypatch, tmp_path):
+    monkeypatch.setattr(tag_engine, "Arn", _FakeArn)
+    monkeypatch.setattr(tag_engine, "get_adapter_for_arn", lambda arn: _FakeAdapterImpl)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    read = []
+
+    def _arns():
+        for i in range(5):
+            read.append(i)
+            yield f"arn:fake:{i}"
+
+    results = tag_engine.iter_tag_resources(
+        arns=_arns(),
+        template_path=str(tpl),
+        overrides={},
+        region="us-east-1",
+        dry_run=True,
+        batch_size=2,
+    )
+
+    first = next(results)
+    assert first.arn == "arn:fake:0"
+    # só o primeiro lote foi lido da fonte
+    assert read == [0, 1]
+
+    assert [r.arn for r in results] == [f"arn:fake:{i}" for i in range(1, 5)]
+    assert read == list(range(5))
+
+
+def test_tag_resources_rejects_invalid_concurrency(tmp_path):
+    with pytest.raises(ValueError):
+        tag_engine.tag_resources(
+            arns=[],
+            template_path=str(tmp_path / "t.yaml"),
+            overrides={},
+            concurrency=0,
+        )
+
+
+def test_tag_resources_skips_verification_for_unchanged(monkeypatch, tmp_path):
+    monkeypatch.setattr(tag_engine, "Arn", _FakeArn)
+    monkeypatch.setattr(tag_engine, "get_adapter_for_arn", lambda arn: _FakeAdapterImpl)
+
+    def _fail(*args, **kwargs):  # pragma: no cover
+        raise AssertionError("recurso sem delta não deve ser relido")
+
+    monkeypatch.setattr(tag_engine, "_read_current_tags", _fail)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Keep: 'yes'\n", encoding="utf-8")
+
+    results = tag_engine.tag_resources(
+        arns=["arn:fake"],
+        template_path=str(tpl),
+        overrides={},
+        dry_run=False,
+    )
+
+    assert results[0].status == "unchanged"
+    assert results[0].applied_tags == {"Keep": "yes"}
+
+
+class _FakeBulkAdapterImpl(_FakeAdapterImpl):
+    tagging_api_type = "fake:thing"
+
+    @classmethod
+    def tagging_api_arn(cls, arn):
+        return arn.raw
+
+
+def test_tag_resources_bulk_plans_then_writes_in_batch(monkeypatch, tmp_path):
+    monkeypatch.setattr(tag_engine, "Arn", _FakeArn)
+    monkeypatch.setattr(tag_engine, "get_adapter_for_arn", lambda arn: _FakeBulkAdapterImpl)
+    monkeypatch.setattr(tag_engine.time, "sleep", lambda _: None)
+
+    sent = []
+
+    def _fake_bulk(pool, planned):
+        planned = list(planned)
+        sent.extend(result.arn for _, result in planned)
+        return {"arn:fake:2": "AccessDenied: no"}
+
+    monkeypatch.setattr(tag_engine, "bulk_tag_resources", _fake_bulk)
+    # índice da Tagging API ainda sem os recursos: cai na leitura direta no fim
+    monkeypatch.setattr(tag_engine, "get_tags_for_arns", lambda pool, arns, region: {})
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    results = tag_engine.tag_resources(
+        arns=["arn:fake:1", "arn:fake:2"],
+        template_path=str(tpl),
+        overrides={},
+        dry_run=False,
+        bulk=True,
+    )
+
+    assert sent == ["arn:fake:1", "arn:fake:2"]
+    assert [r.arn for r in results] == ["arn:fake:1", "arn:fake:2"]
+    assert results[1].error == "AccessDenied: no"
+    assert results[1].applied_tags is None
+    assert [r.status for r in results] == ["updated", "failed"]
+    assert results[0].error is None
+    # o plano é dry-run: o fake nunca "escreveu", então a leitura não mostra Owner
+    assert results[0].applied_tags == {"Keep": "yes"}
+
+
+def test_interleave_groups_alternates_account_region_groups():
+    from core.arn import Arn
+
+    arns = [
+        Arn.parse("arn:aws:lambda:us-east-1:111:function:a"),
+        Arn.parse("arn:aws:lambda:us-east-1:111:function:b"),
+        Arn.parse("arn:aws:lambda:us-east-1:111:function:c"),
+        Arn.parse("arn:aws:lambda:sa-east-1:111:function:d"),
+        Arn.parse("arn:aws:iam::111:role/r"),
+    ]
+
+    assert tag_engine._interleave_groups(arns) == [0, 3, 4, 1, 2]
+
+
+class _FakeRegionalArn(_FakeArn):
+    @classmethod
+    def parse(cls, s: str):
+        arn = cls(s)
+        arn.region = s.rsplit(":", 1)[1] or None
+        return arn
+
+
+def test_tag_resources_routes_adapters_to_arn_region(monkeypatch, tmp_path):
+    monkeypatch.setattr(tag_engine, "Arn", _FakeRegionalArn)
+    monkeypatch.setattr(tag_engine, "get_adapter_for_arn", lambda arn: _FakeAdapterImpl)
+
+    seen = {}
+    original_init = _FakeAdapterImpl.__init__
+
+    def _init(self, arn, session):
+        seen[arn.raw] = session.region_name
+        original_init(self, arn, session)
+
+    monkeypatch.setattr(_FakeAdapterImpl, "__init__", _init)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    results = tag_engine.tag_resources(
+        arns=["arn:fake:us-east-1", "arn:fake:sa-east-1", "arn:fake:"],
+        template_path=str(tpl),
+        overrides={},
+        region="us-east-1",
+        dry_run=True,
+        concurrency=2,
+    )
+
+    assert [r.arn for r in results] == ["arn:fake:us-east-1", "arn:fake:sa-east-1", "arn:fake:"]
+    assert seen == {
+        "arn:fake:us-east-1": "us-east-1",
+        "arn:fake:sa-east-1": "sa-east-1",
+        # sem região (serviço global): região default
+        "arn:fake:": "us-east-1",
+    }
+
+
+def test_iter_tag_resources_invalidates_updated_inventory_entries(monkeypatch, tmp_path):
+    from core.inventory import Inventory
+
+    monkeypatch.setattr(tag_engine, "Arn", _FakeArn)
+    monkeypatch.setattr(tag_engine, "get_adapter_for_arn", lambda arn: _FakeAdapterImpl)
+    monkeypatch.setattr(tag_engine.time, "sleep", lambda _: None)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    with Inventory(tmp_path / "inv.sqlite3") as inv:
+        inv.record_tags("arn:fake", "Fake", {"Keep": "yes"}, now=100.0)
+        inv.record_tags("arn:other", "Fake", {"Keep": "yes"}, now=100.0)
+
+        results = list(tag_engine.iter_tag_resources(
+            arns=["arn:fake"],
+            template_path=str(tpl),
+            overrides={},
+            profile=None,
+            region="us-east-1",
+            dry_run=False,
+            override=True,
+            inventory=inv,
+        ))
+
+        assert results[0].status == "updated"
+        assert inv.get("arn:fake").last_fetched is None
+        assert inv.get("arn:other").last_fetched == 100.0
+
+
+class _FakeBatchAdapterImpl(_FakeAdapterImpl):
+    batch_api_size = 2
+    reads = []
+    writes = []
+
+    def __init__(self, arn, session):
+        super().__init__(arn, session)
+        # recursos pares já têm o Owner
+        if int(arn.raw.rsplit(":", 1)[1]) % 2 == 0:
+            self._tags = {"Keep": "yes", "Owner": "team"}
+
+    @classmethod
+    def read_tags_batch(cls, adapters):
+        cls.reads.append([a.arn.raw for a in adapters])
+        return {a.arn.raw: dict(a._tags) for a in adapters}
+
+    @classmethod
+    def write_tags_batch(cls, adapters, tags):
+        cls.writes.append(([a.arn.raw for a in adapters], dict(tags)))
+        for a in adapters:
+            a._tags.update(tags)
+
+    def prefetch_tags(self, tags):
+        self._tags = dict(tags)
+
+    def get_current_tags(self):
+        raise AssertionError("leitura individual não deve acontecer")
+
+    def apply_tags(self, tagset, dry_run=False, override=False):
+        assert dry_run, "escrita deve ir pelo caminho em lote"
+        return super().apply_tags(tagset, dry_run=True, override=override)
+
+
+def test_tag_resources_batches_reads_and_groups_writes_by_delta(monkeypatch, tmp_path):
+    monkeypatch.setattr(tag_engine, "Arn", _FakeArn)
+    monkeypatch.setattr(tag_engine, "get_adapter_for_arn", lambda arn: _FakeBatchAdapterImpl)
+    monkeypatch.setattr(tag_engine.time, "sleep", lambda _: None)
+    _FakeBatchAdapterImpl.reads = []
+    _FakeBatchAdapterImpl.writes = []
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    results = tag_engine.tag_resources(
+        arns=[f"arn:fake:{i}" for i in range(5)],
+        template_path=str(tpl),
+        overrides={},
+        dry_run=False,
+        override=True,
+    )
+
+    # lotes de batch_api_size na leitura inicial e na verificação
+    assert _FakeBatchAdapterImpl.reads[:3] == [
+        ["arn:fake:0", "arn:fake:1"],
+        ["arn:fake:2", "arn:fake:3"],
+        ["arn:fake:4"],
+    ]
+    assert _FakeBatchAdapterImpl.reads[3:] == [["arn:fake:1", "arn:fake:3"]]
+    # só os ímpares têm delta, todos iguais: uma escrita por lote
+    assert _FakeBatchAdapterImpl.writes == [(["arn:fake:1", "arn:fake:3"], {"Owner": "team"})]
+    assert [r.status for r in results] == ["unchanged", "updated", "unchanged", "updated", "unchanged"]
+    assert all(r.applied_tags["Owner"] == "team" for r in results)
+
+
+def test_bulk_routes_s3_bucket_outside_session_region(monkeypatch, tmp_path):
+    import core.adapters.s3_bucket as s3_module
+    from core.bucket_regions import BucketRegionResolver
+
+    resolver = BucketRegionResolver()
+    resolver.remember([("far-bucket", "sa-east-1")])
+    monkeypatch.setattr(s3_module, "bucket_regions", resolver)
+
+    sleeps = []
+    monkeypatch.setattr(tag_engine.time, "sleep", sleeps.append)
+
+    arn = "arn:aws:s3:::far-bucket"
+    written = {}
+    calls = []
+
+    class _S3:
+        class exceptions:
+            class NoSuchKey(Exception):
+                pass
+
+        def get_bucket_tagging(self, Bucket):
+            return {"TagSet": [{"Key": "Keep", "Value": "yes"}]}
+
+    class _Tagging:
+        def __init__(self, region):
+            self.region = region
+
+        def tag_resources(self, ResourceARNList, Tags):
+            calls.append(("tag_resources", self.region))
+            if self.region == "sa-east-1":
+                written.update(Tags)
+            return {"FailedResourcesMap": {}}
+
+        def get_resources(self, ResourceARNList):
+            calls.append(("get_resources", self.region))
+            if self.region != "sa-east-1":
+                return {"ResourceTagMappingList": []}
+            tags = [{"Key": "Keep", "Value": "yes"}] + [{"Key": k, "Value": v} for k, v in written.items()]
+            return {"ResourceTagMappingList": [{"ResourceARN": arn, "Tags": tags}]}
+
+    class _Session:
+        region_name = "us-east-1"
+        profile_name = None
+
+        def get_credentials(self):
+            return None
+
+        def client(self, service_name, region_name=None, config=None):
+            if service_name == "s3":
+                return _S3()
+            return _Tagging(region_name)
+
+    tpl = tmp_path / "t.yaml"
+    tpl.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    results = tag_engine.tag_resources(
+        arns=[arn],
+        template_path=str(tpl),
+        overrides={},
+        dry_run=False,
+        bulk=True,
+        session=_Session(),
+    )
+
+    # escrita e verificação na região do bucket, sem esperar pelo backoff
+    assert calls == [("tag_resources", "sa-east-1"), ("get_resources", "sa-east-1")]
+    assert sleeps == []
+    assert results[0].error is None
+    assert results[0].applied_tags == {"Keep": "yes", "Owner": "team"}
+
+
+def test_tag_resources_rejects_unknown_keywords_up_front(tmp_path):
+    # assinatura explícita: erro de digitação falha na chamada, não no engine
+    with pytest.raises(TypeError):
+        tag_engine.tag_resources(
+            arns=[],
+            template_path=str(tmp_path / "t.yaml"),
+            overrides={},
+            dryrun=True,
+        )
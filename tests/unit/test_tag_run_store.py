@@ -0,0 +1,87 @@
+import tracemalloc
+
+from core.arn import Arn
+from core.models import Tag, TagRunResult, TagRunStore, TagSet
+
+
+def _result(i, existing, final, applied=None, error=None, desired=None):
+    return TagRunResult(
+        arn=f"arn:aws:s3:::bucket-{i}",
+        desired_tags=desired or {"Owner": "team", "Env": "prd"},
+        existing_tags=existing,
+        final_tags=final,
+        pretty_name="S3 Bucket",
+        applied_tags=applied,
+        error=error,
+    )
+
+
+def test_store_round_trips_results():
+    results = [
+        # recurso sem tags
+        _result(0, {}, {"Owner": "team", "Env": "prd"}, applied={"Owner": "team", "Env": "prd"}),
+        # já conforme, com tag legada
+        _result(1, {"Owner": "team", "Env": "prd", "Keep": "yes"}, {"Owner": "team", "Env": "prd", "Keep": "yes"}),
+        # conflito preservado (override desligado) e verificação divergente
+        _result(2, {"Owner": "other"}, {"Owner": "other", "Env": "prd"}, applied={"Owner": "other"}),
+        # falha na escrita
+        _result(3, {}, {"Owner": "team", "Env": "prd"}, error="AccessDenied: no"),
+        # final que não segue o merge padrão
+        _result(4, {"Env": "dev"}, {"Env": "prd", "Owner": "team"}),
+        # outro desired (template dinâmico)
+        _result(5, {}, {"Owner": "x"}, desired={"Owner": "x"}),
+    ]
+
+    store = TagRunStore(override=False, results=results)
+
+    assert len(store) == len(results)
+    assert list(store) == results
+    assert store == results
+    assert store[-1] == results[-1]
+    assert store[1:3] == results[1:3]
+    assert len(store._desired) == 2
+
+
+def test_store_derives_final_with_override():
+    result = _result(0, {"Owner": "other", "Keep": "yes"}, {"Owner": "team", "Env": "prd", "Keep": "yes"})
+
+    store = TagRunStore(override=True, results=[result])
+
+    assert store[0] == result
+    assert store._final_overrides == {}
+
+
+def test_store_uses_less_memory_than_results_list():
+    def _results():
+        for i in range(5000):
+            yield _result(
+                i,
+                {"Owner": "team", "Env": "prd", "Keep": "yes"},
+                {"Owner": "team", "Env": "prd", "Keep": "yes"},
+                applied={"Owner": "team", "Env": "prd", "Keep": "yes"},
+            )
+
+    tracemalloc.start()
+    as_list = list(_results())
+    list_size = tracemalloc.get_traced_memory()[0]
+    del as_list
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    store = TagRunStore(results=_results())
+    store_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(store) == 5000
+    assert store_size < list_size / 2
+
+
+def test_models_are_slotted_and_interned():
+    key = "".join(["Own", "er"])
+    tag = Tag(key=key, value="team")
+
+    assert not hasattr(tag, "__dict__")
+    assert tag.key is Tag(key="Owner", value="x").key
+    assert not hasattr(TagSet.from_dict({"A": "1"}), "__dict__")
+    assert not hasattr(Arn.parse("arn:aws:s3:::b"), "__dict__")
+    assert not hasattr(_result(0, {}, {}), "__dict__")
@@ -0,0 +1,96 @@
+from core.arn import Arn
+from core.engine import tagging_api
+from core.models import TagRunResult
+
+
+class _FakeTaggingClient:
+    def __init__(self, failed=None):
+        self.calls = []
+        self._failed = failed or {}
+
+    def tag_resources(self, ResourceARNList, Tags):
+        self.calls.append((list(ResourceARNList), dict(Tags)))
+        return {
+            "FailedResourcesMap": {
+                arn: self._failed[arn] for arn in ResourceARNList if arn in self._failed
+            }
+        }
+
+
+class _FakePool:
+    region_name = "us-east-1"
+
+    def __init__(self, client):
+        self._client = client
+        self.regions = []
+
+    def client(self, service_name, region_name=None):
+        assert service_name == "resourcegroupstaggingapi"
+        self.regions.append(region_name)
+        return self._client
+
+
+class _Adapter:
+    tagging_api_type = "lambda:function"
+
+    def __init__(self, arn_str):
+        self.arn = Arn.parse(arn_str)
+
+    @classmethod
+    def tagging_api_arn(cls, arn):
+        return arn.raw
+
+
+def _planned(arn_str, existing, final):
+    result = TagRunResult(
+        arn=arn_str,
+        desired_tags=dict(final),
+        existing_tags=dict(existing),
+        final_tags=dict(final),
+        pretty_name="Fake",
+    )
+    return _Adapter(arn_str), result
+
+
+def test_bulk_tag_resources_groups_identical_deltas_in_chunks_of_20():
+    client = _FakeTaggingClient()
+    pool = _FakePool(client)
+
+    planned = [
+        _planned(f"arn:aws:lambda:us-east-1:1:function:f{i}", {}, {"Owner": "team"})
+        for i in range(45)
+    ]
+    planned.append(
+        _planned("arn:aws:lambda:us-east-1:1:function:other", {}, {"Owner": "other"})
+    )
+    # sem delta: não entra em nenhuma chamada
+    planned.append(
+        _planned("arn:aws:lambda:us-east-1:1:function:ok", {"Owner": "team"}, {"Owner": "team"})
+    )
+
+    errors = tagging_api.bulk_tag_resources(pool, planned)
+
+    assert errors == {}
+    sizes = sorted(len(arns) for arns, _ in client.calls)
+    assert sizes == [1, 5, 20, 20]
+    assert all(
+        tags == {"Owner": "team"} for arns, tags in client.calls if len(arns) > 1
+    )
+
+
+def test_bulk_tag_resources_maps_failed_resources_and_regions():
+    failing = "arn:aws:lambda:sa-east-1:1:function:b"
+    client = _FakeTaggingClient(
+        failed={failing: {"ErrorCode": "InvalidParameterException", "ErrorMessage": "nope"}}
+    )
+    pool = _FakePool(client)
+
+    planned = [
+        _planned("arn:aws:lambda:us-east-1:1:function:a", {}, {"Owner": "team"}),
+        _planned(failing, {}, {"Owner": "team"}),
+    ]
+
+    errors = tagging_api.bulk_tag_resources(pool, planned)
+
+    assert errors == {failing: "InvalidParameterException: nope"}
+    assert sorted(pool.regions) == ["sa-east-1", "us-east-1"]
@@ -1,8 +1,9 @@
+import os
 from pathlib import Path
 
 import pytest
 
-from core.template_engine import load_template, render_dynamic
+from core.template_engine import CompiledTemplate, compile_template, load_template, render_dynamic
 from core.merge import build_tagset
 
 
@@ -43,3 +44,54 @@ dynamic:
     tagset = build_tagset(str(p), {"env": "hml"})
     as_dict = tagset.to_dict()
     assert as_dict == {"Owner": "team", "Env": "hml"}
+
+
+def test_compile_template_is_cached_until_file_changes(tmp_path: Path):
+    p = tmp_path / "t.yaml"
+    p.write_text("defaults:\n  Owner: team\n", encoding="utf-8")
+
+    first = compile_template(p)
+    assert isinstance(first, CompiledTemplate)
+    assert compile_template(str(p)) is first
+
+    # mtime muda mas o conteúdo não: mantém o template compilado
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert compile_template(p) is first
+
+    p.write_text("defaults:\n  Owner: other-team\n", encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+    second = compile_template(p)
+    assert second is not first
+    assert second.render({}) == {"Owner": "other-team"}
+
+
+def test_build_tagset_accepts_compiled_template():
+    compiled = CompiledTemplate({"defaults": {"Owner": "team"}, "dynamic": {"Env": "{{ env }}"}})
+
+    assert build_tagset(compiled, {"env": "prd"}).to_dict() == {"Owner": "team", "Env": "prd"}
+    assert build_tagset(compiled, {"env": "dev"}).to_dict() == {"Owner": "team", "Env": "dev"}
+
+
+def test_render_tagset_memoizes_by_referenced_context():
+    compiled = CompiledTemplate({"defaults": {"Owner": "team"}, "dynamic": {"Env": "{{ env }}"}})
+
+    a = compiled.render_tagset({"env": "prd", "service_type": "storage"})
+    # variável não usada pelo template não muda o fingerprint
+    b = compiled.render_tagset({"env": "prd", "service_type": "compute"})
+    c = compiled.render_tagset({"env": "dev"})
+
+    assert a is b
+    assert c is not a
+    assert c.to_dict() == {"Owner": "team", "Env": "dev"}
+    assert isinstance(a.tags, tuple)
+
+
+def test_render_tagset_does_not_memoize_failures():
+    compiled = CompiledTemplate({"dynamic": {"Env": "{{ env }}"}})
+
+    with pytest.raises(Exception):
+        compiled.render_tagset({})
+
+    assert compiled.render_tagset({"env": "hml"}).to_dict() == {"Env": "hml"}